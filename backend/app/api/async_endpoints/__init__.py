@@ -0,0 +1,8 @@
+"""
+Async endpoint routers (DB_ASYNC=true).
+
+Each module mirrors its counterpart in `app.api.endpoints` (same paths, schemas
+and rules) but awaits an `AsyncSession`, so a request waiting on Postgres does
+not hold a threadpool worker. Response builders and validation helpers are
+shared with the sync modules.
+"""
@@ -0,0 +1,59 @@
+"""Daily summary endpoints (async)."""
+
+from __future__ import annotations
+
+from datetime import date
+
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import get_async_db
+from app.api.endpoints.daily_summaries import _summary_response
+from app.api.etag import conditional_response, row_etag
+from app.api.responses import trusted_json
+from app.db.repository import async_upsert_by_date
+from app.models import DailySummary
+from app.schemas import DailySummaryCreate, DailySummaryResponse
+
+router = APIRouter(prefix="/daily-summary", tags=["daily-summaries"])
+
+
+@router.get("/{log_date}", response_model=DailySummaryResponse | None)
+async def get_daily_summary(
+    log_date: date,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Get the daily summary for a specific date (returns null if none exists; ETag-aware)."""
+
+    summary = await db.scalar(select(DailySummary).where(DailySummary.date == log_date))
+
+    not_modified = conditional_response(request, response, row_etag(summary))
+    if not_modified:
+        return not_modified
+    return trusted_json(_summary_response(summary) if summary else None, response)
+
+
+@router.put("/{log_date}", response_model=DailySummaryResponse)
+async def upsert_daily_summary(
+    log_date: date,
+    payload: DailySummaryCreate,
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Create or update a daily summary for a specific date (upsert)."""
+
+    if log_date > date.today():
+        raise HTTPException(status_code=400, detail="Cannot write summary for future dates")
+
+    summary = await async_upsert_by_date(
+        db,
+        DailySummary,
+        log_date,
+        highlight=payload.highlight,
+        reflection=payload.reflection,
+    )
+    await db.commit()
+
+    return trusted_json(_summary_response(summary))
@@ -0,0 +1,66 @@
+"""Dashboard endpoints (async)."""
+
+from __future__ import annotations
+
+from datetime import date
+
+from fastapi import APIRouter, Depends, Query, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import get_async_db
+from app.core.cache import dashboard_cache
+from app.api.endpoints.dashboard import (
+    _DASHBOARD_STATS_SQL,
+    _dashboard_from_rows,
+    _validate_range,
+    _weekly_window,
+)
+from app.api.etag import conditional_response
+from app.api.responses import trusted_json
+from app.schemas import WeeklyDashboardResponse
+
+router = APIRouter(prefix="/dashboard", tags=["dashboard"])
+
+
+async def _cached_dashboard(db: AsyncSession, start: date, end: date) -> tuple[bytes, str]:
+    """Serve `(body, etag)` for `start..end` from the cache, computing it on a miss."""
+
+    entry, generation = dashboard_cache.get(start, end)
+    if entry is None:
+        result = await db.execute(_DASHBOARD_STATS_SQL, {"start": start, "end": end})
+        entry = _dashboard_from_rows(start, end, result.all())
+        dashboard_cache.put(start, end, entry, generation)
+    return entry
+
+
+@router.get("/weekly", response_model=WeeklyDashboardResponse)
+async def weekly_dashboard(
+    request: Request, response: Response, db: AsyncSession = Depends(get_async_db)
+):
+    """Weekly dashboard with insights (last 7 days, inclusive, ending today)."""
+
+    start, end = _weekly_window()
+    body, etag = await _cached_dashboard(db, start, end)
+    return conditional_response(request, response, etag) or trusted_json(body, response)
+
+
+@router.get("/range", response_model=WeeklyDashboardResponse)
+async def range_dashboard(
+    request: Request,
+    response: Response,
+    start: date = Query(...),
+    end: date = Query(...),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Dashboard for an arbitrary inclusive date range (vectorized metrics)."""
+
+    _validate_range(start, end)
+    body, etag = await _cached_dashboard(db, start, end)
+    return conditional_response(request, response, etag) or trusted_json(body, response)
+
+
+@router.get("/cache")
+async def dashboard_cache_stats():
+    """Dashboard cache counters for this worker (hits, misses, hit rate, evictions)."""
+
+    return dashboard_cache.stats()
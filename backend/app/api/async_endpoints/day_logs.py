@@ -0,0 +1,163 @@
+"""Day log endpoints (async)."""
+
+from __future__ import annotations
+
+from datetime import date
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import get_async_db
+from app.api.endpoints.day_logs import (
+    DEFAULT_RANGE_LIMIT,
+    MAX_RANGE_LIMIT,
+    _batch_upserted,
+    _day_log_response,
+    _grid_response,
+    _is_reconstructed,
+    _plan_batch,
+)
+from app.api.etag import conditional_response, row_etag
+from app.api.responses import trusted_json
+from app.db.repository import async_patch_day_log, async_upsert_day_logs
+from app.models import DayLog
+from app.schemas import (
+    DayLogBatchResponse,
+    DayLogBatchUpsert,
+    DayLogCreate,
+    DayLogPatch,
+    DayLogRangeResponse,
+    DayLogResponse,
+)
+
+router = APIRouter(prefix="/day-log", tags=["day-logs"])
+
+
+@router.get("", response_model=DayLogRangeResponse)
+async def list_day_logs(
+    start: date = Query(...),
+    end: date = Query(...),
+    limit: int = Query(default=DEFAULT_RANGE_LIMIT, ge=1, le=MAX_RANGE_LIMIT),
+    after: date | None = Query(default=None),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Get all day logs in a date range (inclusive), ordered by date."""
+
+    if start > end:
+        raise HTTPException(status_code=400, detail="start must be <= end")
+
+    stmt = select(DayLog).where(DayLog.date >= start, DayLog.date <= end)
+    if after is not None:
+        stmt = stmt.where(DayLog.date > after)
+
+    # Fetch one extra row to learn whether another page exists.
+    logs = list(await db.scalars(stmt.order_by(DayLog.date.asc()).limit(limit + 1)))
+
+    next_after = None
+    if len(logs) > limit:
+        logs = logs[:limit]
+        next_after = logs[-1].date
+
+    return trusted_json(
+        {"items": [_day_log_response(log) for log in logs], "next_after": next_after}
+    )
+
+
+@router.put("/batch", response_model=DayLogBatchResponse)
+async def upsert_day_logs_batch(
+    payload: DayLogBatchUpsert, db: AsyncSession = Depends(get_async_db)
+):
+    """Create or update many day logs in one request (batch upsert, e.g. backfills)."""
+
+    rows, results = _plan_batch(payload, date.today())
+
+    if rows:
+        for row in await async_upsert_day_logs(db, rows):
+            results[row.date] = _batch_upserted(row)
+        await db.commit()
+
+    return trusted_json({"results": [results[d] for d in sorted(results)]})
+
+
+@router.get("/grid", response_class=Response)
+async def get_year_grid(
+    request: Request,
+    year: int = Query(..., ge=1, le=9999),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Whole-year heatmap as a packed binary grid (4 bits per hour)."""
+
+    start, end = date(year, 1, 1), date(year, 12, 31)
+    stmt = select(DayLog.date, DayLog.hours).where(
+        DayLog.date >= start, DayLog.date <= end
+    )
+    rows = (await db.execute(stmt)).all()
+    return _grid_response(request, start, end, rows)
+
+
+@router.get("/{log_date}", response_model=DayLogResponse | None)
+async def get_day_log(
+    log_date: date,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Get the day log for a specific date (returns null if none exists; ETag-aware)."""
+
+    day_log = await db.scalar(select(DayLog).where(DayLog.date == log_date))
+
+    not_modified = conditional_response(request, response, row_etag(day_log))
+    if not_modified:
+        return not_modified
+
+    return trusted_json(_day_log_response(day_log) if day_log else None, response)
+
+
+@router.put("/{log_date}", response_model=DayLogResponse)
+async def upsert_day_log(
+    log_date: date,
+    payload: DayLogCreate,
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Create or update a day log for a specific date (upsert)."""
+
+    today = date.today()
+
+    # Future dates are not allowed (MVP assumes server/local timezone match)
+    if log_date > today:
+        raise HTTPException(status_code=400, detail="Cannot log future dates")
+
+    (day_log,) = await async_upsert_day_logs(
+        db,
+        [
+            {
+                "date": log_date,
+                "hours": payload.hours,
+                "is_reconstructed": _is_reconstructed(log_date, today),
+            }
+        ],
+    )
+    await db.commit()
+
+    return trusted_json(_day_log_response(day_log))
+
+
+@router.patch("/{log_date}", response_model=DayLogResponse)
+async def patch_day_log_hours(
+    log_date: date,
+    payload: DayLogPatch,
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Set individual hours and/or contiguous ranges of a day log (one statement)."""
+
+    today = date.today()
+    if log_date > today:
+        raise HTTPException(status_code=400, detail="Cannot log future dates")
+
+    day_log = await async_patch_day_log(
+        db, log_date, payload.edits(), _is_reconstructed(log_date, today)
+    )
+    await db.commit()
+
+    return trusted_json(_day_log_response(day_log))
@@ -0,0 +1,36 @@
+"""Day bundle endpoints (async)."""
+
+from __future__ import annotations
+
+from datetime import date
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import get_async_db
+from app.api.responses import trusted_json
+from app.api.endpoints.days import _DAY_BUNDLE_SQL, _bundle_response, _validate_range
+from app.schemas import DayBundleResponse
+
+router = APIRouter(prefix="/day", tags=["day"])
+
+
+@router.get("", response_model=list[DayBundleResponse])
+async def list_day_bundles(
+    start: date = Query(...),
+    end: date = Query(...),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Day bundles for every date in an inclusive range (at most 366 days)."""
+
+    _validate_range(start, end)
+    result = await db.execute(_DAY_BUNDLE_SQL, {"start": start, "end": end})
+    return trusted_json([_bundle_response(row) for row in result])
+
+
+@router.get("/{log_date}", response_model=DayBundleResponse)
+async def get_day_bundle(log_date: date, db: AsyncSession = Depends(get_async_db)):
+    """Day log, daily summary, dream and notable events of a date in one query."""
+
+    result = await db.execute(_DAY_BUNDLE_SQL, {"start": log_date, "end": log_date})
+    return trusted_json(_bundle_response(result.one()))
@@ -0,0 +1,63 @@
+"""Dream endpoints (async)."""
+
+from __future__ import annotations
+
+from datetime import date
+
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import get_async_db
+from app.api.endpoints.dreams import _dream_response, _dream_values, _reset_dream_stmt
+from app.api.etag import conditional_response, row_etag
+from app.api.responses import trusted_json
+from app.db.changes import record_change
+from app.db.repository import async_upsert_by_date
+from app.models import Dream
+from app.schemas import DreamResponse, DreamUpsert
+
+router = APIRouter(prefix="/dreams", tags=["dreams"])
+
+
+@router.get("/{log_date}", response_model=DreamResponse | None)
+async def get_dream(
+    log_date: date,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Get the dream entry for a specific date (returns null if none exists; ETag-aware)."""
+
+    dream = await db.scalar(select(Dream).where(Dream.date == log_date))
+
+    not_modified = conditional_response(request, response, row_etag(dream))
+    if not_modified:
+        return not_modified
+    return trusted_json(_dream_response(dream) if dream else None, response)
+
+
+@router.post("", response_model=DreamResponse)
+async def upsert_dream(payload: DreamUpsert, db: AsyncSession = Depends(get_async_db)):
+    """Create or update a dream entry for a specific date (upsert)."""
+
+    if payload.date > date.today():
+        raise HTTPException(status_code=400, detail="Cannot write dreams for future dates")
+
+    dream = await async_upsert_by_date(db, Dream, payload.date, **_dream_values(payload))
+    await db.commit()
+
+    return trusted_json(_dream_response(dream))
+
+
+@router.delete("/{log_date}")
+async def reset_dream(log_date: date, db: AsyncSession = Depends(get_async_db)):
+    """Reset a day's dream entry back to 'No Dream'."""
+
+    reset = (await db.execute(_reset_dream_stmt(log_date))).first()
+    if not reset:
+        return {"status": "no_record"}
+
+    record_change(db, Dream.__tablename__, log_date)
+    await db.commit()
+    return {"status": "reset"}
@@ -0,0 +1,86 @@
+"""Notable events endpoints (async)."""
+
+from __future__ import annotations
+
+from datetime import date
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import get_async_db
+from app.api.responses import trusted_json
+from app.api.endpoints.events import (
+    MAX_EVENTS_LIMIT,
+    _EVENT_ORDER,
+    _event_response,
+    _keyset_after,
+    _paginate,
+    _resolve_range,
+)
+from app.db.changes import record_change
+from app.models import NotableEvent
+from app.schemas import NotableEventCreate, NotableEventResponse
+
+router = APIRouter(tags=["events"])
+
+
+@router.get("/events", response_model=list[NotableEventResponse])
+async def list_events(
+    response: Response,
+    start_date: date | None = Query(default=None),
+    end_date: date | None = Query(default=None),
+    limit: int | None = Query(default=None, ge=1, le=MAX_EVENTS_LIMIT),
+    after: str | None = Query(default=None),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """List notable events (defaults to the last 30 days; keyset pages with `limit`)."""
+
+    start_date, end_date = _resolve_range(start_date, end_date)
+
+    stmt = select(NotableEvent).where(
+        NotableEvent.date >= start_date, NotableEvent.date <= end_date
+    )
+    if after is not None:
+        stmt = stmt.where(_keyset_after(after))
+    stmt = stmt.order_by(*_EVENT_ORDER)
+    if limit is not None:
+        # Fetch one extra row to learn whether another page exists.
+        stmt = stmt.limit(limit + 1)
+
+    events = _paginate(list(await db.scalars(stmt)), limit, response)
+    return trusted_json([_event_response(e) for e in events], response)
+
+
+@router.post("/events", response_model=NotableEventResponse)
+async def create_event(payload: NotableEventCreate, db: AsyncSession = Depends(get_async_db)):
+    """Create a notable event."""
+
+    if payload.date > date.today():
+        raise HTTPException(status_code=400, detail="Cannot create events for future dates")
+
+    ev = NotableEvent(
+        date=payload.date,
+        title=payload.title.strip(),
+        description=payload.description,
+        category=payload.category,
+    )
+    db.add(ev)
+    record_change(db, NotableEvent.__tablename__, ev.date)
+    await db.commit()
+    return trusted_json(_event_response(ev))
+
+
+@router.delete("/events/{event_id}")
+async def delete_event(event_id: UUID, db: AsyncSession = Depends(get_async_db)):
+    """Delete a notable event (optional feature)."""
+
+    ev = await db.get(NotableEvent, event_id)
+    if not ev:
+        raise HTTPException(status_code=404, detail="Event not found")
+
+    await db.delete(ev)
+    record_change(db, NotableEvent.__tablename__, ev.date)
+    await db.commit()
+    return {"status": "deleted"}
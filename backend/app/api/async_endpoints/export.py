@@ -0,0 +1,46 @@
+"""Full-data export endpoint (async)."""
+
+from __future__ import annotations
+
+from datetime import date
+from typing import AsyncIterator, Literal
+
+from fastapi import APIRouter, Query, Request
+
+from app.api.endpoints.export import _accepts_gzip, _export_response, _validate_range
+from app.db.export import ExportEncoder, export_statements
+from app.db.session import new_async_session
+
+router = APIRouter(tags=["export"])
+
+
+async def _stream_export(
+    fmt: str, compress: bool, start: date | None, end: date | None
+) -> AsyncIterator[bytes]:
+    encoder = ExportEncoder(fmt, compress)
+    yield encoder.header()
+
+    # Owns its session: the request-scoped one is closed before streaming starts.
+    async with new_async_session() as db:
+        for entity_type, columns, stmt in export_statements(start, end):
+            result = await db.stream(stmt)
+            async for rows in result.partitions():
+                chunk = encoder.encode(entity_type, columns, rows)
+                if chunk:
+                    yield chunk
+
+    yield encoder.finish()
+
+
+@router.get("/export")
+async def export_data(
+    request: Request,
+    format: Literal["ndjson", "csv"] = Query(default="ndjson"),
+    start: date | None = Query(default=None),
+    end: date | None = Query(default=None),
+):
+    """Stream every entity as NDJSON or CSV (server-side cursors, gzip on the fly)."""
+
+    _validate_range(start, end)
+    compress = _accepts_gzip(request)
+    return _export_response(_stream_export(format, compress, start, end), format, compress)
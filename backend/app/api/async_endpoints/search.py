@@ -0,0 +1,38 @@
+"""Full-text search endpoint (async)."""
+
+from __future__ import annotations
+
+from datetime import date
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import get_async_db
+from app.api.responses import trusted_json
+from app.api.endpoints.search import (
+    DEFAULT_SEARCH_LIMIT,
+    MAX_SEARCH_LIMIT,
+    _search_params,
+    _search_response,
+    _search_sql,
+)
+from app.schemas import SearchResponse
+from app.schemas.day_log import MAX_CATEGORY, MIN_CATEGORY
+
+router = APIRouter(tags=["search"])
+
+
+@router.get("/search", response_model=SearchResponse)
+async def search(
+    q: str = Query(..., min_length=1, max_length=200),
+    start: date | None = Query(default=None),
+    end: date | None = Query(default=None),
+    category: int | None = Query(default=None, ge=MIN_CATEGORY, le=MAX_CATEGORY),
+    limit: int = Query(default=DEFAULT_SEARCH_LIMIT, ge=1, le=MAX_SEARCH_LIMIT),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Full-text search across summaries, dreams and events (ranked, with snippets)."""
+
+    params = _search_params(q, start, end, category, limit)
+    result = await db.execute(_search_sql(start, end, category), params)
+    return trusted_json(_search_response(q, result))
@@ -0,0 +1,49 @@
+"""Delta sync endpoints (async)."""
+
+from __future__ import annotations
+
+from datetime import date
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import get_async_db
+from app.api.endpoints.sync import (
+    DEFAULT_SYNC_LIMIT,
+    MAX_SYNC_LIMIT,
+    _apply_ops,
+    _check_horizon,
+    _feed_page,
+)
+from app.api.responses import trusted_json
+from app.db.sync import async_change_feed, async_sync_horizon
+from app.schemas import SyncFeedResponse, SyncPush, SyncPushResponse
+
+router = APIRouter(prefix="/sync", tags=["sync"])
+
+
+@router.get("", response_model=SyncFeedResponse)
+async def get_changes(
+    since: int = Query(default=0, ge=0),
+    limit: int = Query(default=DEFAULT_SYNC_LIMIT, ge=1, le=MAX_SYNC_LIMIT),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Changes after the `since` token, oldest first (pass back `next`)."""
+
+    horizon, head = await async_sync_horizon(db)
+    _check_horizon(since, head)
+    horizon = max(horizon, since)
+
+    rows = await async_change_feed(db, since, horizon, limit + 1)
+    return trusted_json(_feed_page(rows, horizon, limit))
+
+
+@router.post("", response_model=SyncPushResponse)
+async def push_changes(payload: SyncPush, db: AsyncSession = Depends(get_async_db)):
+    """Replay offline writes in one transaction (per-op applied / conflict / rejected)."""
+
+    today = date.today()
+    # The op handlers are the sync endpoint's; run them on the underlying Session.
+    results = await db.run_sync(_apply_ops, payload.ops, today)
+    await db.commit()
+    return trusted_json({"results": results})
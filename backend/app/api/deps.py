@@ -1,7 +1,5 @@
 """Shared FastAPI dependencies."""
 
-from app.db.session import get_db
-
-__all__ = ["get_db"]
-
+from app.db.session import get_async_db, get_db
 
+__all__ = ["get_db", "get_async_db"]
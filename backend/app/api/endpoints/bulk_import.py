@@ -0,0 +1,106 @@
+"""Bulk import endpoint (COPY-based; psycopg2 engine in both DB modes)."""
+
+from __future__ import annotations
+
+import gzip
+import io
+import json
+import tempfile
+from typing import IO, AsyncIterator, Iterator, Literal
+
+import anyio.from_thread
+from fastapi import APIRouter, Query, Request
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
+
+from app.db.bulk_import import run_import
+from app.db.session import new_session
+
+router = APIRouter(tags=["import"])
+
+# The report is spooled to disk past this size while the import runs.
+SPOOL_MAX_MEMORY = 8 * 1024 * 1024
+
+REPORT_CHUNK_SIZE = 64 * 1024
+
+
+class _RequestBody(io.RawIOBase):
+    """
+    Blocking reader over the request body for a worker thread: each read
+    waits for the next chunk from the event loop, so records are parsed and
+    COPY-ed while the upload is still arriving.
+    """
+
+    def __init__(self, chunks: AsyncIterator[bytes]) -> None:
+        self._chunks = chunks
+        self._chunk = b""
+        self._offset = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while self._offset >= len(self._chunk):
+            try:
+                self._chunk = anyio.from_thread.run(self._chunks.__anext__)
+            except StopAsyncIteration:
+                return 0
+            self._offset = 0
+
+        size = min(len(buffer), len(self._chunk) - self._offset)
+        buffer[:size] = self._chunk[self._offset : self._offset + size]
+        self._offset += size
+        return size
+
+
+def _import_body(body: _RequestBody, fmt: str, compressed: bool) -> IO[bytes]:
+    """Run the import over the arriving body (worker thread); returns the NDJSON report."""
+
+    report = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_MEMORY)
+    raw: IO[bytes] = io.BufferedReader(body)
+    if compressed:
+        raw = gzip.GzipFile(fileobj=raw)
+    lines = io.TextIOWrapper(raw, encoding="utf-8", newline="")
+    try:
+        with new_session() as db:
+            for entry in run_import(db, lines, fmt):
+                report.write((json.dumps(entry, default=str) + "\n").encode())
+    except BaseException:
+        report.close()
+        raise
+    report.seek(0)
+    return report
+
+
+def _stream_report(report: IO[bytes]) -> Iterator[bytes]:
+    try:
+        while chunk := report.read(REPORT_CHUNK_SIZE):
+            yield chunk
+    finally:
+        report.close()
+
+
+@router.post("/import")
+async def import_data(
+    request: Request,
+    format: Literal["ndjson", "csv"] = Query(default="ndjson"),
+):
+    """
+    Bulk-import a `GET /export` file (NDJSON or CSV; `Content-Encoding: gzip` accepted).
+
+    - Records are validated with the same rules as the write endpoints
+      (hours via `DayLogBase.validate_hours`, no future dates)
+    - The body is parsed as it is received; valid rows are loaded with `COPY`
+      into staging tables batch by batch and merged with one upsert per type,
+      all in a single transaction
+    - The response (sent once the import has committed) is NDJSON: one
+      `{"line", "type", "error"}` entry per rejected record, then `{"summary": ...}`
+    """
+
+    compressed = request.headers.get("content-encoding", "").lower() == "gzip"
+    # The body must be fully read before the response starts: a streaming
+    # response also listens on the request channel for the disconnect.
+    report = await run_in_threadpool(
+        _import_body, _RequestBody(request.stream()), format, compressed
+    )
+    return StreamingResponse(_stream_report(report), media_type="application/x-ndjson")
@@ -22,7 +22,7 @@ CATEGORIES: dict[int, str] = {
 
 
 @router.get("/categories")
-def get_categories():
+async def get_categories():
     """
     Returns the category enum for reference.
     Frontend has this hardcoded, but useful for debugging/docs.
@@ -4,30 +4,45 @@ from __future__ import annotations
 
 from datetime import date
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_db
+from app.api.etag import conditional_response, row_etag
+from app.api.responses import trusted_json
+from app.db.repository import upsert_by_date
 from app.models import DailySummary
 from app.schemas import DailySummaryCreate, DailySummaryResponse
 
 router = APIRouter(prefix="/daily-summary", tags=["daily-summaries"])
 
 
+def _summary_response(summary) -> dict:
+    """DailySummaryResponse payload for a DailySummary ORM object or RETURNING row."""
+
+    return {
+        "highlight": summary.highlight,
+        "reflection": summary.reflection,
+        "id": str(summary.id),
+        "date": summary.date,
+    }
+
+
 @router.get("/{log_date}", response_model=DailySummaryResponse | None)
-def get_daily_summary(log_date: date, db: Session = Depends(get_db)):
-    """Get the daily summary for a specific date (returns null if none exists)."""
+def get_daily_summary(
+    log_date: date,
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_db),
+):
+    """Get the daily summary for a specific date (returns null if none exists; ETag-aware)."""
 
     summary = db.query(DailySummary).filter(DailySummary.date == log_date).first()
-    if not summary:
-        return None
-
-    return DailySummaryResponse(
-        id=str(summary.id),
-        date=summary.date,
-        highlight=summary.highlight,
-        reflection=summary.reflection,
-    )
+
+    not_modified = conditional_response(request, response, row_etag(summary))
+    if not_modified:
+        return not_modified
+    return trusted_json(_summary_response(summary) if summary else None, response)
 
 
 @router.put("/{log_date}", response_model=DailySummaryResponse)
@@ -48,33 +63,13 @@ def upsert_daily_summary(
     if log_date > today:
         raise HTTPException(status_code=400, detail="Cannot write summary for future dates")
 
-    existing = db.query(DailySummary).filter(DailySummary.date == log_date).first()
-
-    if existing:
-        existing.highlight = payload.highlight
-        existing.reflection = payload.reflection
-        db.commit()
-        db.refresh(existing)
-        return DailySummaryResponse(
-            id=str(existing.id),
-            date=existing.date,
-            highlight=existing.highlight,
-            reflection=existing.reflection,
-        )
-
-    new_summary = DailySummary(
-        date=log_date,
+    summary = upsert_by_date(
+        db,
+        DailySummary,
+        log_date,
         highlight=payload.highlight,
         reflection=payload.reflection,
     )
-    db.add(new_summary)
     db.commit()
-    db.refresh(new_summary)
-    return DailySummaryResponse(
-        id=str(new_summary.id),
-        date=new_summary.date,
-        highlight=new_summary.highlight,
-        reflection=new_summary.reflection,
-    )
-
 
+    return trusted_json(_summary_response(summary))
@@ -2,141 +2,190 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import date, timedelta
 
-from fastapi import APIRouter, Depends
+import numpy as np
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy import Date, bindparam, text
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_db
-from app.models import DayLog, Dream
+from app.api.etag import body_etag, conditional_response
+from app.api.responses import trusted_json
+from app.core.cache import dashboard_cache
+from app.core.grid import CATEGORY_COUNT
+from app.db.changes import on_commit
+from app.db.live import RESYNC, change_hub
 from app.schemas import WeeklyDashboardResponse
 
 router = APIRouter(prefix="/dashboard", tags=["dashboard"])
 
+# Longest span served by /dashboard/range (10 years, leap days included).
+MAX_RANGE_DAYS = 3660
 
-def _calculate_variance(counts: list[int]) -> float:
+# One round trip for the whole dashboard: the window's precomputed DayLogStats
+# rows (12 counts + unassigned per day, maintained on write) with the dream
+# counts riding along on every row via FILTER aggregates. `dream_counts` always
+# yields exactly one row, so the LEFT JOIN returns it even when the window has
+# no logs (s.* is then NULL).
+_DASHBOARD_STATS_SQL = text(
     """
-    Calculate variance of hour distribution across categories.
-    Used to determine the most balanced day.
+    WITH dream_counts AS (
+        SELECT
+            count(*) FILTER (WHERE dream_state = 2) AS remembered_count,
+            count(*) FILTER (WHERE dream_state = 1) AS unremembered_count
+        FROM dreams
+        WHERE date BETWEEN :start AND :end
+    )
+    SELECT
+        s.date,
+        s.counts,
+        s.unassigned,
+        dc.remembered_count,
+        dc.unremembered_count
+    FROM dream_counts AS dc
+    LEFT JOIN day_log_stats AS s ON s.date BETWEEN :start AND :end
     """
-    if not counts or sum(counts) == 0:
-        return 0.0
-    
-    mean = sum(counts) / len(counts)
-    variance = sum((x - mean) ** 2 for x in counts) / len(counts)
-    return variance
+).bindparams(bindparam("start", type_=Date), bindparam("end", type_=Date))
 
 
-@router.get("/weekly", response_model=WeeklyDashboardResponse)
-def weekly_dashboard(db: Session = Depends(get_db)):
-    """
-    Weekly dashboard with insights (V3).
+# Tables whose committed writes change dashboard output, and the matching
+# entity types of live change notifications.
+_DASHBOARD_TABLES = frozenset({"day_logs", "day_log_stats", "dreams"})
+_DASHBOARD_ENTITIES = frozenset({"day_log", "dream"})
 
-    - Last 7 days (inclusive, ending today)
-    - Stacked hours per category (derived from DayLog.hours)
-    - Average sleep hours (derived)
-    - Total tracked hours this week (derived)
-    - Category totals sorted by hours (descending)
-    - Insights: most frequent category, most balanced day
+
+@on_commit
+def _invalidate_dashboard_cache(changes) -> None:
+    """Evict exactly the cached ranges that contain a changed date."""
+
+    dates = {log_date for table, log_date in changes if table in _DASHBOARD_TABLES}
+    if dates:
+        dashboard_cache.invalidate_dates(dates)
+
+
+async def follow_live_changes() -> None:
+    """
+    Invalidate this worker's cache for writes committed by any worker, as they
+    arrive on the live change stream (runs until cancelled).
     """
 
-    CATEGORY_COUNT = 12  # 0..11
-    UNASSIGNED = -1
+    queue = change_hub.subscribe()
+    try:
+        while True:
+            message = await queue.get()
+            if message is RESYNC:
+                # Notifications may have been lost: nothing cached is trusted.
+                dashboard_cache.clear()
+                continue
+            dates = {
+                date.fromisoformat(change["date"])
+                for change in message["changes"]
+                if change["type"] in _DASHBOARD_ENTITIES
+            }
+            if dates:
+                dashboard_cache.invalidate_dates(dates)
+    except asyncio.CancelledError:
+        pass
+    finally:
+        change_hub.unsubscribe(queue)
+
+
+def _weekly_window() -> tuple[date, date]:
+    """Last 7 days (inclusive, ending today)."""
 
     end = date.today()
-    start = end - timedelta(days=6)
+    return end - timedelta(days=6), end
 
-    logs = db.query(DayLog).filter(DayLog.date >= start, DayLog.date <= end).all()
-    by_date = {l.date: l for l in logs}
 
-    dream_records = (
-        db.query(Dream).filter(Dream.date >= start, Dream.date <= end).all()
-    )
-    dream_days = 0
-    remembered_count = 0
-    unremembered_count = 0
-    for dream in dream_records:
-        if dream.dream_state == 2:
-            remembered_count += 1
-            dream_days += 1
-        elif dream.dream_state == 1:
-            unremembered_count += 1
-            dream_days += 1
-
-    total_tracked = 0
-    total_sleep = 0
-    logged_days = 0
-    days_out = []
-    
-    # V3: Track category totals across the week
-    category_totals = [0] * CATEGORY_COUNT
-    
-    # V3: Track most balanced day (lowest variance)
-    most_balanced_day = None
-    lowest_variance = float('inf')
-
-    for i in range(7):
-        d = start + timedelta(days=i)
-        log = by_date.get(d)
-
-        counts = [0] * CATEGORY_COUNT
-        unassigned = 0
-        tracked = 0
-        has_log = False
-
-        if log:
-            has_log = True
-            logged_days += 1
-            for v in list(log.hours):
-                if v == UNASSIGNED or v is None:
-                    unassigned += 1
-                elif 0 <= v < CATEGORY_COUNT:
-                    counts[v] += 1
-                    tracked += 1
-                else:
-                    # Unknown category codes are treated as unassigned for honesty.
-                    unassigned += 1
-
-            total_tracked += tracked
-            total_sleep += counts[0]
-            
-            # V3: Accumulate category totals
-            for cat_id, hours in enumerate(counts):
-                category_totals[cat_id] += hours
-            
-            # V3: Calculate variance for balanced day insight
-            # Only consider days with tracked hours (exclude unassigned)
-            if tracked > 0:
-                variance = _calculate_variance(counts)
-                if variance < lowest_variance:
-                    lowest_variance = variance
-                    most_balanced_day = d
-
-        days_out.append(
-            {
-                "date": d,
-                "has_log": has_log,
-                "counts": counts,
-                "tracked_hours": tracked,
-                "unassigned_hours": unassigned,
-            }
+def _stats_arrays(start: date, num_days: int, rows):
+    """
+    Turn `_DASHBOARD_STATS_SQL` rows into dense per-day arrays.
+
+    Returns `(counts, unassigned, has_log, remembered_count, unremembered_count)`,
+    with row 0 of every array being `start`.
+    """
+
+    counts = np.zeros((num_days, CATEGORY_COUNT), dtype=np.int64)
+    unassigned = np.zeros(num_days, dtype=np.int64)
+    has_log = np.zeros(num_days, dtype=bool)
+
+    remembered_count = rows[0].remembered_count
+    unremembered_count = rows[0].unremembered_count
+
+    logged = [row for row in rows if row.date is not None]
+    if logged:
+        offsets = np.fromiter(
+            ((row.date - start).days for row in logged), dtype=np.intp, count=len(logged)
         )
+        counts[offsets] = np.array([row.counts for row in logged], dtype=np.int64)
+        unassigned[offsets] = [row.unassigned for row in logged]
+        has_log[offsets] = True
+
+    return counts, unassigned, has_log, remembered_count, unremembered_count
 
+
+def _build_dashboard(
+    start: date,
+    end: date,
+    counts: np.ndarray,
+    unassigned: np.ndarray,
+    has_log: np.ndarray,
+    remembered_count: int,
+    unremembered_count: int,
+) -> dict:
+    """
+    Derive the dashboard payload from per-day category counts (vectorized).
+
+    `counts` is `days x 12`, `unassigned` and `has_log` are per-day vectors,
+    all aligned so that row 0 is `start`.
+    """
+
+    tracked = counts.sum(axis=1)
+    logged_days = int(has_log.sum())
+    total_tracked = int(tracked[has_log].sum())
+    total_sleep = int(counts[has_log, 0].sum())
     avg_sleep = (total_sleep / logged_days) if logged_days > 0 else 0.0
-    
-    # V3: Build category totals list, sorted descending by hours
+
+    # Most balanced day = lowest variance of the hour distribution across
+    # categories. Only days with tracked hours are considered (exclude unassigned).
+    # Variance is ranked via the exact integer n^2 * var = n * sum(x^2) - sum(x)^2,
+    # so equal distributions tie exactly and the earliest day wins.
+    most_balanced_day = None
+    candidates = has_log & (tracked > 0)
+    if candidates.any():
+        scaled_variance = CATEGORY_COUNT * (counts * counts).sum(axis=1) - tracked * tracked
+        scaled_variance = np.where(candidates, scaled_variance, np.iinfo(np.int64).max)
+        most_balanced_day = start + timedelta(days=int(np.argmin(scaled_variance)))
+
+    # Category totals sorted descending by hours (stable: ties keep category order)
+    category_totals = counts[has_log].sum(axis=0).tolist()
     category_totals_list = [
-        {"category_id": i, "hours": h} 
+        {"category_id": i, "hours": h}
         for i, h in enumerate(category_totals) if h > 0
     ]
     category_totals_list.sort(key=lambda x: x["hours"], reverse=True)
-    
-    # V3: Find most frequent category (excluding sleep if you want variety)
-    # Actually, let's include all categories for honesty
+
+    # Most frequent category includes sleep, for honesty
     most_frequent_category = None
     if category_totals_list:
         most_frequent_category = category_totals_list[0]["category_id"]
 
+    days_out = [
+        {
+            "date": start + timedelta(days=i),
+            "has_log": day_has_log,
+            "counts": day_counts,
+            "tracked_hours": day_tracked,
+            "unassigned_hours": day_unassigned,
+        }
+        for i, (day_has_log, day_counts, day_tracked, day_unassigned) in enumerate(
+            zip(has_log.tolist(), counts.tolist(), tracked.tolist(), unassigned.tolist())
+        )
+    ]
+
     return {
         "start_date": start,
         "end_date": end,
@@ -151,10 +200,90 @@ def weekly_dashboard(db: Session = Depends(get_db)):
             "most_balanced_day": most_balanced_day,
         },
         "dreams": {
-            "dream_days": dream_days,
+            "dream_days": remembered_count + unremembered_count,
             "remembered_count": remembered_count,
             "unremembered_count": unremembered_count,
         },
     }
 
 
+def _dashboard_from_rows(start: date, end: date, rows) -> tuple[bytes, str]:
+    """
+    Encoded dashboard body for `start..end` from `_DASHBOARD_STATS_SQL` rows,
+    together with its ETag. Both are cached, so a hit is served without
+    validating or serializing the payload again.
+    """
+
+    num_days = (end - start).days + 1
+    payload = _build_dashboard(start, end, *_stats_arrays(start, num_days, rows))
+    body = orjson.dumps(payload)
+    return body, body_etag(body)
+
+
+def _validate_range(start: date, end: date) -> None:
+    """Reject inverted ranges and ranges longer than MAX_RANGE_DAYS."""
+
+    if start > end:
+        raise HTTPException(status_code=400, detail="start must be <= end")
+    if (end - start).days + 1 > MAX_RANGE_DAYS:
+        raise HTTPException(
+            status_code=400, detail=f"Range must be at most {MAX_RANGE_DAYS} days"
+        )
+
+
+def _cached_dashboard(db: Session, start: date, end: date) -> tuple[bytes, str]:
+    """Serve `(body, etag)` for `start..end` from the cache, computing it on a miss."""
+
+    entry, generation = dashboard_cache.get(start, end)
+    if entry is None:
+        rows = db.execute(_DASHBOARD_STATS_SQL, {"start": start, "end": end}).all()
+        entry = _dashboard_from_rows(start, end, rows)
+        dashboard_cache.put(start, end, entry, generation)
+    return entry
+
+
+@router.get("/weekly", response_model=WeeklyDashboardResponse)
+def weekly_dashboard(request: Request, response: Response, db: Session = Depends(get_db)):
+    """
+    Weekly dashboard with insights (V3).
+
+    - Last 7 days (inclusive, ending today)
+    - Stacked hours per category (DayLogStats rollups of DayLog.hours)
+    - Average sleep hours (derived)
+    - Total tracked hours this week (derived)
+    - Category totals sorted by hours (descending)
+    - Insights: most frequent category, most balanced day
+    - Conditional GETs: the ETag is a hash of the (cached) encoded body
+    """
+
+    start, end = _weekly_window()
+    body, etag = _cached_dashboard(db, start, end)
+    return conditional_response(request, response, etag) or trusted_json(body, response)
+
+
+@router.get("/range", response_model=WeeklyDashboardResponse)
+def range_dashboard(
+    request: Request,
+    response: Response,
+    start: date = Query(...),
+    end: date = Query(...),
+    db: Session = Depends(get_db),
+):
+    """
+    Dashboard for an arbitrary inclusive date range (month, quarter, year, custom).
+
+    Same metrics as `/dashboard/weekly`. The range's precomputed DayLogStats
+    rows are loaded into a dense days x 12 NumPy matrix and every metric is
+    computed with vectorized operations, so multi-year ranges stay fast.
+    """
+
+    _validate_range(start, end)
+    body, etag = _cached_dashboard(db, start, end)
+    return conditional_response(request, response, etag) or trusted_json(body, response)
+
+
+@router.get("/cache")
+def dashboard_cache_stats():
+    """Dashboard cache counters for this worker (hits, misses, hit rate, evictions)."""
+
+    return dashboard_cache.stats()
@@ -4,36 +4,192 @@ from __future__ import annotations
 
 from datetime import date, timedelta
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_db
+from app.api.etag import body_etag, conditional_response, row_etag
+from app.api.responses import trusted_json
+from app.core.grid import dense_hours_matrix, pack_hours_grid
+from app.db.repository import patch_day_log, upsert_day_logs
 from app.models import DayLog
-from app.schemas import DayLogCreate, DayLogResponse
+from app.schemas import (
+    DayLogBatchResponse,
+    DayLogBatchUpsert,
+    DayLogCreate,
+    DayLogPatch,
+    DayLogRangeResponse,
+    DayLogResponse,
+)
 
 router = APIRouter(prefix="/day-log", tags=["day-logs"])
 
+# A full (leap) year fits in one page; longer spans continue via `after`.
+DEFAULT_RANGE_LIMIT = 366
+MAX_RANGE_LIMIT = 1000
+GRID_MEDIA_TYPE = "application/octet-stream"
+
+
+def _day_log_response(log) -> dict:
+    """DayLogResponse payload for a DayLog ORM object or RETURNING row."""
+
+    return {
+        "id": str(log.id),
+        "date": log.date,
+        "hours": log.hours,
+        "is_reconstructed": log.is_reconstructed,
+    }
+
+
+def _is_reconstructed(log_date: date, today: date) -> bool:
+    """Live window = today + yesterday. Anything older is reconstructed."""
+
+    return log_date < (today - timedelta(days=1))
+
+
+def _plan_batch(payload: DayLogBatchUpsert, today: date) -> tuple[list[dict], dict[date, dict]]:
+    """Split a batch into rows to upsert and per-date rejections (future dates)."""
+
+    rows: list[dict] = []
+    rejected: dict[date, dict] = {}
+    for log_date, log in payload.logs.items():
+        if log_date > today:
+            rejected[log_date] = {
+                "date": log_date,
+                "status": "rejected",
+                "detail": "Cannot log future dates",
+                "log": None,
+            }
+            continue
+
+        rows.append(
+            {
+                "date": log_date,
+                "hours": log.hours,
+                "is_reconstructed": _is_reconstructed(log_date, today),
+            }
+        )
+
+    return rows, rejected
+
+
+def _grid_response(request: Request, start: date, end: date, rows) -> Response:
+    """Packed grid body for `start..end` from `(date, hours)` rows, with a content ETag."""
+
+    num_days = (end - start).days + 1
+    body = pack_hours_grid(start, *dense_hours_matrix(start, num_days, rows))
+    response = Response(content=body, media_type=GRID_MEDIA_TYPE)
+    return conditional_response(request, response, body_etag(body)) or response
+
+
+def _batch_upserted(row) -> dict:
+    """DayLogBatchResult payload for a row written by the upsert."""
+
+    return {"date": row.date, "status": "upserted", "detail": None, "log": _day_log_response(row)}
+
+
+@router.get("", response_model=DayLogRangeResponse)
+def list_day_logs(
+    start: date = Query(...),
+    end: date = Query(...),
+    limit: int = Query(default=DEFAULT_RANGE_LIMIT, ge=1, le=MAX_RANGE_LIMIT),
+    after: date | None = Query(default=None),
+    db: Session = Depends(get_db),
+):
+    """
+    Get all day logs in a date range (inclusive), ordered by date.
+
+    - Only dates that have a log are returned (missing days are implicit)
+    - At most `limit` logs per page; pass `next_after` back as `after`
+      to continue (keyset pagination on the unique `date` index)
+    """
+
+    if start > end:
+        raise HTTPException(status_code=400, detail="start must be <= end")
+
+    query = db.query(DayLog).filter(DayLog.date >= start, DayLog.date <= end)
+    if after is not None:
+        query = query.filter(DayLog.date > after)
+
+    # Fetch one extra row to learn whether another page exists.
+    logs = query.order_by(DayLog.date.asc()).limit(limit + 1).all()
+
+    next_after = None
+    if len(logs) > limit:
+        logs = logs[:limit]
+        next_after = logs[-1].date
+
+    return trusted_json(
+        {"items": [_day_log_response(log) for log in logs], "next_after": next_after}
+    )
+
+
+@router.put("/batch", response_model=DayLogBatchResponse)
+def upsert_day_logs_batch(payload: DayLogBatchUpsert, db: Session = Depends(get_db)):
+    """
+    Create or update many day logs in one request (batch upsert, e.g. backfills).
+
+    - All payloads are validated up front (same rules as `PUT /day-log/{date}`)
+    - Future dates are rejected individually; the rest are still written
+    - Accepted dates are written with a single multi-row
+      `INSERT ... ON CONFLICT (date) DO UPDATE ... RETURNING`
+    """
+
+    rows, results = _plan_batch(payload, date.today())
+
+    if rows:
+        for row in upsert_day_logs(db, rows):
+            results[row.date] = _batch_upserted(row)
+        db.commit()
+
+    return trusted_json({"results": [results[d] for d in sorted(results)]})
+
+
+@router.get("/grid", response_class=Response)
+def get_year_grid(
+    request: Request,
+    year: int = Query(..., ge=1, le=9999),
+    db: Session = Depends(get_db),
+):
+    """
+    Whole-year heatmap as a packed binary grid (4 bits per hour, ~4.4 KB/year).
+
+    Days without a log are encoded as GRID_MISSING, unassigned hours as
+    GRID_UNASSIGNED; see `app/core/grid.py` for the format and
+    `unpack_hours_grid` for a reference decoder.
+    """
+
+    start, end = date(year, 1, 1), date(year, 12, 31)
+    rows = (
+        db.query(DayLog.date, DayLog.hours)
+        .filter(DayLog.date >= start, DayLog.date <= end)
+        .all()
+    )
+    return _grid_response(request, start, end, rows)
+
 
 @router.get("/{log_date}", response_model=DayLogResponse | None)
-def get_day_log(log_date: date, db: Session = Depends(get_db)):
+def get_day_log(
+    log_date: date,
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_db),
+):
     """
     Get the day log for a specific date.
 
     Returns null if no log exists for that date.
     Frontend should treat null as "no data yet" and show empty/default state.
+    Supports conditional GETs: the ETag tracks the row's `updated_at`.
     """
 
     day_log = db.query(DayLog).filter(DayLog.date == log_date).first()
 
-    if not day_log:
-        return None
+    not_modified = conditional_response(request, response, row_etag(day_log))
+    if not_modified:
+        return not_modified
 
-    return DayLogResponse(
-        id=str(day_log.id),
-        date=day_log.date,
-        hours=list(day_log.hours),
-        is_reconstructed=day_log.is_reconstructed,
-    )
+    return trusted_json(_day_log_response(day_log) if day_log else None, response)
 
 
 @router.put("/{log_date}", response_model=DayLogResponse)
@@ -56,35 +212,43 @@ def upsert_day_log(
     if log_date > today:
         raise HTTPException(status_code=400, detail="Cannot log future dates")
 
-    # Live window = today + yesterday. Anything older is reconstructed.
-    is_reconstructed = log_date < (today - timedelta(days=1))
+    # Single atomic INSERT ... ON CONFLICT (plus its stats rollup, same transaction):
+    # safe under concurrent autosaves.
+    (day_log,) = upsert_day_logs(
+        db,
+        [
+            {
+                "date": log_date,
+                "hours": payload.hours,
+                # Keep reconstruction flag in sync with date status
+                "is_reconstructed": _is_reconstructed(log_date, today),
+            }
+        ],
+    )
+    db.commit()
 
-    existing = db.query(DayLog).filter(DayLog.date == log_date).first()
+    return trusted_json(_day_log_response(day_log))
 
-    if existing:
-        # Update existing log
-        existing.hours = payload.hours
-        # Keep reconstruction flag in sync with date status
-        existing.is_reconstructed = is_reconstructed
-        db.commit()
-        db.refresh(existing)
-        return DayLogResponse(
-            id=str(existing.id),
-            date=existing.date,
-            hours=list(existing.hours),
-            is_reconstructed=existing.is_reconstructed,
-        )
 
-    # Create new log
-    new_log = DayLog(date=log_date, hours=payload.hours, is_reconstructed=is_reconstructed)
-    db.add(new_log)
-    db.commit()
-    db.refresh(new_log)
-    return DayLogResponse(
-        id=str(new_log.id),
-        date=new_log.date,
-        hours=list(new_log.hours),
-        is_reconstructed=new_log.is_reconstructed,
-    )
+@router.patch("/{log_date}", response_model=DayLogResponse)
+def patch_day_log_hours(
+    log_date: date,
+    payload: DayLogPatch,
+    db: Session = Depends(get_db),
+):
+    """
+    Set individual hours (`{"hours": {"9": 1}}`) and/or contiguous ranges
+    (`{"ranges": [{"start": 9, "end": 12, "category": 1}]}`) of a day log.
+
+    One statement, no read first: existing logs get only the edited array
+    elements assigned, a missing log is created all-unassigned with the edits.
+    """
+
+    today = date.today()
+    if log_date > today:
+        raise HTTPException(status_code=400, detail="Cannot log future dates")
 
+    day_log = patch_day_log(db, log_date, payload.edits(), _is_reconstructed(log_date, today))
+    db.commit()
 
+    return trusted_json(_day_log_response(day_log))
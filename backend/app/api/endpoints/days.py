@@ -0,0 +1,123 @@
+"""Day bundle endpoints (log, summary, dream and events of a date at once)."""
+
+from __future__ import annotations
+
+from datetime import date
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import Date, bindparam, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Session
+
+from app.api.deps import get_db
+from app.api.responses import trusted_json
+from app.schemas import DayBundleResponse
+
+router = APIRouter(prefix="/day", tags=["day"])
+
+# Longest span served by the range variant (one year, leap day included).
+MAX_BUNDLE_DAYS = 366
+
+# One statement for every entity of every day in `start..end`: each date from
+# generate_series picks up its log / summary / dream as a JSON object (NULL when
+# absent) and its events as a JSON array (newest first, like GET /events). Each
+# correlated subquery is a single probe of the table's unique/indexed `date`.
+_DAY_BUNDLE_SQL = (
+    text(
+        """
+        SELECT
+            d.date,
+            (
+                SELECT jsonb_build_object(
+                    'id', l.id, 'date', l.date, 'hours', lifegrid_hours(l.hours),
+                    'is_reconstructed', l.is_reconstructed
+                )
+                FROM day_logs AS l WHERE l.date = d.date
+            ) AS day_log,
+            (
+                SELECT jsonb_build_object(
+                    'id', s.id, 'date', s.date, 'highlight', s.highlight,
+                    'reflection', s.reflection
+                )
+                FROM daily_summaries AS s WHERE s.date = d.date
+            ) AS summary,
+            (
+                SELECT jsonb_build_object(
+                    'id', r.id, 'date', r.date, 'dream_state', r.dream_state,
+                    'description', r.description
+                )
+                FROM dreams AS r WHERE r.date = d.date
+            ) AS dream,
+            (
+                SELECT coalesce(
+                    jsonb_agg(
+                        jsonb_build_object(
+                            'id', e.id, 'date', e.date, 'title', e.title,
+                            'description', e.description, 'category', e.category
+                        )
+                        ORDER BY e.created_at DESC, e.id DESC
+                    ),
+                    '[]'::jsonb
+                )
+                FROM notable_events AS e WHERE e.date = d.date
+            ) AS events
+        FROM (
+            SELECT g.day::date AS date
+            FROM generate_series(:start, :end, interval '1 day') AS g(day)
+        ) AS d
+        ORDER BY d.date
+        """
+    )
+    .bindparams(bindparam("start", type_=Date), bindparam("end", type_=Date))
+    .columns(date=Date, day_log=JSONB, summary=JSONB, dream=JSONB, events=JSONB)
+)
+
+
+def _bundle_response(row) -> dict:
+    """DayBundleResponse payload for one `_DAY_BUNDLE_SQL` row (entities are already JSON)."""
+
+    return {
+        "date": row.date,
+        "day_log": row.day_log,
+        "summary": row.summary,
+        "dream": row.dream,
+        "events": row.events,
+    }
+
+
+def _validate_range(start: date, end: date) -> None:
+    """Reject inverted ranges and ranges longer than MAX_BUNDLE_DAYS."""
+
+    if start > end:
+        raise HTTPException(status_code=400, detail="start must be <= end")
+    if (end - start).days + 1 > MAX_BUNDLE_DAYS:
+        raise HTTPException(
+            status_code=400, detail=f"Range must be at most {MAX_BUNDLE_DAYS} days"
+        )
+
+
+@router.get("", response_model=list[DayBundleResponse])
+def list_day_bundles(
+    start: date = Query(...),
+    end: date = Query(...),
+    db: Session = Depends(get_db),
+):
+    """
+    Day bundles for every date in an inclusive range (at most 366 days), ordered
+    by date. Dates without any data are included with null entities.
+    """
+
+    _validate_range(start, end)
+    rows = db.execute(_DAY_BUNDLE_SQL, {"start": start, "end": end})
+    return trusted_json([_bundle_response(row) for row in rows])
+
+
+@router.get("/{log_date}", response_model=DayBundleResponse)
+def get_day_bundle(log_date: date, db: Session = Depends(get_db)):
+    """
+    Everything stored for a date in one round trip: day log, daily summary,
+    dream and notable events (one query instead of four requests).
+    """
+
+    row = db.execute(_DAY_BUNDLE_SQL, {"start": log_date, "end": log_date}).one()
+    return trusted_json(_bundle_response(row))
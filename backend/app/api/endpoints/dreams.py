@@ -4,30 +4,65 @@ from __future__ import annotations
 
 from datetime import date
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from sqlalchemy import update
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_db
+from app.api.etag import conditional_response, row_etag
+from app.api.responses import trusted_json
+from app.db.changes import record_change
+from app.db.repository import upsert_by_date
 from app.models import Dream
 from app.schemas import DreamResponse, DreamState, DreamUpsert
 
 router = APIRouter(prefix="/dreams", tags=["dreams"])
 
 
+def _dream_response(dream) -> dict:
+    """DreamResponse payload for a Dream ORM object or RETURNING row."""
+
+    return {
+        "dream_state": dream.dream_state,
+        "description": dream.description,
+        "id": str(dream.id),
+        "date": dream.date,
+    }
+
+
+def _dream_values(payload: DreamUpsert) -> dict:
+    """Column values to upsert (description is only kept for actual dreams)."""
+
+    description = None if payload.dream_state == DreamState.NONE else payload.description
+    return {"dream_state": int(payload.dream_state), "description": description}
+
+
+def _reset_dream_stmt(log_date: date):
+    """UPDATE ... RETURNING that resets a day's dream (no row -> no result)."""
+
+    return (
+        update(Dream)
+        .where(Dream.date == log_date)
+        .values(dream_state=int(DreamState.NONE), description=None)
+        .returning(Dream.id)
+    )
+
+
 @router.get("/{log_date}", response_model=DreamResponse | None)
-def get_dream(log_date: date, db: Session = Depends(get_db)):
-    """Get the dream entry for a specific date (returns null if none exists)."""
+def get_dream(
+    log_date: date,
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_db),
+):
+    """Get the dream entry for a specific date (returns null if none exists; ETag-aware)."""
 
     dream = db.query(Dream).filter(Dream.date == log_date).first()
-    if not dream:
-        return None
-
-    return DreamResponse(
-        id=str(dream.id),
-        date=dream.date,
-        dream_state=dream.dream_state,
-        description=dream.description,
-    )
+
+    not_modified = conditional_response(request, response, row_etag(dream))
+    if not_modified:
+        return not_modified
+    return trusted_json(_dream_response(dream) if dream else None, response)
 
 
 @router.post("", response_model=DreamResponse)
@@ -44,48 +79,20 @@ def upsert_dream(payload: DreamUpsert, db: Session = Depends(get_db)):
     if payload.date > today:
         raise HTTPException(status_code=400, detail="Cannot write dreams for future dates")
 
-    existing = db.query(Dream).filter(Dream.date == payload.date).first()
-    dream_state_value = int(payload.dream_state)
-    description = None if payload.dream_state == DreamState.NONE else payload.description
-
-    if existing:
-        existing.dream_state = dream_state_value
-        existing.description = description
-        db.commit()
-        db.refresh(existing)
-        return DreamResponse(
-            id=str(existing.id),
-            date=existing.date,
-            dream_state=existing.dream_state,
-            description=existing.description,
-        )
-
-    new_dream = Dream(
-        date=payload.date,
-        dream_state=dream_state_value,
-        description=description,
-    )
-    db.add(new_dream)
+    dream = upsert_by_date(db, Dream, payload.date, **_dream_values(payload))
     db.commit()
-    db.refresh(new_dream)
-    return DreamResponse(
-        id=str(new_dream.id),
-        date=new_dream.date,
-        dream_state=new_dream.dream_state,
-        description=new_dream.description,
-    )
+
+    return trusted_json(_dream_response(dream))
 
 
 @router.delete("/{log_date}")
 def reset_dream(log_date: date, db: Session = Depends(get_db)):
     """Reset a day's dream entry back to 'No Dream'."""
 
-    existing = db.query(Dream).filter(Dream.date == log_date).first()
-    if not existing:
+    reset = db.execute(_reset_dream_stmt(log_date)).first()
+    if not reset:
         return {"status": "no_record"}
 
-    existing.dream_state = int(DreamState.NONE)
-    existing.description = None
+    record_change(db, Dream.__tablename__, log_date)
     db.commit()
     return {"status": "reset"}
-
@@ -2,56 +2,127 @@
 
 from __future__ import annotations
 
-from datetime import date, timedelta
+import base64
+import binascii
+from datetime import date, datetime, timedelta
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy import tuple_
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_db
+from app.api.responses import trusted_json
+from app.db.changes import record_change
 from app.models import NotableEvent
 from app.schemas import NotableEventCreate, NotableEventResponse
 
 router = APIRouter(tags=["events"])
 
+MAX_EVENTS_LIMIT = 500
+# Response header carrying the cursor of the next page (absent on the last page).
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+# Listing order; `id` breaks ties between events created in the same instant.
+_EVENT_ORDER = (
+    NotableEvent.date.desc(),
+    NotableEvent.created_at.desc(),
+    NotableEvent.id.desc(),
+)
+_EVENT_KEY = tuple_(NotableEvent.date, NotableEvent.created_at, NotableEvent.id)
+
+
+def _event_response(e) -> dict:
+    """NotableEventResponse payload for a NotableEvent ORM object."""
+
+    return {
+        "title": e.title,
+        "description": e.description,
+        "category": e.category,
+        "id": str(e.id),
+        "date": e.date,
+    }
+
+
+def _resolve_range(start_date: date | None, end_date: date | None) -> tuple[date, date]:
+    """Apply the default window (last 30 days, inclusive) and validate the range."""
+
+    if end_date is None:
+        end_date = date.today()
+    if start_date is None:
+        start_date = end_date - timedelta(days=29)
+
+    if start_date > end_date:
+        raise HTTPException(status_code=400, detail="start_date must be <= end_date")
+
+    return start_date, end_date
+
+
+def _encode_cursor(e) -> str:
+    """Opaque keyset cursor for the position right after event `e`."""
+
+    key = f"{e.date.isoformat()}|{e.created_at.isoformat()}|{e.id}"
+    return base64.urlsafe_b64encode(key.encode()).decode().rstrip("=")
+
+
+def _keyset_after(cursor: str):
+    """Filter selecting the events that sort after `cursor` in listing order."""
+
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw_date, raw_created_at, raw_id = base64.urlsafe_b64decode(padded).decode().split("|")
+        key = (
+            date.fromisoformat(raw_date),
+            datetime.fromisoformat(raw_created_at),
+            UUID(raw_id),
+        )
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    return _EVENT_KEY < tuple_(*key)
+
+
+def _paginate(events: list, limit: int | None, response: Response) -> list:
+    """Trim the extra look-ahead row and advertise the next cursor, if any."""
+
+    if limit is not None and len(events) > limit:
+        events = events[:limit]
+        response.headers[NEXT_CURSOR_HEADER] = _encode_cursor(events[-1])
+    return events
+
 
 @router.get("/events", response_model=list[NotableEventResponse])
 def list_events(
+    response: Response,
     start_date: date | None = Query(default=None),
     end_date: date | None = Query(default=None),
+    limit: int | None = Query(default=None, ge=1, le=MAX_EVENTS_LIMIT),
+    after: str | None = Query(default=None),
     db: Session = Depends(get_db),
 ):
     """
     List notable events, optionally filtered by date range.
 
     If no range is provided, returns the last 30 days (inclusive).
+    Newest first (date, created_at, id descending). With `limit`, returns one
+    page; the `X-Next-Cursor` response header holds the `after` value of the
+    next page (keyset pagination on the composite index).
     """
 
-    if end_date is None:
-        end_date = date.today()
-    if start_date is None:
-        start_date = end_date - timedelta(days=29)
+    start_date, end_date = _resolve_range(start_date, end_date)
 
-    if start_date > end_date:
-        raise HTTPException(status_code=400, detail="start_date must be <= end_date")
-
-    events = (
-        db.query(NotableEvent)
-        .filter(NotableEvent.date >= start_date, NotableEvent.date <= end_date)
-        .order_by(NotableEvent.date.desc(), NotableEvent.created_at.desc())
-        .all()
+    query = db.query(NotableEvent).filter(
+        NotableEvent.date >= start_date, NotableEvent.date <= end_date
     )
+    if after is not None:
+        query = query.filter(_keyset_after(after))
+    query = query.order_by(*_EVENT_ORDER)
+    if limit is not None:
+        # Fetch one extra row to learn whether another page exists.
+        query = query.limit(limit + 1)
 
-    return [
-        NotableEventResponse(
-            id=str(e.id),
-            date=e.date,
-            title=e.title,
-            description=e.description,
-            category=e.category,
-        )
-        for e in events
-    ]
+    events = _paginate(query.all(), limit, response)
+    return trusted_json([_event_response(e) for e in events], response)
 
 
 @router.post("/events", response_model=NotableEventResponse)
@@ -69,15 +140,10 @@ def create_event(payload: NotableEventCreate, db: Session = Depends(get_db)):
         category=payload.category,
     )
     db.add(ev)
+    record_change(db, NotableEvent.__tablename__, ev.date)
     db.commit()
     db.refresh(ev)
-    return NotableEventResponse(
-        id=str(ev.id),
-        date=ev.date,
-        title=ev.title,
-        description=ev.description,
-        category=ev.category,
-    )
+    return trusted_json(_event_response(ev))
 
 
 @router.delete("/events/{event_id}")
@@ -89,6 +155,7 @@ def delete_event(event_id: UUID, db: Session = Depends(get_db)):
         raise HTTPException(status_code=404, detail="Event not found")
 
     db.delete(ev)
+    record_change(db, NotableEvent.__tablename__, ev.date)
     db.commit()
     return {"status": "deleted"}
 
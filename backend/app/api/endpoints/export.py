@@ -0,0 +1,92 @@
+"""Full-data export endpoint."""
+
+from __future__ import annotations
+
+from datetime import date
+from typing import Iterator, Literal
+
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+
+from app.db.export import EXPORT_MEDIA_TYPES, ExportEncoder, export_statements
+from app.db.session import new_session
+
+router = APIRouter(tags=["export"])
+
+
+def _validate_range(start: date | None, end: date | None) -> None:
+    if start is not None and end is not None and start > end:
+        raise HTTPException(status_code=400, detail="start must be <= end")
+
+
+def _accepts_gzip(request: Request) -> bool:
+    """Whether Accept-Encoding allows gzip: listed (or matched by `*`) with q > 0."""
+
+    weights: dict[str, float] = {}
+    for entry in request.headers.get("accept-encoding", "").lower().split(","):
+        coding, _, params = entry.partition(";")
+        coding = coding.strip()
+        if not coding:
+            continue
+        weight = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip() == "q":
+                try:
+                    weight = float(value)
+                except ValueError:
+                    weight = 0.0
+        weights[coding] = weight
+
+    for coding in ("gzip", "x-gzip", "*"):
+        if coding in weights:
+            return weights[coding] > 0
+    return False
+
+
+def _export_response(body, fmt: str, compress: bool) -> StreamingResponse:
+    headers = {
+        "Content-Disposition": f'attachment; filename="lifegrid-export.{fmt}"',
+        "Vary": "Accept-Encoding",
+    }
+    if compress:
+        headers["Content-Encoding"] = "gzip"
+    return StreamingResponse(body, media_type=EXPORT_MEDIA_TYPES[fmt], headers=headers)
+
+
+def _stream_export(
+    fmt: str, compress: bool, start: date | None, end: date | None
+) -> Iterator[bytes]:
+    encoder = ExportEncoder(fmt, compress)
+    yield encoder.header()
+
+    # The request-scoped session is closed before a streamed body is sent, so
+    # the export owns its session (and server-side cursors) for its lifetime.
+    with new_session() as db:
+        for entity_type, columns, stmt in export_statements(start, end):
+            for rows in db.execute(stmt).partitions():
+                chunk = encoder.encode(entity_type, columns, rows)
+                if chunk:
+                    yield chunk
+
+    yield encoder.finish()
+
+
+@router.get("/export")
+def export_data(
+    request: Request,
+    format: Literal["ndjson", "csv"] = Query(default="ndjson"),
+    start: date | None = Query(default=None),
+    end: date | None = Query(default=None),
+):
+    """
+    Stream every day log, daily summary, dream and notable event as NDJSON or CSV.
+
+    - Optional inclusive `start` / `end` date filters
+    - Rows are read through server-side cursors in batches (constant memory)
+    - Gzip-compressed on the fly when the client sends `Accept-Encoding: gzip`
+    """
+
+    _validate_range(start, end)
+    compress = _accepts_gzip(request)
+    return _export_response(_stream_export(format, compress, start, end), format, compress)
@@ -1,14 +1,29 @@
 """Healthcheck endpoints."""
 
+import os
+
 from fastapi import APIRouter
 
+from app.core.config import DB_POOL_MODE
+from app.db.session import pool_stats
+
 router = APIRouter(tags=["health"])
 
 
 @router.get("/")
-def root():
+async def root():
     """Health check endpoint."""
 
     return {"status": "ok", "app": "LifeGrid"}
 
 
+@router.get("/health/pool")
+async def pool_health():
+    """
+    Live connection pool usage of this worker process.
+
+    `capacity` (pool size + max overflow) times engines times workers is the
+    most connections the deployment can open; keep it under `max_connections`.
+    """
+
+    return {"mode": DB_POOL_MODE, "pid": os.getpid(), "engines": pool_stats()}
@@ -0,0 +1,59 @@
+"""Live change stream (server-sent events)."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import AsyncIterator
+
+import orjson
+from fastapi import APIRouter
+from fastapi.responses import StreamingResponse
+
+from app.core.config import LIVE_KEEPALIVE_SECONDS, LIVE_RECONNECT_SECONDS
+from app.db.live import RESYNC, change_hub
+
+router = APIRouter(tags=["live"])
+
+SSE_MEDIA_TYPE = "text/event-stream"
+
+
+def _sse(event: str, data: dict) -> bytes:
+    return b"event: " + event.encode() + b"\ndata: " + orjson.dumps(data) + b"\n\n"
+
+
+async def _stream() -> AsyncIterator[bytes]:
+    queue = change_hub.subscribe()
+    try:
+        # EventSource reconnect delay after a dropped connection.
+        yield f"retry: {int(LIVE_RECONNECT_SECONDS * 1000)}\n\n".encode()
+        while True:
+            try:
+                message = await asyncio.wait_for(queue.get(), LIVE_KEEPALIVE_SECONDS)
+            except asyncio.TimeoutError:
+                # Comment line: keeps proxies from closing an idle stream.
+                yield b": keepalive\n\n"
+                continue
+            if message is RESYNC:
+                yield _sse("resync", {})
+            else:
+                yield _sse("change", message)
+    finally:
+        change_hub.unsubscribe(queue)
+
+
+@router.get("/live")
+async def live_changes():
+    """
+    Server-sent event stream of committed changes, from every worker.
+
+    `event: change` carries `{"changes": [{"type": "day_log", "date": "2026-01-04"}, ...]}`
+    (types: day_log, daily_summary, dream, notable_event); refetch just those.
+    `event: resync` means notifications may have been missed: refetch everything
+    shown (or catch up with `GET /sync`).
+    """
+
+    return StreamingResponse(
+        _stream(),
+        media_type=SSE_MEDIA_TYPE,
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -0,0 +1,24 @@
+"""Prometheus metrics endpoint."""
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from app.core.metrics import DB_POOL_CONNECTIONS, render_metrics
+from app.db.session import pool_stats
+
+router = APIRouter(tags=["metrics"])
+
+# Prometheus text exposition format.
+METRICS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """Request, latency, in-flight, SQL time and connection pool metrics of this worker."""
+
+    for label, status in pool_stats().items():
+        for state, value in status.items():
+            if state != "pool":
+                DB_POOL_CONNECTIONS.set(label, state, value=value)
+
+    return PlainTextResponse(render_metrics(), media_type=METRICS_CONTENT_TYPE)
@@ -0,0 +1,144 @@
+"""Full-text search endpoint."""
+
+from __future__ import annotations
+
+from datetime import date
+from typing import Any
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import TextClause, text
+from sqlalchemy.orm import Session
+
+from app.api.deps import get_db
+from app.api.responses import trusted_json
+from app.core.search import SEARCH_CONFIG
+from app.schemas import SearchResponse
+from app.schemas.day_log import MAX_CATEGORY, MIN_CATEGORY
+
+router = APIRouter(tags=["search"])
+
+DEFAULT_SEARCH_LIMIT = 20
+MAX_SEARCH_LIMIT = 100
+
+# (type, table, title column, searched text) per searchable entity.
+_SEARCH_SOURCES = (
+    (
+        "daily_summary",
+        "daily_summaries",
+        "NULL::text",
+        "concat_ws(' ', t.highlight, t.reflection)",
+    ),
+    ("dream", "dreams", "NULL::text", "t.description"),
+    (
+        "notable_event",
+        "notable_events",
+        "t.title",
+        "concat_ws(' ', t.title, t.description)",
+    ),
+)
+
+_HEADLINE_OPTIONS = 'MaxFragments=2, MaxWords=20, MinWords=8, FragmentDelimiter=" … "'
+
+
+def _search_sql(start: date | None, end: date | None, category: int | None) -> TextClause:
+    """
+    Ranked search over every source in one statement.
+
+    Each branch is a GIN lookup on its generated `search_vector`; ranking and
+    LIMIT happen before `ts_headline`, so snippets are only built for the rows
+    returned. Category filters events on their tag and summaries / dreams on
+    days that have at least one hour logged in that category.
+    """
+
+    branches = []
+    for entity_type, table, title, body in _SEARCH_SOURCES:
+        conditions = ["t.search_vector @@ q.query"]
+        if start is not None:
+            conditions.append("t.date >= :start")
+        if end is not None:
+            conditions.append("t.date <= :end")
+        if category is not None:
+            if entity_type == "notable_event":
+                conditions.append("t.category = :category")
+            else:
+                conditions.append(
+                    "EXISTS (SELECT 1 FROM day_log_stats AS st"
+                    " WHERE st.date = t.date AND st.counts[:category + 1] > 0)"
+                )
+        branches.append(
+            f"SELECT '{entity_type}' AS type, t.id, t.date, {title} AS title, "
+            f"{body} AS body, ts_rank(t.search_vector, q.query) AS rank "
+            f"FROM {table} AS t, q WHERE {' AND '.join(conditions)}"
+        )
+
+    return text(
+        f"""
+        WITH q AS (SELECT websearch_to_tsquery('{SEARCH_CONFIG}', :q) AS query),
+        hits AS (
+            {" UNION ALL ".join(branches)}
+            ORDER BY rank DESC, date DESC
+            LIMIT :limit
+        )
+        SELECT
+            hits.type,
+            hits.id,
+            hits.date,
+            hits.title,
+            ts_headline('{SEARCH_CONFIG}', hits.body, q.query, '{_HEADLINE_OPTIONS}') AS snippet,
+            hits.rank
+        FROM hits, q
+        ORDER BY hits.rank DESC, hits.date DESC
+        """
+    )
+
+
+def _search_params(
+    q: str, start: date | None, end: date | None, category: int | None, limit: int
+) -> dict[str, Any]:
+    if start is not None and end is not None and start > end:
+        raise HTTPException(status_code=400, detail="start must be <= end")
+    params = {"q": q, "start": start, "end": end, "category": category, "limit": limit}
+    # Only the filters present in the statement are bound.
+    return {key: value for key, value in params.items() if value is not None}
+
+
+def _search_response(q: str, rows) -> dict:
+    """SearchResponse payload for the ranked hit rows."""
+
+    return {
+        "query": q,
+        "results": [
+            {
+                "type": row.type,
+                "id": str(row.id),
+                "date": row.date,
+                "title": row.title,
+                "snippet": row.snippet,
+                "rank": row.rank,
+            }
+            for row in rows
+        ],
+    }
+
+
+@router.get("/search", response_model=SearchResponse)
+def search(
+    q: str = Query(..., min_length=1, max_length=200),
+    start: date | None = Query(default=None),
+    end: date | None = Query(default=None),
+    category: int | None = Query(default=None, ge=MIN_CATEGORY, le=MAX_CATEGORY),
+    limit: int = Query(default=DEFAULT_SEARCH_LIMIT, ge=1, le=MAX_SEARCH_LIMIT),
+    db: Session = Depends(get_db),
+):
+    """
+    Full-text search across daily summaries (highlight, reflection), dream
+    descriptions and notable events (title, description).
+
+    - `q` uses web search syntax: `"exact phrase"`, `or`, `-excluded`
+    - Optional inclusive `start` / `end` dates and `category` filter
+    - Results are ranked (titles / highlights weigh more) with snippets
+    """
+
+    params = _search_params(q, start, end, category, limit)
+    rows = db.execute(_search_sql(start, end, category), params)
+    return trusted_json(_search_response(q, rows))
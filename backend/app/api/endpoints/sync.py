@@ -0,0 +1,220 @@
+"""Delta sync endpoints (change feed + offline write replay)."""
+
+from __future__ import annotations
+
+from datetime import date
+from typing import Any, Callable
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import delete
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.api.deps import get_db
+from app.api.endpoints.day_logs import _is_reconstructed
+from app.api.endpoints.dreams import _dream_values
+from app.api.responses import trusted_json
+from app.db.changes import record_change
+from app.db.repository import patch_day_log, upsert_by_date, upsert_day_logs
+from app.db.sync import change_feed, last_change_seq, lock_sync_row, sync_horizon
+from app.models import DailySummary, Dream, NotableEvent
+from app.schemas import SyncFeedResponse, SyncPush, SyncPushResponse
+
+router = APIRouter(prefix="/sync", tags=["sync"])
+
+DEFAULT_SYNC_LIMIT = 500
+MAX_SYNC_LIMIT = 5000
+
+
+def _check_horizon(since: int, head: int) -> None:
+    if since > head:
+        # e.g. the database was restored from a backup older than the client.
+        raise HTTPException(
+            status_code=410, detail="Sync token is ahead of the server; resync from 0"
+        )
+
+
+def _feed_page(rows: list, horizon: int, limit: int) -> dict:
+    """SyncFeedResponse payload from up to `limit + 1` feed rows."""
+
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    return {
+        "changes": [
+            {"seq": row.seq, "type": row.type, "deleted": row.deleted, "data": row.data}
+            for row in rows
+        ],
+        "next": rows[-1].seq if has_more else horizon,
+        "has_more": has_more,
+    }
+
+
+def _conflict(db: Session, entity: str, key: str, value: Any, base_seq: int | None, merge: bool):
+    """
+    Lock the target row and return a conflict result if it moved past `base_seq`.
+
+    With `merge`, a missing `base_seq` means "apply on top of any version".
+    """
+
+    row = lock_sync_row(db, entity, key, value)
+    current_seq = row.change_seq if row else None
+    if current_seq == base_seq or (merge and base_seq is None):
+        return None
+    return {
+        "status": "conflict",
+        "detail": "Row changed on the server",
+        "seq": current_seq,
+        "current": row.data if row else None,
+    }
+
+
+def _rejected(detail: str) -> dict:
+    return {"status": "rejected", "detail": detail}
+
+
+def _applied(seq: int | None, detail: str | None = None) -> dict:
+    return {"status": "applied", "detail": detail, "seq": seq}
+
+
+def _put_day_log(db: Session, op, today: date) -> dict:
+    if op.date > today:
+        return _rejected("Cannot log future dates")
+    conflict = _conflict(db, "day_log", "date", op.date, op.base_seq, merge=False)
+    if conflict:
+        return conflict
+    (row,) = upsert_day_logs(
+        db,
+        [
+            {
+                "date": op.date,
+                "hours": op.hours,
+                "is_reconstructed": _is_reconstructed(op.date, today),
+            }
+        ],
+    )
+    return _applied(row.change_seq)
+
+
+def _patch_day_log(db: Session, op, today: date) -> dict:
+    if op.date > today:
+        return _rejected("Cannot log future dates")
+    conflict = _conflict(db, "day_log", "date", op.date, op.base_seq, merge=True)
+    if conflict:
+        return conflict
+    row = patch_day_log(db, op.date, op.edits(), _is_reconstructed(op.date, today))
+    return _applied(row.change_seq)
+
+
+def _put_daily_summary(db: Session, op, today: date) -> dict:
+    if op.date > today:
+        return _rejected("Cannot write summary for future dates")
+    conflict = _conflict(db, "daily_summary", "date", op.date, op.base_seq, merge=False)
+    if conflict:
+        return conflict
+    row = upsert_by_date(
+        db, DailySummary, op.date, highlight=op.highlight, reflection=op.reflection
+    )
+    return _applied(row.change_seq)
+
+
+def _put_dream(db: Session, op, today: date) -> dict:
+    if op.date > today:
+        return _rejected("Cannot write dreams for future dates")
+    conflict = _conflict(db, "dream", "date", op.date, op.base_seq, merge=False)
+    if conflict:
+        return conflict
+    row = upsert_by_date(db, Dream, op.date, **_dream_values(op))
+    return _applied(row.change_seq)
+
+
+def _create_event(db: Session, op, today: date) -> dict:
+    if op.date > today:
+        return _rejected("Cannot create events for future dates")
+    stmt = (
+        insert(NotableEvent)
+        .values(
+            id=op.id,
+            date=op.date,
+            title=op.title.strip(),
+            description=op.description,
+            category=op.category,
+        )
+        .on_conflict_do_nothing(index_elements=[NotableEvent.id])
+        .returning(NotableEvent.change_seq)
+    )
+    seq = db.execute(stmt).scalar_one_or_none()
+    if seq is None:
+        # Replayed op: the event was created by an earlier push.
+        existing = lock_sync_row(db, "notable_event", "id", op.id)
+        return _applied(existing.change_seq, "Event already exists")
+    record_change(db, NotableEvent.__tablename__, op.date)
+    return _applied(seq)
+
+
+def _delete_event(db: Session, op, today: date) -> dict:
+    deleted = db.execute(
+        delete(NotableEvent).where(NotableEvent.id == op.id).returning(NotableEvent.date)
+    ).first()
+    if not deleted:
+        return _applied(None, "Event already deleted")
+    record_change(db, NotableEvent.__tablename__, deleted.date)
+    # The tombstone trigger drew the deletion's sequence number.
+    return _applied(last_change_seq(db))
+
+
+_HANDLERS: dict[str, Callable[[Session, Any, date], dict]] = {
+    "put_day_log": _put_day_log,
+    "patch_day_log": _patch_day_log,
+    "put_daily_summary": _put_daily_summary,
+    "put_dream": _put_dream,
+    "create_event": _create_event,
+    "delete_event": _delete_event,
+}
+
+
+def _apply_ops(db: Session, ops: list, today: date) -> list[dict]:
+    """Apply sync ops in order (caller commits); returns SyncOpResult payloads."""
+
+    results = []
+    for index, op in enumerate(ops):
+        result = {"index": index, "status": None, "detail": None, "seq": None, "current": None}
+        result.update(_HANDLERS[op.op](db, op, today))
+        results.append(result)
+    return results
+
+
+@router.get("", response_model=SyncFeedResponse)
+def get_changes(
+    since: int = Query(default=0, ge=0),
+    limit: int = Query(default=DEFAULT_SYNC_LIMIT, ge=1, le=MAX_SYNC_LIMIT),
+    db: Session = Depends(get_db),
+):
+    """
+    Changes after the `since` token, oldest first.
+
+    Start with `since=0` for a full sync and pass back `next` afterwards. Only
+    changes of finished transactions are returned, so a token never skips a
+    write that commits later. Deleted rows appear as tombstones.
+    """
+
+    horizon, head = sync_horizon(db)
+    _check_horizon(since, head)
+    # A token from a worker whose horizon is further ahead is returned as is.
+    horizon = max(horizon, since)
+
+    rows = change_feed(db, since, horizon, limit + 1)
+    return trusted_json(_feed_page(rows, horizon, limit))
+
+
+@router.post("", response_model=SyncPushResponse)
+def push_changes(payload: SyncPush, db: Session = Depends(get_db)):
+    """
+    Replay offline writes in one transaction.
+
+    Every op gets a result (applied / conflict / rejected); conflicting or
+    rejected ops are skipped without failing the others.
+    """
+
+    results = _apply_ops(db, payload.ops, date.today())
+    db.commit()
+    return trusted_json({"results": results})
@@ -0,0 +1,63 @@
+"""
+Conditional GET support (ETag / If-None-Match).
+
+Row ETags are derived from the row's `updated_at` version, so a matching
+request is answered with 304 before any response model is built or serialized.
+Payloads without a row version (the dashboard, the packed grid) use a hash of
+their encoded body instead.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from typing import Any
+
+from fastapi import Request, Response
+
+# ETag for "no row for this date" (the endpoint returns null).
+MISSING_ETAG = '"0"'
+
+
+def _digest(value: bytes) -> str:
+    return '"' + hashlib.blake2b(value, digest_size=12).hexdigest() + '"'
+
+
+def row_etag(row: Any) -> str:
+    """ETag for a versioned row (anything with `.id` and `.updated_at`) or None."""
+
+    if row is None:
+        return MISSING_ETAG
+    return _digest(f"{row.id}:{row.updated_at.isoformat()}".encode())
+
+
+def body_etag(body: bytes) -> str:
+    """ETag for an already-encoded (e.g. binary) response body."""
+
+    return _digest(body)
+
+
+def _matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    # Weak comparison (RFC 9110 13.1.2): ignore W/ prefixes.
+    candidates = (tag.strip().removeprefix("W/") for tag in header.split(","))
+    return etag.removeprefix("W/") in candidates
+
+
+def conditional_response(request: Request, response: Response, etag: str) -> Response | None:
+    """
+    Attach `etag` to `response`; return a 304 response if the client has it.
+
+    Clients must revalidate (`no-cache`) so navigation always gets fresh data
+    while unchanged resources cost only headers.
+    """
+
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if _matches(request, etag):
+        return Response(status_code=304, headers=headers)
+
+    response.headers.update(headers)
+    return None
@@ -0,0 +1,148 @@
+"""ASGI middleware."""
+
+from __future__ import annotations
+
+import json
+import logging
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.metrics import (
+    DB_REQUEST_TIME,
+    HTTP_IN_PROGRESS,
+    HTTP_REQUEST_DURATION,
+    HTTP_REQUESTS,
+)
+from app.db.query_stats import (
+    QueryStats,
+    current_query_stats,
+    n_plus_one_suspects,
+    start_query_stats,
+    stop_query_stats,
+)
+
+logger = logging.getLogger("lifegrid.sql")
+
+# Route label for requests that matched no route (keeps label cardinality bounded).
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+def _route_template(scope: Scope) -> str:
+    # FastAPI stores the matched route in the (shared) scope while routing.
+    return getattr(scope.get("route"), "path", UNMATCHED_ROUTE)
+
+
+class QueryStatsMiddleware:
+    """
+    Opens the per-request SQL accounting scope (see `app.db.query_stats`).
+
+    - `Server-Timing: db;dur=<ms>;desc="<n> queries", app;dur=<ms>` on every
+      response (statements run before the headers were sent)
+    - one structured `request_queries` log line per request (INFO)
+    - a `n_plus_one` warning per statement repeated N_PLUS_ONE_THRESHOLD times
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats, token = start_query_stats()
+        started = time.perf_counter()
+        status = 500
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                app_ms = (time.perf_counter() - started) * 1000
+                MutableHeaders(scope=message).append(
+                    "Server-Timing",
+                    f'db;dur={stats.seconds * 1000:.2f};desc="{stats.count} queries", '
+                    f"app;dur={app_ms:.2f}",
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            stop_query_stats(token)
+            self._log(scope, status, stats, time.perf_counter() - started)
+
+    @staticmethod
+    def _log(scope: Scope, status: int, stats: QueryStats, elapsed: float) -> None:
+        route = _route_template(scope)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                json.dumps(
+                    {
+                        "event": "request_queries",
+                        "method": scope["method"],
+                        "route": route,
+                        "status": status,
+                        "queries": stats.count,
+                        "db_ms": round(stats.seconds * 1000, 2),
+                        "duration_ms": round(elapsed * 1000, 2),
+                    }
+                )
+            )
+        for statement, count in n_plus_one_suspects(stats):
+            logger.warning(
+                json.dumps(
+                    {
+                        "event": "n_plus_one",
+                        "method": scope["method"],
+                        "route": route,
+                        "executions": count,
+                        "statement": statement,
+                    }
+                )
+            )
+
+
+class MetricsMiddleware:
+    """
+    Records per-route request counts, latency, in-flight requests and SQL time.
+
+    Plain ASGI (no BaseHTTPMiddleware task / body wrapping), so the per-request
+    cost is a few counter updates. Routes are labelled with their path template
+    (`/day-log/{log_date}`), never the raw path. Runs inside QueryStatsMiddleware
+    and reads the SQL time from its scope.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        HTTP_IN_PROGRESS.inc(method)
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - started
+            HTTP_IN_PROGRESS.dec(method)
+
+            route = _route_template(scope)
+            HTTP_REQUESTS.inc(method, route, str(status))
+            HTTP_REQUEST_DURATION.observe(method, route, value=elapsed)
+            stats = current_query_stats()
+            if stats is not None:
+                DB_REQUEST_TIME.observe(method, route, value=stats.seconds)
@@ -0,0 +1,34 @@
+"""
+Fast JSON responses for trusted rows.
+
+Request bodies are still validated by their Pydantic schemas. Payloads built
+from rows the endpoint just read or wrote are already in response shape, so
+they skip FastAPI's response_model validation and serialization: the handler
+returns `trusted_json(...)`, which FastAPI sends as is. The route's
+`response_model` still documents the shape in OpenAPI.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from fastapi import Response
+from fastapi.responses import ORJSONResponse
+
+
+def trusted_json(
+    content: Any, response: Response | None = None, status_code: int = 200
+) -> Response:
+    """
+    `content` (dicts / lists of JSON-native values, dates, UUIDs) encoded with
+    orjson, or an already-encoded JSON body (`bytes`, e.g. from a cache) sent
+    as is. Headers set on the endpoint's injected `response` (ETag, cursors)
+    are carried over; FastAPI ignores them once a Response is returned.
+    """
+
+    headers = dict(response.headers) if response is not None else None
+    if isinstance(content, bytes):
+        return Response(
+            content, status_code=status_code, headers=headers, media_type="application/json"
+        )
+    return ORJSONResponse(content, status_code=status_code, headers=headers)
@@ -2,15 +2,33 @@
 
 from fastapi import APIRouter
 
-from app.api.endpoints import (
-    categories,
-    daily_summaries,
-    dashboard,
-    day_logs,
-    dreams,
-    events,
-    health,
-)
+from app.api.endpoints import bulk_import, categories, health, live, metrics
+from app.core.config import DB_ASYNC, LIVE_UPDATES
+
+if DB_ASYNC:
+    from app.api.async_endpoints import (
+        daily_summaries,
+        dashboard,
+        day_logs,
+        days,
+        dreams,
+        events,
+        export,
+        search,
+        sync,
+    )
+else:
+    from app.api.endpoints import (
+        daily_summaries,
+        dashboard,
+        day_logs,
+        days,
+        dreams,
+        events,
+        export,
+        search,
+        sync,
+    )
 
 api_router = APIRouter()
 api_router.include_router(health.router)
@@ -20,5 +38,11 @@ api_router.include_router(daily_summaries.router)
 api_router.include_router(dreams.router)
 api_router.include_router(events.router)
 api_router.include_router(dashboard.router)
-
-
+api_router.include_router(days.router)
+api_router.include_router(export.router)
+api_router.include_router(bulk_import.router)
+api_router.include_router(search.router)
+api_router.include_router(sync.router)
+api_router.include_router(metrics.router)
+if LIVE_UPDATES:
+    api_router.include_router(live.router)
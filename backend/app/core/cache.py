@@ -0,0 +1,114 @@
+"""
+Small in-process caches.
+
+`RangeCache` is a bounded LRU with a per-entry TTL, keyed by inclusive
+`(start, end)` date ranges, so a write to one date can evict exactly the
+cached ranges that contain it.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from datetime import date
+from typing import Any, Iterable
+
+from app.core.config import DASHBOARD_CACHE_MAX_ENTRIES, DASHBOARD_CACHE_TTL_SECONDS
+
+_MISSING = object()
+
+
+class RangeCache:
+    """
+    Thread-safe LRU/TTL cache keyed by `(start, end)` date ranges.
+
+    A miss hands out a `generation` token; `put` only stores the value if no
+    invalidation happened since, so a response computed from pre-write data
+    can never be cached after the write has already invalidated its range.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[tuple[date, date], tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.ttl_seconds > 0
+
+    def get(self, start: date, end: date) -> tuple[Any, int]:
+        """Return `(value, generation)`; value is `None` on a miss."""
+
+        key = (start, end)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key, _MISSING)
+            if entry is not _MISSING:
+                expires_at, value = entry
+                if expires_at > now:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value, self._generation
+                del self._entries[key]
+            self.misses += 1
+            return None, self._generation
+
+    def put(self, start: date, end: date, value: Any, generation: int) -> None:
+        """Store `value` unless the cache was invalidated after `generation`."""
+
+        if not self.enabled:
+            return
+
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._entries[(start, end)] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end((start, end))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate_dates(self, dates: Iterable[date]) -> None:
+        """Drop every cached range containing any of `dates`."""
+
+        dates = list(dates)
+        with self._lock:
+            self._generation += 1
+            stale = [
+                key
+                for key in self._entries
+                if any(key[0] <= d <= key[1] for d in dates)
+            ]
+            for key in stale:
+                del self._entries[key]
+            self.invalidations += len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self.invalidations += len(self._entries)
+            self._entries.clear()
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": (self.hits / lookups) if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+
+dashboard_cache = RangeCache(DASHBOARD_CACHE_MAX_ENTRIES, DASHBOARD_CACHE_TTL_SECONDS)
@@ -15,6 +15,13 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
+def _env_bool(name: str, default: bool) -> bool:
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    return raw.strip().lower() in ("1", "true", "yes", "on")
+
+
 PROJECT_NAME = "LifeGrid API"
 PROJECT_DESCRIPTION = "MVP API for hourly life tracking"
 PROJECT_VERSION = "0.1.0"
@@ -26,6 +33,11 @@ PORT = os.getenv("port")
 DBNAME = os.getenv("dbname")
 DATABASE_URL = f"postgresql+psycopg2://{USER}:{PASSWORD}@{HOST}:{PORT}/{DBNAME}?sslmode=require"
 
+# Async mode: serve endpoints from `app.api.async_endpoints` on an asyncpg engine
+# (DB_ASYNC=true). The sync engine is still used for startup/schema tasks.
+DB_ASYNC = _env_bool("DB_ASYNC", False)
+ASYNC_DATABASE_URL = f"postgresql+asyncpg://{USER}:{PASSWORD}@{HOST}:{PORT}/{DBNAME}?ssl=require"
+
 # Comma-separated list, or "*" to allow all origins (MVP).
 _cors_origins_raw = os.getenv("CORS_ORIGINS", "*").strip()
 CORS_ALLOW_ORIGINS: list[str] = (
@@ -34,4 +46,64 @@ CORS_ALLOW_ORIGINS: list[str] = (
     else [o.strip() for o in _cors_origins_raw.split(",") if o.strip()]
 )
 
+# In-process dashboard response cache (per worker). Writes invalidate affected
+# ranges immediately in the writing worker and, with LIVE_UPDATES, in every other
+# worker once the commit's notification arrives; without LIVE_UPDATES the TTL
+# bounds staleness for writes made by other workers.
+DASHBOARD_CACHE_MAX_ENTRIES = int(os.getenv("DASHBOARD_CACHE_MAX_ENTRIES", "128"))
+DASHBOARD_CACHE_TTL_SECONDS = float(os.getenv("DASHBOARD_CACHE_TTL_SECONDS", "300"))
+
+# SQL instrumentation. Statements slower than SLOW_QUERY_MS are logged (with
+# their EXPLAIN plan when SLOW_QUERY_EXPLAIN is on); a request repeating one
+# statement N_PLUS_ONE_THRESHOLD times or more is logged as a likely N+1.
+# 0 disables either check.
+SLOW_QUERY_MS = float(os.getenv("SLOW_QUERY_MS", "200"))
+SLOW_QUERY_EXPLAIN = _env_bool("SLOW_QUERY_EXPLAIN", True)
+N_PLUS_ONE_THRESHOLD = int(os.getenv("N_PLUS_ONE_THRESHOLD", "10"))
+
+# Connection pooling. DB_POOL_MODE=queue keeps a per-worker client pool of
+# DB_POOL_SIZE + DB_MAX_OVERFLOW connections (per engine). DB_POOL_MODE=pgbouncer
+# targets a transaction-mode pooler (PgBouncer, Supabase pooler on :6543): no
+# client pool, no server-side prepared statements, and the statement timeout is
+# applied per transaction, since session state does not survive between
+# transactions on a shared server connection.
+DB_POOL_MODE = os.getenv("DB_POOL_MODE", "queue").strip().lower()
+if DB_POOL_MODE not in ("queue", "pgbouncer"):
+    raise ValueError(f"DB_POOL_MODE must be 'queue' or 'pgbouncer', got {DB_POOL_MODE!r}")
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+# Seconds before a pooled connection is replaced; -1 disables.
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+DB_POOL_PRE_PING = _env_bool("DB_POOL_PRE_PING", True)
+# Server-side statement_timeout for every connection; 0 leaves the server default.
+DB_STATEMENT_TIMEOUT_MS = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", "0"))
+# asyncpg prepared statement caching (psycopg2 never prepares server-side).
+DB_PREPARED_STATEMENTS = _env_bool("DB_PREPARED_STATEMENTS", DB_POOL_MODE != "pgbouncer")
+
+# Storage of day_logs.hours: "array" (SMALLINT[]) or "packed" (BYTEA, 4 bits per
+# hour, 12 bytes per day). The API is the same either way; switch with
+# `python -m app.db.migrate --hours-storage packed` and set the same value for
+# the API workers.
+DAY_LOG_HOURS_STORAGE = os.getenv("DAY_LOG_HOURS_STORAGE", "array").strip().lower()
+if DAY_LOG_HOURS_STORAGE not in ("array", "packed"):
+    raise ValueError(
+        f"DAY_LOG_HOURS_STORAGE must be 'array' or 'packed', got {DAY_LOG_HOURS_STORAGE!r}"
+    )
+
+# Worker cold-start budget: time for a fresh process to be ready to serve (imports, app
+# factory, lifespan startup). `python -m benchmarks.startup` measures it in
+# fresh processes; at runtime the factory-to-ready part is logged, with a
+# warning if that alone exceeds the budget.
+STARTUP_BUDGET_MS = float(os.getenv("STARTUP_BUDGET_MS", "2000"))
 
+# Live updates (GET /live, server-sent events). Committed writes are published
+# with Postgres NOTIFY; each worker holds one LISTEN connection while it has
+# subscribers. LISTEN needs a session-level connection, so behind a
+# transaction-mode pooler point LIVE_LISTEN_URL at the database directly.
+LIVE_UPDATES = _env_bool("LIVE_UPDATES", True)
+LIVE_LISTEN_URL = os.getenv("LIVE_LISTEN_URL") or DATABASE_URL
+LIVE_KEEPALIVE_SECONDS = float(os.getenv("LIVE_KEEPALIVE_SECONDS", "15"))
+LIVE_RECONNECT_SECONDS = float(os.getenv("LIVE_RECONNECT_SECONDS", "3"))
+# Messages buffered per subscriber; a client that falls further behind is told to resync.
+LIVE_QUEUE_SIZE = int(os.getenv("LIVE_QUEUE_SIZE", "100"))
@@ -0,0 +1,173 @@
+"""
+Vectorized helpers for the hours grid.
+
+A span of days is represented as a dense `days x 24` matrix of category codes
+(int8), with UNASSIGNED_CATEGORY (-1) for unassigned hours and for days that
+have no log at all. All per-day metrics are computed on that matrix with NumPy
+instead of walking `DayLog.hours` in Python loops.
+"""
+
+from __future__ import annotations
+
+import struct
+from datetime import date
+from typing import Iterable, Sequence
+
+import numpy as np
+
+from app.schemas.day_log import HOURS_IN_DAY, MAX_CATEGORY, MIN_CATEGORY, UNASSIGNED_CATEGORY
+
+CATEGORY_COUNT = MAX_CATEGORY - MIN_CATEGORY + 1  # 0..11
+
+# Packed grid format (`GET /day-log/grid`):
+#   header  "LGRD", version u8, start year u16, month u8, day u8, num_days u16
+#           (little endian, 11 bytes)
+#   body    num_days * 12 bytes; one 4-bit code per hour, hour 2k in the high
+#           nibble and hour 2k+1 in the low nibble of byte k of each day.
+# Codes 0..11 are categories, GRID_UNASSIGNED an unassigned hour and
+# GRID_MISSING every hour of a day that has no log.
+GRID_MAGIC = b"LGRD"
+GRID_VERSION = 1
+GRID_HEADER = struct.Struct("<4sBHBBH")
+GRID_UNASSIGNED = 0xE
+GRID_MISSING = 0xF
+
+
+# One stored day in packed storage (`DAY_LOG_HOURS_STORAGE=packed`) uses the same
+# nibble codes as the grid body; an odd trailing hour is padded with GRID_MISSING.
+# byte -> the two hours it encodes (GRID_MISSING decodes to None = no hour).
+_PACKED_BYTE_HOURS = tuple(
+    tuple(
+        None if code == GRID_MISSING
+        else code + MIN_CATEGORY if code <= MAX_CATEGORY - MIN_CATEGORY
+        else UNASSIGNED_CATEGORY
+        for code in (byte >> 4, byte & 0xF)
+    )
+    for byte in range(256)
+)
+
+
+def pack_hours(hours: Sequence[int]) -> bytes:
+    """Pack one day's hours two per byte (unknown category codes become unassigned)."""
+
+    codes = [
+        hour - MIN_CATEGORY if MIN_CATEGORY <= hour <= MAX_CATEGORY else GRID_UNASSIGNED
+        for hour in hours
+    ]
+    if len(codes) % 2:
+        codes.append(GRID_MISSING)
+    return bytes((codes[i] << 4) | codes[i + 1] for i in range(0, len(codes), 2))
+
+
+def unpack_hours(data: bytes) -> list[int]:
+    """Inverse of `pack_hours`."""
+
+    hours = [hour for byte in data for hour in _PACKED_BYTE_HOURS[byte]]
+    if hours and hours[-1] is None:
+        hours.pop()
+    return hours
+
+
+def dense_hours_matrix(
+    start: date, num_days: int, rows: Iterable
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Build the `num_days x 24` matrix for the days starting at `start`.
+
+    `rows` yields objects with `.date` and `.hours` (ORM objects or result
+    rows). Returns `(matrix, has_log)` where `has_log` flags the days that
+    have a stored log.
+    """
+
+    matrix = np.full((num_days, HOURS_IN_DAY), UNASSIGNED_CATEGORY, dtype=np.int8)
+    has_log = np.zeros(num_days, dtype=bool)
+
+    rows = list(rows)
+    if not rows:
+        return matrix, has_log
+
+    offsets = np.fromiter(
+        ((row.date - start).days for row in rows), dtype=np.intp, count=len(rows)
+    )
+    matrix[offsets] = np.array([row.hours[:HOURS_IN_DAY] for row in rows], dtype=np.int8)
+    has_log[offsets] = True
+    return matrix, has_log
+
+
+def category_histogram(matrix: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Count hours per category for every day in one pass.
+
+    Returns `(counts, unassigned)`: a `days x CATEGORY_COUNT` matrix and a
+    per-day vector. Unknown category codes are treated as unassigned.
+    """
+
+    num_days = matrix.shape[0]
+    valid = (matrix >= MIN_CATEGORY) & (matrix <= MAX_CATEGORY)
+    # Bucket CATEGORY_COUNT collects every unassigned / unknown hour.
+    buckets = np.where(valid, matrix - MIN_CATEGORY, CATEGORY_COUNT).astype(np.intp)
+    flat = buckets + (np.arange(num_days, dtype=np.intp)[:, None] * (CATEGORY_COUNT + 1))
+
+    histogram = np.bincount(
+        flat.ravel(), minlength=num_days * (CATEGORY_COUNT + 1)
+    ).reshape(num_days, CATEGORY_COUNT + 1)
+    return histogram[:, :CATEGORY_COUNT], histogram[:, CATEGORY_COUNT]
+
+
+def hours_rollup(hours_rows: Sequence[Sequence[int]]) -> tuple[list, list, list]:
+    """
+    Per-day rollup for `day_log_stats`: `(counts, unassigned, variance)` lists.
+
+    `variance` is the population variance of the 12 category counts (0.0 when
+    nothing is tracked), the balance measure used by the dashboards.
+    """
+
+    matrix = np.array([hours[:HOURS_IN_DAY] for hours in hours_rows], dtype=np.int8)
+    counts, unassigned = category_histogram(matrix.reshape(-1, HOURS_IN_DAY))
+    return counts.tolist(), unassigned.tolist(), counts.var(axis=1).tolist()
+
+
+def pack_hours_grid(start: date, matrix: np.ndarray, has_log: np.ndarray) -> bytes:
+    """
+    Encode a `dense_hours_matrix` result as the packed grid format (header +
+    two hours per byte). Unknown category codes are encoded as unassigned.
+    """
+
+    valid = (matrix >= MIN_CATEGORY) & (matrix <= MAX_CATEGORY)
+    codes = np.where(valid, matrix - MIN_CATEGORY, GRID_UNASSIGNED).astype(np.uint8)
+    codes[~has_log] = GRID_MISSING
+
+    flat = codes.ravel()
+    body = (flat[0::2] << 4) | flat[1::2]
+    header = GRID_HEADER.pack(
+        GRID_MAGIC, GRID_VERSION, start.year, start.month, start.day, matrix.shape[0]
+    )
+    return header + body.tobytes()
+
+
+def unpack_hours_grid(data: bytes) -> tuple[date, np.ndarray, np.ndarray]:
+    """
+    Decode the packed grid format (reference decoder, mirrors `pack_hours_grid`).
+
+    Returns `(start, matrix, has_log)` with the same layout as
+    `dense_hours_matrix`: category codes, UNASSIGNED_CATEGORY for unassigned
+    hours and for every hour of days without a log.
+    """
+
+    magic, version, year, month, day, num_days = GRID_HEADER.unpack_from(data)
+    if magic != GRID_MAGIC or version != GRID_VERSION:
+        raise ValueError("not a packed hours grid (version 1)")
+
+    body = np.frombuffer(data, dtype=np.uint8, offset=GRID_HEADER.size)
+    codes = np.empty(body.size * 2, dtype=np.uint8)
+    codes[0::2] = body >> 4
+    codes[1::2] = body & 0xF
+    codes = codes.reshape(num_days, HOURS_IN_DAY)
+
+    has_log = codes[:, 0] != GRID_MISSING
+    matrix = np.where(
+        codes <= MAX_CATEGORY - MIN_CATEGORY,
+        codes.astype(np.int8) + MIN_CATEGORY,
+        UNASSIGNED_CATEGORY,
+    ).astype(np.int8)
+    return date(year, month, day), matrix, has_log
@@ -0,0 +1,45 @@
+"""
+Column type for `day_logs.hours`, in either storage format.
+
+- array:  SMALLINT[] (one 2-byte element per hour plus the array header)
+- packed: BYTEA, two hours per byte (`app.core.grid.pack_hours`), 12 bytes a day
+
+Python code always sees a list of ints. Raw SQL reads hours through the
+`lifegrid_hours(...)` helper and edits them with `lifegrid_set_hours(...)`
+(migration 0007); both are overloaded for either storage.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy import ARRAY, SMALLINT, LargeBinary
+from sqlalchemy.dialects.postgresql import BYTEA
+from sqlalchemy.types import TypeDecorator
+
+from app.core.config import DAY_LOG_HOURS_STORAGE
+from app.core.grid import pack_hours, unpack_hours
+
+
+class DayLogHours(TypeDecorator):
+    """List of hour categories stored as SMALLINT[] or packed BYTEA."""
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def __init__(self, packed: bool = DAY_LOG_HOURS_STORAGE == "packed") -> None:
+        super().__init__()
+        self.packed = packed
+
+    def load_dialect_impl(self, dialect):
+        return dialect.type_descriptor(BYTEA() if self.packed else ARRAY(SMALLINT))
+
+    def process_bind_param(self, value: Any, dialect) -> Any:
+        if self.packed and value is not None:
+            return pack_hours(value)
+        return value
+
+    def process_result_value(self, value: Any, dialect) -> Any:
+        if self.packed and value is not None:
+            return unpack_hours(value)
+        return value
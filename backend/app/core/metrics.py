@@ -0,0 +1,206 @@
+"""
+In-process Prometheus metrics (text exposition format 0.0.4).
+
+A deliberately tiny registry — counters, gauges and fixed-bucket histograms
+keyed by label tuples — so instrumentation needs no extra dependency and costs
+a dict lookup plus a lock per observation. When `prometheus_client` is
+installed, `/metrics` also appends its default process / GC collectors.
+
+Values are per worker process; scrape each worker (or run a single worker)
+when aggregating.
+"""
+
+from __future__ import annotations
+
+import bisect
+import threading
+from typing import Iterable, TypeVar
+
+# Latency buckets (seconds), from sub-millisecond cache hits to slow exports.
+DEFAULT_BUCKETS = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: tuple[str, ...], values: tuple[str, ...], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labels: Iterable[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(labels)
+        self._lock = threading.Lock()
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def _header(self) -> list[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+
+    def render(self) -> list[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return self._header() + [
+            f"{self.name}{_format_labels(self.label_names, labels)} {_format_value(value)}"
+            for labels, value in items
+        ]
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def dec(self, *labels: str, amount: float = 1) -> None:
+        self.inc(*labels, amount=-amount)
+
+    def set(self, *labels: str, value: float) -> None:
+        with self._lock:
+            self._values[labels] = value
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labels: Iterable[str] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labels)
+        self.buckets = tuple(buckets)
+        # labels -> [per-bucket counts (non-cumulative) + overflow, sum, count]
+        self._series: dict[tuple[str, ...], list] = {}
+
+    def observe(self, *labels: str, value: float) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def render(self) -> list[str]:
+        with self._lock:
+            items = sorted(
+                (labels, (list(counts), total, count))
+                for labels, (counts, total, count) in self._series.items()
+            )
+
+        lines = self._header()
+        for labels, (counts, total, count) in items:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += bucket_count
+                label_text = _format_labels(
+                    self.label_names, labels, f'le="{_format_value(bound)}"'
+                )
+                lines.append(f"{self.name}_bucket{label_text} {cumulative}")
+            label_text = _format_labels(self.label_names, labels)
+            lines.append(f"{self.name}_sum{label_text} {_format_value(total)}")
+            lines.append(f"{self.name}_count{label_text} {count}")
+        return lines
+
+
+M = TypeVar("M", bound=_Metric)
+
+
+class Registry:
+    def __init__(self) -> None:
+        self._metrics: list[_Metric] = []
+
+    def register(self, metric: M) -> M:
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        lines: list[str] = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+HTTP_REQUESTS = registry.register(
+    Counter(
+        "lifegrid_http_requests_total",
+        "HTTP requests handled, by route template and status.",
+        ("method", "route", "status"),
+    )
+)
+HTTP_REQUEST_DURATION = registry.register(
+    Histogram(
+        "lifegrid_http_request_duration_seconds",
+        "HTTP request latency (until the response is fully sent), by route template.",
+        ("method", "route"),
+    )
+)
+HTTP_IN_PROGRESS = registry.register(
+    Gauge(
+        "lifegrid_http_requests_in_progress",
+        "HTTP requests currently being handled.",
+        ("method",),
+    )
+)
+DB_REQUEST_TIME = registry.register(
+    Histogram(
+        "lifegrid_db_time_per_request_seconds",
+        "Time spent executing SQL statements per HTTP request, by route template.",
+        ("method", "route"),
+    )
+)
+DB_POOL_CHECKOUTS = registry.register(
+    Counter(
+        "lifegrid_db_pool_checkouts_total",
+        "Connections checked out of the SQLAlchemy pool.",
+        ("engine",),
+    )
+)
+DB_POOL_CONNECTIONS = registry.register(
+    Gauge(
+        "lifegrid_db_pool_connections",
+        "SQLAlchemy pool state at scrape time (size, checkedout, checkedin, overflow, capacity).",
+        ("engine", "state"),
+    )
+)
+
+
+def render_metrics() -> str:
+    """Exposition text for every metric (plus prometheus_client defaults if installed)."""
+
+    text = registry.render()
+    try:
+        from prometheus_client import REGISTRY, generate_latest
+    except ImportError:
+        return text
+    return text + generate_latest(REGISTRY).decode()
@@ -0,0 +1,25 @@
+"""
+Full-text search helpers.
+
+Searchable text is indexed through stored generated `tsvector` columns, so
+Postgres keeps them current on every write path (ORM, upserts, COPY import)
+without application code. Weight A marks titles/highlights, B body text.
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import Column, Computed
+from sqlalchemy.dialects.postgresql import TSVECTOR
+
+# Text search configuration used both for indexing and for parsing queries.
+SEARCH_CONFIG = "english"
+
+
+def search_vector_column(*weighted_fields: tuple[str, str]) -> Column:
+    """`search_vector` column generated from `(column name, weight)` pairs."""
+
+    expression = " || ".join(
+        f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce({name}, '')), '{weight}')"
+        for name, weight in weighted_fields
+    )
+    return Column(TSVECTOR, Computed(expression, persisted=True))
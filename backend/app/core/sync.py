@@ -0,0 +1,35 @@
+"""
+Delta sync (change feed) building blocks shared by models, migrations and queries.
+
+Every syncable table carries a `change_seq` drawn from one global sequence by a
+`BEFORE INSERT OR UPDATE` trigger, so every write path (ORM, upserts, PATCH,
+COPY import) moves the row to the head of the feed without application code.
+Deleting a row leaves a tombstone with its own sequence number.
+
+Sequence numbers are allocated before commit, so they do not arrive in commit
+order. The trigger assigns the writer its transaction id before it draws a
+number, so every number up to a given head belongs to a transaction below the
+`xmax` of any snapshot taken after that head was read. The feed serves up to a
+head only once the oldest running transaction has passed that `xmax`
+(`app.db.sync.HorizonTracker`): nothing is locked and writers never wait for
+readers. This relies on the sequence's default CACHE 1 and on READ COMMITTED
+reads (a fresh snapshot per statement).
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import BigInteger, Column, FetchedValue
+
+SYNC_SEQUENCE = "sync_change_seq"
+
+
+def change_seq_column() -> Column:
+    """`change_seq` column maintained by the `lifegrid_track_change` trigger."""
+
+    return Column(
+        BigInteger,
+        nullable=False,
+        index=True,
+        server_default=FetchedValue(),
+        server_onupdate=FetchedValue(),
+    )
@@ -0,0 +1,330 @@
+"""
+Bulk import of the export format (NDJSON / CSV) through Postgres COPY.
+
+Records are validated with the request schemas (day log hours go through
+`DayLogBase.validate_hours`), valid rows are `COPY`-ed into per-type temporary
+staging tables in batches of IMPORT_BATCH_SIZE, and each type is merged into
+its table with one `INSERT ... SELECT ... ON CONFLICT DO UPDATE` at the end.
+Everything runs in the caller's transaction; invalid records are reported and
+skipped, as are date-keyed records whose `id` already belongs to another date
+(detected just before the merge).
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+import uuid
+from datetime import date, timedelta
+from typing import Any, Iterable, Iterator
+
+from pydantic import BaseModel, ValidationError
+from sqlalchemy import TypeDecorator, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+from app.db.changes import record_change
+from app.db.export import EXPORT_ENTITIES
+from app.db.repository import backfill_day_log_stats
+from app.schemas import (
+    DailySummaryImportRow,
+    DayLogImportRow,
+    DreamImportRow,
+    DreamState,
+    NotableEventImportRow,
+)
+
+IMPORT_BATCH_SIZE = 5000
+
+# Columns set only when a record creates its row, with a default for records
+# that leave them out (an event keeps its original created_at on re-import).
+_INSERT_ONLY_DEFAULTS = {"created_at": "now()"}
+
+_IMPORT_SCHEMAS: dict[str, type[BaseModel]] = {
+    "day_log": DayLogImportRow,
+    "daily_summary": DailySummaryImportRow,
+    "dream": DreamImportRow,
+    "notable_event": NotableEventImportRow,
+}
+
+
+def iter_records(lines: Iterable[str], fmt: str) -> Iterator[tuple[int, Any]]:
+    """
+    Parse export-format text into `(line number, record)` pairs.
+
+    `record` is a dict, or an error message for lines that cannot be parsed.
+    CSV cells are mapped back to the NDJSON shape (empty cell = absent,
+    `hours` decoded from its JSON array).
+    """
+
+    if fmt == "csv":
+        reader = csv.DictReader(lines)
+        for row in reader:
+            record = {key: value for key, value in row.items() if value not in ("", None)}
+            if "hours" in record:
+                try:
+                    record["hours"] = json.loads(record["hours"])
+                except ValueError:
+                    yield reader.line_num, "hours: invalid JSON array"
+                    continue
+            yield reader.line_num, record
+        return
+
+    for line_no, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError:
+            yield line_no, "invalid JSON"
+            continue
+        yield line_no, record if isinstance(record, dict) else "expected a JSON object"
+
+
+def _validation_message(exc: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}"
+        for error in exc.errors()
+    )
+
+
+def _copy_value(value: Any) -> str:
+    """One COPY (FORMAT csv) cell: unquoted empty = NULL, everything else quoted."""
+
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, int):
+        return str(int(value))
+    if isinstance(value, list):
+        return '"{' + ",".join(str(item) for item in value) + '}"'
+    if isinstance(value, bytes):
+        return '"\\x' + value.hex() + '"'
+    return '"' + str(value).replace('"', '""') + '"'
+
+
+class _Staging:
+    """Staging table + pending COPY buffer for one record type."""
+
+    def __init__(self, entity_type: str, model: Any, columns: tuple[str, ...]) -> None:
+        self.entity_type = entity_type
+        self.table = model.__tablename__
+        self.name = f"import_{self.table}"
+        self.columns = columns
+        self.key = "date" if model.__table__.c.date.unique else "id"
+        self.has_updated_at = "updated_at" in model.__table__.c
+        dialect = postgresql.dialect()
+        self.column_types = {
+            column: model.__table__.c[column].type.compile(dialect=dialect)
+            for column in columns
+        }
+        # Custom column types (packed day log hours) convert values as on INSERT.
+        self.converters = {
+            column: (lambda value, type_=type_: type_.process_bind_param(value, dialect))
+            for column in columns
+            if isinstance(type_ := model.__table__.c[column].type, TypeDecorator)
+        }
+        self.buffer = io.StringIO()
+        self.pending = 0
+        self.staged = 0
+        self.created = False
+
+    def create_sql(self) -> str:
+        # `seq` keeps file order, so the last record for a key wins the merge;
+        # `line` is the record's line number for error reports.
+        columns = ", ".join(f"{name} {type_}" for name, type_ in self.column_types.items())
+        return (
+            f"CREATE TEMP TABLE {self.name} (seq bigserial, line integer, {columns}) "
+            "ON COMMIT DROP"
+        )
+
+    def copy_sql(self) -> str:
+        columns = ", ".join(("line",) + self.columns)
+        return f"COPY {self.name} ({columns}) FROM STDIN WITH (FORMAT csv)"
+
+    def reject_id_clashes_sql(self) -> str:
+        """
+        Drop (and return the lines of) date-keyed records whose `id` belongs to
+        another date, in the table or in a later record, which the merge on
+        `date` could not resolve.
+        """
+
+        return (
+            f"DELETE FROM {self.name} AS i "
+            f"WHERE EXISTS (SELECT 1 FROM {self.table} AS t "
+            "WHERE t.id = i.id AND t.date <> i.date) "
+            f"OR EXISTS (SELECT 1 FROM {self.name} AS o "
+            "WHERE o.id = i.id AND o.date <> i.date AND o.seq > i.seq) "
+            "RETURNING i.line"
+        )
+
+    def merge_sql(self) -> str:
+        columns = ", ".join(self.columns)
+        values = ", ".join(
+            f"coalesce({c}, {_INSERT_ONLY_DEFAULTS[c]})" if c in _INSERT_ONLY_DEFAULTS else c
+            for c in self.columns
+        )
+        updates = [
+            f"{c} = EXCLUDED.{c}"
+            for c in self.columns
+            if c not in ("id", self.key) and c not in _INSERT_ONLY_DEFAULTS
+        ]
+        if self.has_updated_at:
+            updates.append("updated_at = now()")
+        return (
+            f"INSERT INTO {self.table} ({columns}) "
+            f"SELECT DISTINCT ON ({self.key}) {values} FROM {self.name} "
+            f"ORDER BY {self.key}, seq DESC "
+            f"ON CONFLICT ({self.key}) DO UPDATE SET {', '.join(updates)} "
+            f"RETURNING date"
+        )
+
+    def add(self, line_no: int, values: dict[str, Any]) -> None:
+        for column, convert in self.converters.items():
+            values[column] = convert(values[column])
+        cells = [str(line_no)] + [_copy_value(values[c]) for c in self.columns]
+        self.buffer.write(",".join(cells) + "\n")
+        self.pending += 1
+
+
+class BulkImporter:
+    """
+    Validates records, streams them into staging tables with COPY and merges
+    them (caller commits). Uses the session's psycopg2 connection directly.
+    """
+
+    def __init__(self, db: Session, today: date | None = None) -> None:
+        self.db = db
+        self.today = today or date.today()
+        self.staging = {
+            entity_type: _Staging(entity_type, model, columns)
+            for entity_type, model, columns in EXPORT_ENTITIES
+        }
+
+    def _values(self, entity_type: str, record: dict[str, Any]) -> dict[str, Any]:
+        row = _IMPORT_SCHEMAS[entity_type].model_validate(record)
+        if row.date > self.today:
+            raise ValueError("Cannot import future dates")
+
+        values = row.model_dump()
+        values["id"] = values["id"] or uuid.uuid4()
+        if entity_type == "day_log" and values["is_reconstructed"] is None:
+            # Same live window as PUT /day-log/{date}: older than yesterday.
+            values["is_reconstructed"] = row.date < self.today - timedelta(days=1)
+        if entity_type == "dream" and row.dream_state == DreamState.NONE:
+            # Same as the dream endpoints: descriptions are only kept for actual dreams.
+            values["description"] = None
+        if entity_type == "notable_event":
+            values["title"] = values["title"].strip()
+        return values
+
+    def add(self, line_no: int, record: Any) -> dict[str, Any] | None:
+        """Validate and stage one record; returns an error entry if it is rejected."""
+
+        if isinstance(record, str):
+            return {"line": line_no, "type": None, "error": record}
+
+        entity_type = record.get("type")
+        staging = self.staging.get(entity_type)
+        if staging is None:
+            return {"line": line_no, "type": entity_type, "error": "unknown record type"}
+
+        try:
+            values = self._values(entity_type, record)
+        except ValidationError as exc:
+            return {"line": line_no, "type": entity_type, "error": _validation_message(exc)}
+        except ValueError as exc:
+            return {"line": line_no, "type": entity_type, "error": str(exc)}
+
+        staging.add(line_no, values)
+        if staging.pending >= IMPORT_BATCH_SIZE:
+            self._copy(staging)
+        return None
+
+    def _copy(self, staging: _Staging) -> None:
+        if not staging.pending:
+            return
+
+        cursor = self.db.connection().connection.cursor()
+        try:
+            if not staging.created:
+                cursor.execute(staging.create_sql())
+                staging.created = True
+            staging.buffer.seek(0)
+            cursor.copy_expert(staging.copy_sql(), staging.buffer)
+        finally:
+            cursor.close()
+
+        staging.staged += staging.pending
+        staging.pending = 0
+        staging.buffer = io.StringIO()
+
+    def merge(self) -> tuple[dict[str, int], list[dict[str, Any]]]:
+        """
+        COPY the remaining rows and merge every staging table; returns the rows
+        merged per type and error entries for records rejected while merging.
+        """
+
+        merged: dict[str, int] = {}
+        rejected: list[dict[str, Any]] = []
+        for staging in self.staging.values():
+            self._copy(staging)
+            if not staging.staged:
+                merged[staging.entity_type] = 0
+                continue
+
+            if staging.key == "date":
+                lines = self.db.execute(text(staging.reject_id_clashes_sql())).scalars()
+                rejected.extend(
+                    {
+                        "line": line_no,
+                        "type": staging.entity_type,
+                        "error": "id already belongs to another date",
+                    }
+                    for line_no in sorted(lines)
+                )
+
+            dates = self.db.execute(text(staging.merge_sql())).scalars().all()
+            for log_date in set(dates):
+                record_change(self.db, staging.table, log_date)
+            merged[staging.entity_type] = len(dates)
+
+            if staging.entity_type == "day_log":
+                # Rebuild the rollups of every imported date (same transaction).
+                self.db.execute(
+                    text(
+                        f"DELETE FROM day_log_stats AS s USING {staging.name} AS i "
+                        "WHERE s.date = i.date"
+                    )
+                )
+                backfill_day_log_stats(self.db.connection())
+                for log_date in set(dates):
+                    record_change(self.db, "day_log_stats", log_date)
+        return merged, rejected
+
+
+def run_import(
+    db: Session, lines: Iterable[str], fmt: str, today: date | None = None
+) -> Iterator[dict[str, Any]]:
+    """
+    Import export-format `lines` and commit.
+
+    Yields one entry per rejected record as soon as it is found (id clashes once
+    the merge has run), then a final `{"summary": {...}}` with the rows merged
+    per type and the rejected count.
+    """
+
+    importer = BulkImporter(db, today)
+    rejected = 0
+    for line_no, record in iter_records(lines, fmt):
+        error = importer.add(line_no, record)
+        if error is not None:
+            rejected += 1
+            yield error
+
+    merged, clashes = importer.merge()
+    db.commit()
+    yield from clashes
+    yield {"summary": {"imported": merged, "rejected": rejected + len(clashes)}}
@@ -0,0 +1,63 @@
+"""
+Commit-time change notifications.
+
+Write paths call `record_change(session, table, date)` for every row they touch.
+Once the session's transaction commits, the collected `(table, date)` pairs are
+handed to every listener registered with `on_commit`; on rollback they are
+dropped. Listeners therefore only ever see changes that are actually durable.
+
+With LIVE_UPDATES on, the same pairs are also NOTIFYed to the other workers as
+part of the transaction (see app/db/live.py).
+"""
+
+from __future__ import annotations
+
+from datetime import date
+from typing import Callable
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.config import LIVE_UPDATES
+from app.db.live import publish_changes
+
+Change = tuple[str, date]
+
+_INFO_KEY = "lifegrid_changes"
+_listeners: list[Callable[[set[Change]], None]] = []
+
+
+def record_change(session, table: str, log_date: date) -> None:
+    """Remember that `table` changed for `log_date` in the current transaction."""
+
+    # AsyncSession proxies a regular Session; events fire on the latter.
+    session = getattr(session, "sync_session", session)
+    session.info.setdefault(_INFO_KEY, set()).add((table, log_date))
+
+
+def on_commit(listener: Callable[[set[Change]], None]) -> Callable[[set[Change]], None]:
+    """Register `listener(changes)` to run after each commit that recorded changes."""
+
+    _listeners.append(listener)
+    return listener
+
+
+@event.listens_for(Session, "before_commit")
+def _publish_changes(session: Session) -> None:
+    changes = session.info.get(_INFO_KEY)
+    if changes and LIVE_UPDATES:
+        publish_changes(session, changes)
+
+
+@event.listens_for(Session, "after_commit")
+def _dispatch_changes(session: Session) -> None:
+    changes = session.info.pop(_INFO_KEY, None)
+    if not changes:
+        return
+    for listener in _listeners:
+        listener(changes)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_changes(session: Session) -> None:
+    session.info.pop(_INFO_KEY, None)
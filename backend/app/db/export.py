@@ -0,0 +1,120 @@
+"""
+Full-data export format (NDJSON / CSV).
+
+Every DayLog, DailySummary, Dream and NotableEvent is written as one record
+tagged with its `type`. NDJSON lines are `{"type": ..., <columns>}`; CSV uses
+one shared header (CSV_COLUMNS) with empty cells for columns a type does not
+have and `hours` as a JSON array. Rows are read in `EXPORT_BATCH_SIZE`
+partitions from server-side cursors and encoded a batch at a time, optionally
+through an incremental gzip stream, so memory stays flat for any history size.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+import zlib
+from datetime import date
+from typing import Any, Iterator, Sequence
+
+from sqlalchemy import Select, select
+
+from app.models import DailySummary, DayLog, Dream, NotableEvent
+
+EXPORT_BATCH_SIZE = 1000
+
+EXPORT_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+# (record type, model, exported columns), in export order.
+EXPORT_ENTITIES: tuple[tuple[str, Any, tuple[str, ...]], ...] = (
+    ("day_log", DayLog, ("id", "date", "hours", "is_reconstructed")),
+    ("daily_summary", DailySummary, ("id", "date", "highlight", "reflection")),
+    ("dream", Dream, ("id", "date", "dream_state", "description")),
+    (
+        "notable_event",
+        NotableEvent,
+        ("id", "date", "title", "description", "category", "created_at"),
+    ),
+)
+
+CSV_COLUMNS = (
+    "type",
+    "id",
+    "date",
+    "hours",
+    "is_reconstructed",
+    "highlight",
+    "reflection",
+    "dream_state",
+    "description",
+    "title",
+    "category",
+    "created_at",
+)
+
+
+def export_statements(
+    start: date | None, end: date | None
+) -> Iterator[tuple[str, tuple[str, ...], Select]]:
+    """`(record type, columns, SELECT)` per entity, filtered to `start..end`, streamed."""
+
+    for entity_type, model, columns in EXPORT_ENTITIES:
+        stmt = select(*(getattr(model, column) for column in columns))
+        if start is not None:
+            stmt = stmt.where(model.date >= start)
+        if end is not None:
+            stmt = stmt.where(model.date <= end)
+        stmt = stmt.order_by(model.date, model.id).execution_options(
+            yield_per=EXPORT_BATCH_SIZE
+        )
+        yield entity_type, columns, stmt
+
+
+def _csv_value(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, list):
+        return json.dumps(value, separators=(",", ":"))
+    return value
+
+
+class ExportEncoder:
+    """Encodes row batches to NDJSON / CSV bytes, gzip-compressed when requested."""
+
+    def __init__(self, fmt: str, compress: bool) -> None:
+        self.fmt = fmt
+        # wbits=31: gzip container (header + CRC) rather than a raw zlib stream.
+        self._gzip = zlib.compressobj(6, zlib.DEFLATED, 31) if compress else None
+
+    def _output(self, text: str) -> bytes:
+        data = text.encode()
+        return self._gzip.compress(data) if self._gzip else data
+
+    def header(self) -> bytes:
+        if self.fmt != "csv":
+            return b""
+        return self._output(",".join(CSV_COLUMNS) + "\r\n")
+
+    def encode(
+        self, entity_type: str, columns: Sequence[str], rows: Sequence[Sequence[Any]]
+    ) -> bytes:
+        if self.fmt == "csv":
+            buffer = io.StringIO()
+            writer = csv.DictWriter(buffer, fieldnames=CSV_COLUMNS, restval="")
+            for row in rows:
+                record = {"type": entity_type}
+                record.update(zip(columns, map(_csv_value, row)))
+                writer.writerow(record)
+            return self._output(buffer.getvalue())
+
+        lines = [
+            json.dumps({"type": entity_type, **dict(zip(columns, row))}, default=str)
+            for row in rows
+        ]
+        return self._output("\n".join(lines) + "\n")
+
+    def finish(self) -> bytes:
+        return self._gzip.flush() if self._gzip else b""
@@ -0,0 +1,175 @@
+"""
+Cross-worker change notifications over Postgres LISTEN/NOTIFY.
+
+Publishing: just before a session commits, the `(table, date)` changes it
+recorded (see app/db/changes.py) are sent with `pg_notify` inside the same
+transaction, so Postgres delivers them only if the commit succeeds.
+
+Receiving: `change_hub` keeps one LISTEN connection per worker while at least
+one subscriber (a live stream, the dashboard cache) is subscribed, and fans
+every notification out to the subscribers' queues on the event loop (psycopg2 socket + `loop.add_reader`,
+no extra thread).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from datetime import date
+from typing import Any, Iterable
+
+from sqlalchemy import ARRAY, Text, bindparam, create_engine, text
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import NullPool
+
+from app.core.config import LIVE_LISTEN_URL, LIVE_QUEUE_SIZE, LIVE_RECONNECT_SECONDS
+from app.db.sync import SYNC_ENTITIES
+
+logger = logging.getLogger("lifegrid.live")
+
+LIVE_CHANNEL = "lifegrid_changes"
+
+# Changes per NOTIFY payload (~40 bytes each; Postgres caps a payload at 8000 bytes).
+_CHANGES_PER_NOTIFY = 150
+
+# Table -> entity type sent to clients; derived tables (day_log_stats) are not published.
+_LIVE_ENTITIES = {model.__tablename__: entity for entity, model in SYNC_ENTITIES.items()}
+
+_NOTIFY_SQL = text(
+    f"SELECT pg_notify('{LIVE_CHANNEL}', payload) FROM unnest(:payloads) AS payload"
+).bindparams(bindparam("payloads", type_=ARRAY(Text)))
+
+# Sent to a subscriber whose notifications may have been lost (listener
+# reconnect, queue overflow): refetch everything currently shown.
+RESYNC: dict[str, Any] = {"resync": True}
+
+_KEEPALIVE_ARGS = {"keepalives": 1, "keepalives_idle": 30, "keepalives_interval": 10}
+
+
+def live_payloads(changes: Iterable[tuple[str, date]]) -> list[str]:
+    """NOTIFY payloads (JSON lists of `{type, date}`) for recorded table changes."""
+
+    entries = sorted(
+        {
+            (_LIVE_ENTITIES[table], log_date)
+            for table, log_date in changes
+            if table in _LIVE_ENTITIES
+        },
+        key=lambda entry: (entry[1], entry[0]),
+    )
+    return [
+        json.dumps(
+            [
+                {"type": entity, "date": log_date.isoformat()}
+                for entity, log_date in entries[start : start + _CHANGES_PER_NOTIFY]
+            ],
+            separators=(",", ":"),
+        )
+        for start in range(0, len(entries), _CHANGES_PER_NOTIFY)
+    ]
+
+
+def publish_changes(session: Session, changes: Iterable[tuple[str, date]]) -> None:
+    """NOTIFY `changes` in the session's transaction (delivered on commit only)."""
+
+    payloads = live_payloads(changes)
+    if payloads:
+        session.execute(_NOTIFY_SQL, {"payloads": payloads})
+
+
+def _listen_connection():
+    """Dedicated autocommit psycopg2 connection LISTENing on LIVE_CHANNEL (blocking)."""
+
+    engine = create_engine(LIVE_LISTEN_URL, poolclass=NullPool)
+    cargs, cparams = engine.dialect.create_connect_args(engine.url)
+    connection = engine.dialect.connect(*cargs, **{**cparams, **_KEEPALIVE_ARGS})
+    connection.autocommit = True
+    with connection.cursor() as cursor:
+        cursor.execute(f"LISTEN {LIVE_CHANNEL}")
+    return connection
+
+
+class ChangeHub:
+    """Per-worker fan-out of change notifications to live stream subscribers."""
+
+    def __init__(self) -> None:
+        self._subscribers: set[asyncio.Queue] = set()
+        self._task: asyncio.Task | None = None
+
+    def subscribe(self) -> asyncio.Queue:
+        """New subscriber queue; starts the listener if this is the first one."""
+
+        queue: asyncio.Queue = asyncio.Queue(maxsize=LIVE_QUEUE_SIZE)
+        self._subscribers.add(queue)
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._listen())
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        """Drop a subscriber; the listener connection closes with the last one."""
+
+        self._subscribers.discard(queue)
+        if not self._subscribers and self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def _broadcast(self, message: dict[str, Any]) -> None:
+        for queue in self._subscribers:
+            try:
+                queue.put_nowait(message)
+            except asyncio.QueueFull:
+                # Slow client: replace its backlog with a single resync.
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait(RESYNC)
+
+    def _drain(self, connection, lost: asyncio.Future) -> None:
+        try:
+            connection.poll()
+        except Exception as exc:
+            if not lost.done():
+                lost.set_result(exc)
+            return
+
+        while connection.notifies:
+            notify = connection.notifies.pop(0)
+            try:
+                changes = json.loads(notify.payload)
+            except ValueError:
+                continue
+            self._broadcast({"changes": changes})
+
+    async def _listen(self) -> None:
+        loop = asyncio.get_running_loop()
+        reconnecting = False
+        while True:
+            try:
+                connection = await loop.run_in_executor(None, _listen_connection)
+            except Exception as exc:
+                logger.warning(json.dumps({"event": "live_listen_failed", "error": str(exc)}))
+                await asyncio.sleep(LIVE_RECONNECT_SECONDS)
+                reconnecting = True
+                continue
+
+            if reconnecting:
+                # Notifications sent while disconnected are gone.
+                self._broadcast(RESYNC)
+            lost = loop.create_future()
+            fd = connection.fileno()
+            loop.add_reader(fd, self._drain, connection, lost)
+            try:
+                exc = await lost
+                logger.warning(json.dumps({"event": "live_listen_lost", "error": str(exc)}))
+            finally:
+                loop.remove_reader(fd)
+                connection.close()
+            reconnecting = True
+
+
+change_hub = ChangeHub()
@@ -0,0 +1,86 @@
+"""
+Schema migrations (Alembic, scripts in `backend/migrations`).
+
+Run once per deploy, before starting the API workers; the app itself never
+creates or alters tables:
+
+  python -m app.db.migrate           # upgrade to the latest revision
+  python -m app.db.migrate --sql     # print the SQL instead of running it
+  python -m app.db.migrate --hours-storage packed   # convert day_logs.hours
+
+Equivalent to `alembic upgrade head` from the backend directory. Converting
+the hours storage rewrites `day_logs`; set DAY_LOG_HOURS_STORAGE to the same
+value for the API workers before restarting them.
+"""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import NullPool
+
+from app.core.config import DATABASE_URL
+
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+
+
+def alembic_config() -> Config:
+    config = Config(str(BACKEND_DIR / "alembic.ini"))
+    config.set_main_option("script_location", str(BACKEND_DIR / "migrations"))
+    return config
+
+
+def upgrade(revision: str = "head", sql: bool = False) -> None:
+    """Migrate the configured database to `revision` (or print the SQL)."""
+
+    command.upgrade(alembic_config(), revision, sql=sql)
+
+
+# `lifegrid_hours` (migration 0007) reads either storage, so each conversion
+# works whatever the column currently holds.
+_CONVERT_HOURS_SQL = {
+    "packed": "ALTER TABLE day_logs ALTER COLUMN hours TYPE BYTEA "
+    "USING lifegrid_pack_hours(lifegrid_hours(hours))",
+    "array": "ALTER TABLE day_logs ALTER COLUMN hours TYPE SMALLINT[] "
+    "USING lifegrid_hours(hours)",
+}
+
+
+def convert_hours_storage(storage: str, sql: bool = False) -> None:
+    """Rewrite `day_logs.hours` as "packed" BYTEA or "array" SMALLINT[] (or print the SQL)."""
+
+    statement = _CONVERT_HOURS_SQL[storage]
+    if sql:
+        print(statement + ";")
+        return
+    engine = create_engine(DATABASE_URL, poolclass=NullPool)
+    try:
+        with engine.begin() as connection:
+            connection.execute(text(statement))
+    finally:
+        engine.dispose()
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Migrate the LifeGrid database schema.")
+    parser.add_argument("revision", nargs="?", default="head", help="target revision")
+    parser.add_argument("--sql", action="store_true", help="print SQL instead of executing it")
+    parser.add_argument(
+        "--hours-storage",
+        choices=sorted(_CONVERT_HOURS_SQL),
+        help="after upgrading, convert day_logs.hours to this storage",
+    )
+    args = parser.parse_args(argv)
+
+    upgrade(args.revision, sql=args.sql)
+    if args.hours_storage:
+        convert_hours_storage(args.hours_storage, sql=args.sql)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
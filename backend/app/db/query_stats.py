@@ -0,0 +1,195 @@
+"""
+Per-request SQL statement accounting.
+
+The request middleware opens a `QueryStats` scope (a context variable, so it
+follows the request into threadpool workers); engine cursor events add every
+statement's count, execution time and text to the current scope. Statements
+run outside a request (startup, CLI tools) are not tracked.
+
+On top of the accounting:
+- statements slower than SLOW_QUERY_MS are logged with their EXPLAIN plan
+- `n_plus_one_suspects` flags statements a request repeated suspiciously often
+- `query_budget` is a test helper that fails when a block exceeds its budget
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from typing import Any, Iterator
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import N_PLUS_ONE_THRESHOLD, SLOW_QUERY_EXPLAIN, SLOW_QUERY_MS
+
+logger = logging.getLogger("lifegrid.sql")
+
+# Only these statements can be EXPLAINed (no DDL, COPY, transaction control).
+_EXPLAINABLE = ("SELECT", "WITH", "INSERT", "UPDATE", "DELETE")
+
+
+@dataclass
+class QueryStats:
+    count: int = 0
+    seconds: float = 0.0
+    # Statement text -> executions (bound parameters are placeholders, so a
+    # repeated text is the same query shape).
+    statements: Counter = field(default_factory=Counter)
+
+    def add(self, statement: str, elapsed: float) -> None:
+        self.count += 1
+        self.seconds += elapsed
+        self.statements[statement] += 1
+
+
+_current: ContextVar[QueryStats | None] = ContextVar("lifegrid_query_stats", default=None)
+
+# Scopes opened by `query_budget`; they see statements from every thread.
+_budget_scopes: list[QueryStats] = []
+_budget_lock = threading.Lock()
+
+
+def start_query_stats() -> tuple[QueryStats, Token]:
+    """Open a new accounting scope; pass the token to `stop_query_stats`."""
+
+    stats = QueryStats()
+    return stats, _current.set(stats)
+
+
+def stop_query_stats(token: Token) -> None:
+    _current.reset(token)
+
+
+def current_query_stats() -> QueryStats | None:
+    return _current.get()
+
+
+def n_plus_one_suspects(stats: QueryStats) -> list[tuple[str, int]]:
+    """Statements executed N_PLUS_ONE_THRESHOLD times or more in one scope."""
+
+    if N_PLUS_ONE_THRESHOLD <= 0:
+        return []
+    return [
+        (statement, count)
+        for statement, count in stats.statements.most_common()
+        if count >= N_PLUS_ONE_THRESHOLD
+    ]
+
+
+def _explain(conn, statement: str, parameters: Any) -> str | None:
+    """
+    EXPLAIN plan of `statement` on a fresh cursor (the original still holds
+    results), inside a savepoint: a failing EXPLAIN would otherwise abort the
+    request's transaction.
+    """
+
+    if not statement.lstrip().upper().startswith(_EXPLAINABLE):
+        return None
+    cursor = conn.connection.cursor()
+    try:
+        cursor.execute("SAVEPOINT lifegrid_explain")
+        try:
+            cursor.execute("EXPLAIN " + statement, parameters)
+            plan = "\n".join(row[0] for row in cursor.fetchall())
+        except Exception as exc:
+            cursor.execute("ROLLBACK TO SAVEPOINT lifegrid_explain")
+            return f"EXPLAIN failed: {exc}"
+        cursor.execute("RELEASE SAVEPOINT lifegrid_explain")
+        return plan
+    except Exception as exc:  # the plan is best effort; never fail the request
+        return f"EXPLAIN failed: {exc}"
+    finally:
+        cursor.close()
+
+
+def _log_slow_query(
+    conn, statement: str, parameters: Any, elapsed: float, executemany: bool
+) -> None:
+    plan = None
+    if SLOW_QUERY_EXPLAIN and not executemany:
+        plan = _explain(conn, statement, parameters)
+    logger.warning(
+        json.dumps(
+            {
+                "event": "slow_query",
+                "duration_ms": round(elapsed * 1000, 2),
+                "threshold_ms": SLOW_QUERY_MS,
+                "statement": statement,
+                "plan": plan,
+            }
+        )
+    )
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    context.lifegrid_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    elapsed = time.perf_counter() - context.lifegrid_started
+
+    stats = _current.get()
+    if stats is not None:
+        stats.add(statement, elapsed)
+    if _budget_scopes:
+        with _budget_lock:
+            for scope in _budget_scopes:
+                scope.add(statement, elapsed)
+
+    if SLOW_QUERY_MS > 0 and elapsed * 1000 >= SLOW_QUERY_MS:
+        _log_slow_query(conn, statement, parameters, elapsed, executemany)
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Attach statement accounting to a (sync, or an async engine's sync) engine."""
+
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def pool_status(engine: Engine) -> dict[str, Any]:
+    """Live connection pool counters (QueuePool; other pools report their class only)."""
+
+    pool = engine.pool
+    status: dict[str, Any] = {"pool": type(pool).__name__}
+    for name in ("size", "checkedout", "checkedin", "overflow"):
+        method = getattr(pool, name, None)
+        if method is not None:
+            status[name] = method()
+    return status
+
+
+@contextmanager
+def query_budget(max_queries: int) -> Iterator[QueryStats]:
+    """
+    Test helper: fail if the block executes more than `max_queries` statements.
+
+    Counts statements from every thread, so it works around `TestClient` calls:
+
+        with query_budget(1):
+            client.get("/day/2026-01-04")
+    """
+
+    stats = QueryStats()
+    with _budget_lock:
+        _budget_scopes.append(stats)
+    try:
+        yield stats
+    finally:
+        with _budget_lock:
+            _budget_scopes.remove(stats)
+
+    if stats.count > max_queries:
+        listing = "\n".join(
+            f"  {count}x {statement}" for statement, count in stats.statements.most_common()
+        )
+        raise AssertionError(
+            f"Query budget exceeded: {stats.count} statements (budget {max_queries})\n{listing}"
+        )
@@ -0,0 +1,283 @@
+"""
+Date-keyed repository helpers.
+
+DayLog, DailySummary, Dream (and the DayLogStats rollup) all hold at most one
+row per `date`. Writes go through a native
+`INSERT ... ON CONFLICT (date) DO UPDATE ... RETURNING`, so an upsert is one
+round trip and concurrent writers for the same date cannot race each other into
+a unique-constraint violation.
+"""
+
+from __future__ import annotations
+
+import uuid
+from datetime import date
+from typing import Any, Sequence
+
+from sqlalchemy import (
+    ARRAY,
+    INTEGER,
+    SMALLINT,
+    BigInteger,
+    Boolean,
+    Date,
+    DateTime,
+    Row,
+    bindparam,
+    func,
+    text,
+)
+from sqlalchemy.dialects.postgresql import UUID, Insert, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from app.core.grid import hours_rollup
+from app.db.changes import record_change
+from app.models import DayLog, DayLogStats
+from app.schemas.day_log import HOURS_IN_DAY, UNASSIGNED_CATEGORY
+
+# Columns that are never overwritten on conflict (identity of the existing row).
+_IMMUTABLE_COLUMNS = frozenset({"id", "date", "created_at"})
+
+
+def _record_changes(
+    db: Session | AsyncSession, model: Any, rows: Sequence[dict[str, Any]]
+) -> None:
+    for row in rows:
+        record_change(db, model.__tablename__, row["date"])
+
+
+def upsert_by_date_stmt(model: Any, rows: Sequence[dict[str, Any]]) -> Insert:
+    """
+    Build a (multi-row) upsert for a date-keyed model.
+
+    Every non-key column present in `rows` is overwritten on conflict, and
+    `updated_at` is bumped when the model tracks it. The statement returns the
+    full row as stored.
+    """
+
+    if "id" in model.__table__.c:
+        values = [{"id": uuid.uuid4(), **row} for row in rows]
+    else:
+        values = list(rows)
+    stmt = insert(model).values(values)
+
+    set_: dict[str, Any] = {
+        key: stmt.excluded[key] for key in rows[0] if key not in _IMMUTABLE_COLUMNS
+    }
+    if "updated_at" in model.__table__.c:
+        set_["updated_at"] = func.now()
+
+    return stmt.on_conflict_do_update(
+        index_elements=[model.date],
+        set_=set_,
+    ).returning(*model.__table__.c)
+
+
+def upsert_many_by_date(
+    db: Session, model: Any, rows: Sequence[dict[str, Any]]
+) -> list[Row]:
+    """
+    Upsert many date-keyed rows in one statement (caller commits).
+
+    Dates in `rows` must be unique: Postgres refuses to update the same row
+    twice within a single `ON CONFLICT` statement.
+    """
+
+    if not rows:
+        return []
+    _record_changes(db, model, rows)
+    return list(db.execute(upsert_by_date_stmt(model, rows)))
+
+
+def upsert_by_date(db: Session, model: Any, log_date: date, **values: Any) -> Row:
+    """Upsert a single date-keyed row and return it as stored (caller commits)."""
+
+    record_change(db, model.__tablename__, log_date)
+    return db.execute(upsert_by_date_stmt(model, [{"date": log_date, **values}])).one()
+
+
+async def async_upsert_many_by_date(
+    db: AsyncSession, model: Any, rows: Sequence[dict[str, Any]]
+) -> list[Row]:
+    """Async variant of `upsert_many_by_date` (caller commits)."""
+
+    if not rows:
+        return []
+    _record_changes(db, model, rows)
+    return list(await db.execute(upsert_by_date_stmt(model, rows)))
+
+
+async def async_upsert_by_date(
+    db: AsyncSession, model: Any, log_date: date, **values: Any
+) -> Row:
+    """Async variant of `upsert_by_date` (caller commits)."""
+
+    record_change(db, model.__tablename__, log_date)
+    result = await db.execute(upsert_by_date_stmt(model, [{"date": log_date, **values}]))
+    return result.one()
+
+
+def day_log_stats_rows(logs: Sequence[Any]) -> list[dict[str, Any]]:
+    """DayLogStats values for stored day logs (objects with `.date` / `.hours`)."""
+
+    if not logs:
+        return []
+
+    counts, unassigned, variance = hours_rollup([log.hours for log in logs])
+    return [
+        {"date": log.date, "counts": c, "unassigned": u, "variance": v}
+        for log, c, u, v in zip(logs, counts, unassigned, variance)
+    ]
+
+
+def upsert_day_logs(db: Session, rows: Sequence[dict[str, Any]]) -> list[Row]:
+    """
+    Upsert day logs and refresh their DayLogStats rollups (caller commits).
+
+    Both statements run in the caller's transaction, so the rollup can never be
+    committed out of sync with the log it summarizes.
+    """
+
+    logs = upsert_many_by_date(db, DayLog, rows)
+    upsert_many_by_date(db, DayLogStats, day_log_stats_rows(logs))
+    return logs
+
+
+async def async_upsert_day_logs(
+    db: AsyncSession, rows: Sequence[dict[str, Any]]
+) -> list[Row]:
+    """Async variant of `upsert_day_logs` (caller commits)."""
+
+    logs = await async_upsert_many_by_date(db, DayLog, rows)
+    await async_upsert_many_by_date(db, DayLogStats, day_log_stats_rows(logs))
+    return logs
+
+
+# SQL twin of `hours_rollup` over the (date, hours) rows of `{source}`: only the
+# first 24 hours count, anything outside 0..11 is unassigned. `lifegrid_hours`
+# reads either hours storage.
+_DAY_LOG_STATS_SELECT = """
+    SELECT
+        l.date,
+        array_agg(c.hours::smallint ORDER BY c.category),
+        (cardinality(lifegrid_hours(l.hours)[1:24]) - sum(c.hours))::smallint,
+        var_pop(c.hours)
+    FROM {source} AS l
+    CROSS JOIN LATERAL (
+        SELECT k.category, count(h.category) AS hours
+        FROM generate_series(0, 11) AS k(category)
+        LEFT JOIN unnest(lifegrid_hours(l.hours)[1:24]) AS h(category)
+            ON h.category = k.category
+        GROUP BY k.category
+    ) AS c
+    {where}
+    GROUP BY l.date, l.hours
+"""
+
+# Builds rollups for day logs that predate `day_log_stats` (or were written by
+# other tools).
+_BACKFILL_DAY_LOG_STATS_SQL = text(
+    "INSERT INTO day_log_stats (date, counts, unassigned, variance)"
+    + _DAY_LOG_STATS_SELECT.format(
+        source="day_logs",
+        where="WHERE NOT EXISTS (SELECT 1 FROM day_log_stats AS s WHERE s.date = l.date)",
+    )
+)
+
+
+def backfill_day_log_stats(connection: Connection) -> int:
+    """Create missing DayLogStats rows in one statement; returns rows inserted."""
+
+    return connection.execute(_BACKFILL_DAY_LOG_STATS_SQL).rowcount
+
+
+# Sparse hour edits in one statement: `lifegrid_set_hours` assigns the edited
+# (0-based) indices in either hours storage, `DayLogHours` packs the insert
+# value and unpacks the returned row.
+_PATCH_DAY_LOG_SQL = (
+    text(
+        f"""
+        WITH log AS (
+            INSERT INTO day_logs AS l (id, date, hours, is_reconstructed)
+            VALUES (:id, :date, :hours, :is_reconstructed)
+            ON CONFLICT (date) DO UPDATE SET
+                hours = lifegrid_set_hours(l.hours, :indices, :categories),
+                is_reconstructed = EXCLUDED.is_reconstructed,
+                updated_at = now()
+            RETURNING l.id, l.date, l.hours, l.is_reconstructed, l.updated_at, l.change_seq
+        ),
+        stats AS (
+            INSERT INTO day_log_stats (date, counts, unassigned, variance)
+            {_DAY_LOG_STATS_SELECT.format(source="log", where="")}
+            ON CONFLICT (date) DO UPDATE SET
+                counts = EXCLUDED.counts,
+                unassigned = EXCLUDED.unassigned,
+                variance = EXCLUDED.variance
+        )
+        SELECT id, date, hours, is_reconstructed, updated_at, change_seq FROM log
+        """
+    )
+    .bindparams(
+        bindparam("id", type_=UUID(as_uuid=True)),
+        bindparam("date", type_=Date),
+        bindparam("hours", type_=DayLog.__table__.c.hours.type),
+        bindparam("indices", type_=ARRAY(INTEGER)),
+        bindparam("categories", type_=ARRAY(SMALLINT)),
+    )
+    .columns(
+        id=UUID(as_uuid=True),
+        date=Date,
+        hours=DayLog.__table__.c.hours.type,
+        is_reconstructed=Boolean,
+        updated_at=DateTime(timezone=True),
+        change_seq=BigInteger,
+    )
+)
+
+
+def _patch_day_log_params(
+    log_date: date, edits: dict[int, int], is_reconstructed: bool
+) -> dict[str, Any]:
+    hours = [UNASSIGNED_CATEGORY] * HOURS_IN_DAY
+    for index, category in edits.items():
+        hours[index] = category
+    return {
+        "id": uuid.uuid4(),
+        "date": log_date,
+        "hours": hours,
+        "is_reconstructed": is_reconstructed,
+        "indices": list(edits),
+        "categories": list(edits.values()),
+    }
+
+
+def patch_day_log(
+    db: Session, log_date: date, edits: dict[int, int], is_reconstructed: bool
+) -> Row:
+    """
+    Apply sparse hour `edits` (index -> category) to a day's log in one statement
+    and return the row as stored (caller commits).
+
+    An existing row only gets its edited hours assigned (`lifegrid_set_hours`,
+    either hours storage); a missing row is created all-unassigned with the
+    edits applied. The DayLogStats rollup is recomputed from the written row in the
+    same statement (data-modifying CTE), so nothing is read first.
+    """
+
+    record_change(db, DayLog.__tablename__, log_date)
+    record_change(db, DayLogStats.__tablename__, log_date)
+    params = _patch_day_log_params(log_date, edits, is_reconstructed)
+    return db.execute(_PATCH_DAY_LOG_SQL, params).one()
+
+
+async def async_patch_day_log(
+    db: AsyncSession, log_date: date, edits: dict[int, int], is_reconstructed: bool
+) -> Row:
+    """Async variant of `patch_day_log` (caller commits)."""
+
+    record_change(db, DayLog.__tablename__, log_date)
+    record_change(db, DayLogStats.__tablename__, log_date)
+    params = _patch_day_log_params(log_date, edits, is_reconstructed)
+    return (await db.execute(_PATCH_DAY_LOG_SQL, params)).one()
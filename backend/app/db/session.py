@@ -1,19 +1,202 @@
-"""SQLAlchemy engine + session management."""
+"""SQLAlchemy engine + session management (engines are built lazily)."""
 
 from __future__ import annotations
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+import threading
+import uuid
+from typing import Any
 
-from app.core.config import DATABASE_URL
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import NullPool
 
-engine = create_engine(DATABASE_URL)
-# If using Transaction Pooler or Session Pooler, we want to ensure we disable SQLAlchemy client side pooling -
-# https://docs.sqlalchemy.org/en/20/core/pooling.html#switching-pool-implementations
-# from sqlalchemy.pool import NullPool
-# engine = create_engine(DATABASE_URL, poolclass=NullPool)
+from app.core.config import (
+    ASYNC_DATABASE_URL,
+    DATABASE_URL,
+    DB_ASYNC,
+    DB_MAX_OVERFLOW,
+    DB_POOL_MODE,
+    DB_POOL_PRE_PING,
+    DB_POOL_RECYCLE,
+    DB_POOL_SIZE,
+    DB_POOL_TIMEOUT,
+    DB_PREPARED_STATEMENTS,
+    DB_STATEMENT_TIMEOUT_MS,
+)
+from app.core.metrics import DB_POOL_CHECKOUTS
+from app.db.query_stats import instrument_engine, pool_status
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+PGBOUNCER = DB_POOL_MODE == "pgbouncer"
+
+# Engines are built on first use (see `get_engine`), so importing the app,
+# models or CLI tools never constructs a pool or loads a driver.
+_build_lock = threading.Lock()
+_engine: Engine | None = None
+_session_factory: sessionmaker | None = None
+_async_engine: AsyncEngine | None = None
+_async_session_factory: async_sessionmaker | None = None
+
+
+def _pool_options() -> dict[str, Any]:
+    if PGBOUNCER:
+        # The pooler owns the connections; a client pool would pin server
+        # connections per worker and defeat transaction pooling.
+        return {"poolclass": NullPool}
+    return {
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT,
+        "pool_recycle": DB_POOL_RECYCLE,
+        "pool_pre_ping": DB_POOL_PRE_PING,
+    }
+
+
+def _sync_connect_args() -> dict[str, Any]:
+    if DB_STATEMENT_TIMEOUT_MS > 0 and not PGBOUNCER:
+        return {"options": f"-c statement_timeout={DB_STATEMENT_TIMEOUT_MS}"}
+    return {}
+
+
+def _async_connect_args() -> dict[str, Any]:
+    args: dict[str, Any] = {}
+    if DB_STATEMENT_TIMEOUT_MS > 0 and not PGBOUNCER:
+        args["server_settings"] = {"statement_timeout": str(DB_STATEMENT_TIMEOUT_MS)}
+    if not DB_PREPARED_STATEMENTS:
+        # asyncpg still prepares each statement once; unique names keep those
+        # from colliding on server connections shared through the pooler.
+        args["statement_cache_size"] = 0
+        args["prepared_statement_cache_size"] = 0
+        args["prepared_statement_name_func"] = lambda: f"__asyncpg_{uuid.uuid4()}__"
+    return args
+
+
+def _set_local_statement_timeout(connection) -> None:
+    # Transaction pooling: SET would leak to other clients, SET LOCAL ends with
+    # the transaction (startup `options` are rejected by PgBouncer).
+    connection.exec_driver_sql(f"SET LOCAL statement_timeout = {DB_STATEMENT_TIMEOUT_MS}")
+
+
+def _instrument(target: Engine, label: str) -> None:
+    """Per-request statement accounting + pool checkout counter for `target`."""
+
+    instrument_engine(target)
+    event.listen(target, "checkout", lambda *_: DB_POOL_CHECKOUTS.inc(label))
+    if PGBOUNCER and DB_STATEMENT_TIMEOUT_MS > 0:
+        event.listen(target, "begin", _set_local_statement_timeout)
+
+
+def _build_engine() -> Engine:
+    built = create_engine(DATABASE_URL, connect_args=_sync_connect_args(), **_pool_options())
+    _instrument(built, "sync")
+    return built
+
+
+def _build_async_engine() -> AsyncEngine:
+    built = create_async_engine(
+        ASYNC_DATABASE_URL, connect_args=_async_connect_args(), **_pool_options()
+    )
+    _instrument(built.sync_engine, "async")
+    return built
+
+
+def get_engine() -> Engine:
+    """The sync (psycopg2) engine, built on first use rather than at import."""
+
+    global _engine, _session_factory
+    if _engine is None:
+        with _build_lock:
+            if _engine is None:
+                built = _build_engine()
+                _session_factory = sessionmaker(autocommit=False, autoflush=False, bind=built)
+                _engine = built
+    return _engine
+
+
+def get_async_engine() -> AsyncEngine:
+    """
+    The asyncpg engine (async mode only), built on first use, so the driver
+    stays optional for sync deployments.
+    """
+
+    global _async_engine, _async_session_factory
+    if not DB_ASYNC:
+        raise RuntimeError("Async database mode is disabled (set DB_ASYNC=true)")
+    if _async_engine is None:
+        with _build_lock:
+            if _async_engine is None:
+                built = _build_async_engine()
+                _async_session_factory = async_sessionmaker(
+                    built, autoflush=False, expire_on_commit=False
+                )
+                _async_engine = built
+    return _async_engine
+
+
+def get_session_factory() -> sessionmaker:
+    """The `sessionmaker` bound to the sync engine (built on first use)."""
+
+    get_engine()
+    return _session_factory
+
+
+def new_session() -> Session:
+    """A new sync Session (caller closes it, e.g. `with new_session() as db`)."""
+
+    return get_session_factory()()
+
+
+def new_async_session() -> AsyncSession:
+    """A new AsyncSession (caller closes it, e.g. `async with new_async_session() as db`)."""
+
+    get_async_engine()
+    return _async_session_factory()
+
+
+async def dispose_engines() -> None:
+    """Close the pooled connections of every engine built so far."""
+
+    if _engine is not None:
+        _engine.dispose()
+    if _async_engine is not None:
+        await _async_engine.dispose()
+
+
+def instrumented_engines() -> dict[str, Engine]:
+    """Engines built so far by metrics label (`sync`, `async`)."""
+
+    engines = {}
+    if _engine is not None:
+        engines["sync"] = _engine
+    if _async_engine is not None:
+        engines["async"] = _async_engine.sync_engine
+    return engines
+
+
+def pool_capacity() -> int | None:
+    """Most connections one engine of this worker can open (None: unbounded / pooler-managed)."""
+
+    if PGBOUNCER or DB_MAX_OVERFLOW < 0:
+        return None
+    return DB_POOL_SIZE + DB_MAX_OVERFLOW
+
+
+def pool_stats() -> dict[str, dict[str, Any]]:
+    """Live pool counters per engine label, plus the configured capacity."""
+
+    capacity = pool_capacity()
+    stats = {}
+    for label, target in instrumented_engines().items():
+        stats[label] = pool_status(target)
+        if capacity is not None:
+            stats[label]["capacity"] = capacity
+    return stats
 
 
 def get_db():
@@ -22,10 +205,18 @@ def get_db():
     Ensures the session is closed after the request completes.
     """
 
-    db = SessionLocal()
+    db = new_session()
     try:
         yield db
     finally:
         db.close()
 
 
+async def get_async_db():
+    """
+    FastAPI dependency that provides an `AsyncSession` (async mode only).
+    Ensures the session is closed after the request completes.
+    """
+
+    async with new_async_session() as db:
+        yield db
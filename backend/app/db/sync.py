@@ -0,0 +1,172 @@
+"""
+Delta sync queries: the change feed horizon, feed pages and row version checks.
+
+See app/core/sync.py for how `change_seq` is assigned. A feed page is one
+`UNION ALL` over the synced tables and the tombstones, each branch an index
+range scan on `change_seq`, merged in sequence order.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import deque
+from functools import lru_cache
+from typing import Any
+
+from sqlalchemy import Row, TextClause, bindparam, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.sync import SYNC_SEQUENCE
+from app.models import DailySummary, DayLog, Dream, NotableEvent, SyncTombstone
+
+# Sync entity type -> model (tombstones name their entity the same way).
+SYNC_ENTITIES: dict[str, Any] = {
+    "day_log": DayLog,
+    "daily_summary": DailySummary,
+    "dream": Dream,
+    "notable_event": NotableEvent,
+}
+
+# Row payload as sent to clients: every column but the sync / search internals
+# (day log hours as an array in either storage).
+_ROW_DATA = "to_jsonb(t) - 'change_seq' - 'search_vector'"
+_ROW_DATA_BY_ENTITY = {
+    entity: _ROW_DATA for entity in SYNC_ENTITIES
+} | {"day_log": _ROW_DATA + " || jsonb_build_object('hours', lifegrid_hours(t.hours))"}
+
+_HEAD_SQL = text(
+    f"SELECT CASE WHEN is_called THEN last_value ELSE 0 END FROM {SYNC_SEQUENCE}"
+)
+# Run as a separate statement after _HEAD_SQL, so the snapshot is taken after
+# the head was read.
+_SNAPSHOT_SQL = text(
+    "SELECT pg_snapshot_xmin(s)::text::bigint AS xmin, "
+    "pg_snapshot_xmax(s)::text::bigint AS xmax "
+    "FROM pg_current_snapshot() AS s"
+)
+
+
+class HorizonTracker:
+    """
+    Lock-free feed horizon (per worker), from the sequence head and snapshots.
+
+    Every sequence number up to a `head` read before a snapshot belongs to a
+    transaction below that snapshot's `xmax` (see app/core/sync.py). Each feed
+    request records such a `(head, xmax)` mark; once a later snapshot's `xmin`
+    (oldest running transaction) reaches a mark's `xmax`, those transactions
+    have all finished and its head becomes the horizon. A mark is safe at once
+    when no transaction is running, so the horizon only lags the head while
+    writes are in flight, by about one request.
+    """
+
+    def __init__(self, max_marks: int = 64) -> None:
+        self._lock = threading.Lock()
+        self._marks: deque[tuple[int, int]] = deque()
+        self._max_marks = max_marks
+        self._horizon = 0
+
+    def advance(self, head: int, xmin: int, xmax: int) -> int:
+        """Record the mark `(head, xmax)` and return the horizon as of `xmin`."""
+
+        with self._lock:
+            if head < self._horizon:
+                # The sequence went back (database restored): start over.
+                self._marks.clear()
+                self._horizon = 0
+            while self._marks and self._marks[0][1] <= xmin:
+                self._horizon = max(self._horizon, self._marks.popleft()[0])
+            if xmin >= xmax:
+                self._horizon = max(self._horizon, head)
+            elif head > max(self._horizon, self._marks[-1][0] if self._marks else 0):
+                # When full, newer marks wait: the oldest become safe first.
+                if len(self._marks) < self._max_marks:
+                    self._marks.append((head, xmax))
+            return self._horizon
+
+
+_horizon_tracker = HorizonTracker()
+
+
+def _feed_sql() -> TextClause:
+    # LIMIT per branch keeps every branch a bounded index scan.
+    branches = [
+        f"""
+        (SELECT change_seq AS seq, '{entity}' AS type, false AS deleted,
+                {_ROW_DATA_BY_ENTITY[entity]} AS data
+         FROM {model.__tablename__} AS t
+         WHERE change_seq > :since AND change_seq <= :horizon
+         ORDER BY change_seq LIMIT :limit)
+        """
+        for entity, model in SYNC_ENTITIES.items()
+    ]
+    branches.append(
+        f"""
+        (SELECT change_seq AS seq, entity AS type, true AS deleted,
+                jsonb_build_object('id', id, 'date', date) AS data
+         FROM {SyncTombstone.__tablename__}
+         WHERE change_seq > :since AND change_seq <= :horizon
+         ORDER BY change_seq LIMIT :limit)
+        """
+    )
+    return text(" UNION ALL ".join(branches) + " ORDER BY seq LIMIT :limit")
+
+
+_FEED_SQL = _feed_sql()
+
+
+def sync_horizon(db: Session) -> tuple[int, int]:
+    """
+    `(horizon, head)`: every transaction holding a change sequence up to
+    `horizon` has finished; `head` is the last sequence number allocated.
+    Takes no locks.
+    """
+
+    head = db.execute(_HEAD_SQL).scalar_one()
+    snapshot = db.execute(_SNAPSHOT_SQL).one()
+    return _horizon_tracker.advance(head, snapshot.xmin, snapshot.xmax), head
+
+
+async def async_sync_horizon(db: AsyncSession) -> tuple[int, int]:
+    """Async variant of `sync_horizon`."""
+
+    head = (await db.execute(_HEAD_SQL)).scalar_one()
+    snapshot = (await db.execute(_SNAPSHOT_SQL)).one()
+    return _horizon_tracker.advance(head, snapshot.xmin, snapshot.xmax), head
+
+
+def change_feed(db: Session, since: int, horizon: int, limit: int) -> list[Row]:
+    """`(seq, type, deleted, data)` rows with `since < seq <= horizon`, in sequence order."""
+
+    params = {"since": since, "horizon": horizon, "limit": limit}
+    return list(db.execute(_FEED_SQL, params))
+
+
+async def async_change_feed(
+    db: AsyncSession, since: int, horizon: int, limit: int
+) -> list[Row]:
+    """Async variant of `change_feed`."""
+
+    params = {"since": since, "horizon": horizon, "limit": limit}
+    return list(await db.execute(_FEED_SQL, params))
+
+
+@lru_cache(maxsize=None)
+def _lock_row_sql(entity: str, key: str) -> TextClause:
+    table = SYNC_ENTITIES[entity].__table__
+    return text(
+        f"SELECT change_seq, {_ROW_DATA_BY_ENTITY[entity]} AS data FROM {table.name} AS t "
+        f"WHERE {key} = :key FOR UPDATE"
+    ).bindparams(bindparam("key", type_=table.c[key].type))
+
+
+def lock_sync_row(db: Session, entity: str, key: str, value: Any) -> Row | None:
+    """Lock a synced row for the rest of the transaction; returns `(change_seq, data)`."""
+
+    return db.execute(_lock_row_sql(entity, key), {"key": value}).first()
+
+
+def last_change_seq(db: Session) -> int:
+    """Sequence number this transaction's most recent write was assigned."""
+
+    return db.execute(text(f"SELECT currval('{SYNC_SEQUENCE}')")).scalar_one()
@@ -1,59 +1,97 @@
-"""FastAPI application factory / composition root."""
+"""
+FastAPI application factory / composition root.
+
+Startup does no database work: engines are built on the first request that
+needs one, and the schema is migrated once per deploy outside the serving
+path (`python -m app.db.migrate`).
+"""
 
 from __future__ import annotations
 
+import asyncio
+import json
+import logging
+import time
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
+from app.api.endpoints.dashboard import follow_live_changes
+from app.api.middleware import MetricsMiddleware, QueryStatsMiddleware
 from app.api.router import api_router
 from app.core.config import (
     CORS_ALLOW_ORIGINS,
+    LIVE_UPDATES,
     PROJECT_DESCRIPTION,
     PROJECT_NAME,
     PROJECT_VERSION,
+    STARTUP_BUDGET_MS,
 )
-from app.db.base import Base
-from app.db.session import engine
-
-
-@asynccontextmanager
-async def lifespan(_: FastAPI):
-    # Ensure all model modules are imported so SQLAlchemy registers tables.
-    # In production, you'd use Alembic migrations instead of create_all.
-    import app.models  # noqa: F401
-
-    # Test database connection on startup
-    try:
-        with engine.connect() as connection:
-            print("✅ Database connection successful!")
-        Base.metadata.create_all(bind=engine)
-        print("✅ Database tables created/verified!")
-    except Exception as e:
-        print(f"❌ Database connection failed: {e}")
-        print(f"📝 Check your DATABASE_URL in .env file")
-        raise
-    
-    yield
-
-
-app = FastAPI(
-    title=PROJECT_NAME,
-    description=PROJECT_DESCRIPTION,
-    version=PROJECT_VERSION,
-    lifespan=lifespan,
-)
+from app.core.cache import dashboard_cache
+from app.db.live import change_hub
+from app.db.session import dispose_engines
 
-# CORS: Allow frontend to call API
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=CORS_ALLOW_ORIGINS,  # Restrict in production
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+logger = logging.getLogger("lifegrid.startup")
+
+
+def create_app() -> FastAPI:
+    """Build the API app (`main:app`, or `uvicorn app.main:create_app --factory`)."""
+
+    started = time.perf_counter()
+
+    @asynccontextmanager
+    async def lifespan(_: FastAPI):
+        startup_ms = (time.perf_counter() - started) * 1000
+        log = logger.warning if startup_ms > STARTUP_BUDGET_MS else logger.info
+        log(
+            json.dumps(
+                {
+                    "event": "startup",
+                    "startup_ms": round(startup_ms, 2),
+                    "budget_ms": STARTUP_BUDGET_MS,
+                }
+            )
+        )
+
+        # Other workers' writes reach this worker's dashboard cache over the
+        # live change stream (one LISTEN connection per worker).
+        cache_follower = None
+        if LIVE_UPDATES and dashboard_cache.enabled:
+            cache_follower = asyncio.create_task(follow_live_changes())
+
+        yield
+
+        if cache_follower is not None:
+            cache_follower.cancel()
+        await change_hub.close()
+        await dispose_engines()
+
+    app = FastAPI(
+        title=PROJECT_NAME,
+        description=PROJECT_DESCRIPTION,
+        version=PROJECT_VERSION,
+        lifespan=lifespan,
+        # orjson for every JSON body; row endpoints also skip response
+        # validation (see app.api.responses).
+        default_response_class=ORJSONResponse,
+    )
 
-app.include_router(api_router)
+    # CORS: Allow frontend to call API
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=CORS_ALLOW_ORIGINS,  # Restrict in production
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+        expose_headers=["ETag", "X-Next-Cursor", "Server-Timing"],
+    )
 
+    # Per-route request metrics (served at /metrics), inside the SQL accounting
+    # scope opened by the outermost QueryStatsMiddleware (Server-Timing, query log)
+    app.add_middleware(MetricsMiddleware)
+    app.add_middleware(QueryStatsMiddleware)
 
+    app.include_router(api_router)
+    return app
@@ -1,10 +1,12 @@
 """SQLAlchemy ORM models."""
 
 from app.models.day_log import DayLog
+from app.models.day_log_stats import DayLogStats
 from app.models.daily_summary import DailySummary
 from app.models.dream import Dream
 from app.models.notable_event import NotableEvent
+from app.models.sync_tombstone import SyncTombstone
 
-__all__ = ["DayLog", "DailySummary", "Dream", "NotableEvent"]
+__all__ = ["DayLog", "DayLogStats", "DailySummary", "Dream", "NotableEvent", "SyncTombstone"]
 
 
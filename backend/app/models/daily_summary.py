@@ -4,9 +4,12 @@ from __future__ import annotations
 
 import uuid
 
-from sqlalchemy import Column, Date, Text
+from sqlalchemy import Column, Date, DateTime, Index, Text
 from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
 
+from app.core.search import search_vector_column
+from app.core.sync import change_seq_column
 from app.db.base import Base
 
 
@@ -18,10 +21,24 @@ class DailySummary(Base):
     """
 
     __tablename__ = "daily_summaries"
+    __table_args__ = (
+        Index("ix_daily_summaries_search_vector", "search_vector", postgresql_using="gin"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     date = Column(Date, unique=True, nullable=False, index=True)
     highlight = Column(Text, nullable=True)
     reflection = Column(Text, nullable=True)
+    # Full-text index input (generated by Postgres from highlight + reflection)
+    search_vector = search_vector_column(("highlight", "A"), ("reflection", "B"))
+    # Row version (bumped on every write; used for ETags)
+    updated_at = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
+    # Delta sync feed position (bumped on every write)
+    change_seq = change_seq_column()
 
 
@@ -4,9 +4,12 @@ from __future__ import annotations
 
 import uuid
 
-from sqlalchemy import ARRAY, SMALLINT, Boolean, Column, Date
+from sqlalchemy import Boolean, Column, Date, DateTime
 from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
 
+from app.core.hours_storage import DayLogHours
+from app.core.sync import change_seq_column
 from app.db.base import Base
 
 
@@ -18,16 +21,27 @@ class DayLog(Base):
     - date: Unique date for this log (one log per day)
     - hours: Array of 24 integers (0-11), one per hour of the day.
              V2: -1 is used as an explicit sentinel for "Unassigned".
+             Stored as SMALLINT[] or packed BYTEA (DAY_LOG_HOURS_STORAGE).
     - is_reconstructed: Flags whether this log was backfilled (older than the live window)
+    - updated_at: Row version (bumped on every write; used for ETags)
+    - change_seq: Position in the delta sync feed (bumped on every write)
     """
 
     __tablename__ = "day_logs"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     date = Column(Date, unique=True, nullable=False, index=True)
-    # PostgreSQL ARRAY of SMALLINT - stores 24 category codes
-    hours = Column(ARRAY(SMALLINT), nullable=False)
+    # 24 category codes (SMALLINT[] or 4-bit packed BYTEA; always a list in Python)
+    hours = Column(DayLogHours(), nullable=False)
     # True for logs older than the live window (today + yesterday)
     is_reconstructed = Column(Boolean, nullable=False, default=False)
+    updated_at = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
+    # Delta sync feed position (bumped on every write)
+    change_seq = change_seq_column()
 
 
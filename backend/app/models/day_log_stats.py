@@ -0,0 +1,27 @@
+"""DayLogStats model."""
+
+from __future__ import annotations
+
+from sqlalchemy import ARRAY, SMALLINT, Column, Date, Float
+
+from app.db.base import Base
+
+
+class DayLogStats(Base):
+    """
+    Precomputed per-day rollup of DayLog.hours (1:1 with day_logs.date).
+
+    Written in the same transaction as the DayLog it summarizes, so dashboards
+    and range analytics read 12 small counts per day instead of raw hours.
+
+    - counts: hours per category, index = category code (0-11)
+    - unassigned: hours that are -1 / null / unknown codes
+    - variance: population variance of `counts` (0 when nothing is tracked)
+    """
+
+    __tablename__ = "day_log_stats"
+
+    date = Column(Date, primary_key=True)
+    counts = Column(ARRAY(SMALLINT), nullable=False)
+    unassigned = Column(SMALLINT, nullable=False)
+    variance = Column(Float, nullable=False)
@@ -4,10 +4,12 @@ from __future__ import annotations
 
 import uuid
 
-from sqlalchemy import SMALLINT, Column, Date, DateTime, Text
+from sqlalchemy import SMALLINT, Column, Date, DateTime, Index, Text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 
+from app.core.search import search_vector_column
+from app.core.sync import change_seq_column
 from app.db.base import Base
 
 
@@ -22,11 +24,16 @@ class Dream(Base):
     """
 
     __tablename__ = "dreams"
+    __table_args__ = (
+        Index("ix_dreams_search_vector", "search_vector", postgresql_using="gin"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     date = Column(Date, unique=True, nullable=False, index=True)
     dream_state = Column(SMALLINT, nullable=False, default=0)
     description = Column(Text, nullable=True)
+    # Full-text index input (generated by Postgres from description)
+    search_vector = search_vector_column(("description", "B"))
     created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
     updated_at = Column(
         DateTime(timezone=True),
@@ -34,4 +41,6 @@ class Dream(Base):
         server_default=func.now(),
         onupdate=func.now(),
     )
+    # Delta sync feed position (bumped on every write)
+    change_seq = change_seq_column()
 
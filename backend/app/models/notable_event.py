@@ -4,10 +4,12 @@ from __future__ import annotations
 
 import uuid
 
-from sqlalchemy import Column, Date, DateTime, SMALLINT, Text
+from sqlalchemy import Column, Date, DateTime, Index, SMALLINT, Text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 
+from app.core.search import search_vector_column
+from app.core.sync import change_seq_column
 from app.db.base import Base
 
 
@@ -15,12 +17,29 @@ class NotableEvent(Base):
     """Lightweight memory log: notable events with optional category tag."""
 
     __tablename__ = "notable_events"
+    # Matches the listing order (date, created_at, id DESC via a backward scan),
+    # so keyset pages are read straight off the index with no sort step. Its
+    # leading `date` column also serves plain date lookups.
+    __table_args__ = (
+        Index("ix_notable_events_date_created_at_id", "date", "created_at", "id"),
+        Index("ix_notable_events_search_vector", "search_vector", postgresql_using="gin"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    date = Column(Date, nullable=False, index=True)
+    date = Column(Date, nullable=False)
     title = Column(Text, nullable=False)
     description = Column(Text, nullable=True)
     category = Column(SMALLINT, nullable=True)
+    # Full-text index input (generated by Postgres from title + description)
+    search_vector = search_vector_column(("title", "A"), ("description", "B"))
     created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    updated_at = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
+    # Delta sync feed position (bumped on every write)
+    change_seq = change_seq_column()
 
 
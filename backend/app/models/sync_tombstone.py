@@ -0,0 +1,29 @@
+"""SyncTombstone model."""
+
+from __future__ import annotations
+
+from sqlalchemy import BigInteger, Column, Date, DateTime, Text
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+
+from app.db.base import Base
+
+
+class SyncTombstone(Base):
+    """
+    Marker left in the delta sync feed when a row is deleted.
+
+    Written by the `lifegrid_record_tombstone` trigger, never by the app.
+
+    - change_seq: Feed position of the deletion
+    - entity: Sync entity type of the deleted row (e.g. "notable_event")
+    - id / date: Identity of the deleted row
+    """
+
+    __tablename__ = "sync_tombstones"
+
+    change_seq = Column(BigInteger, primary_key=True, autoincrement=False)
+    entity = Column(Text, nullable=False)
+    id = Column(UUID(as_uuid=True), nullable=False)
+    date = Column(Date, nullable=False)
+    deleted_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
@@ -1,9 +1,33 @@
 """Pydantic request/response schemas."""
 
-from app.schemas.day_log import DayLogCreate, DayLogResponse
+from app.schemas.day_log import (
+    DayLogBatchResponse,
+    DayLogBatchResult,
+    DayLogBatchUpsert,
+    DayLogCreate,
+    DayLogHourRange,
+    DayLogPatch,
+    DayLogRangeResponse,
+    DayLogResponse,
+)
 from app.schemas.daily_summary import DailySummaryCreate, DailySummaryResponse
+from app.schemas.bulk_import import (
+    DailySummaryImportRow,
+    DayLogImportRow,
+    DreamImportRow,
+    NotableEventImportRow,
+)
+from app.schemas.day_bundle import DayBundleResponse
 from app.schemas.dream import DreamResponse, DreamState, DreamUpsert
 from app.schemas.notable_event import NotableEventCreate, NotableEventResponse
+from app.schemas.search import SearchResponse, SearchResult
+from app.schemas.sync import (
+    SyncChange,
+    SyncFeedResponse,
+    SyncOpResult,
+    SyncPush,
+    SyncPushResponse,
+)
 from app.schemas.weekly_dashboard import (
     CategoryTotal,
     DreamMetrics,
@@ -14,7 +38,14 @@ from app.schemas.weekly_dashboard import (
 
 __all__ = [
     "DayLogCreate",
+    "DayLogHourRange",
+    "DayLogPatch",
     "DayLogResponse",
+    "DayLogRangeResponse",
+    "DayLogBatchUpsert",
+    "DayLogBatchResult",
+    "DayLogBatchResponse",
+    "DayBundleResponse",
     "DailySummaryCreate",
     "DailySummaryResponse",
     "DreamResponse",
@@ -22,6 +53,17 @@ __all__ = [
     "DreamUpsert",
     "NotableEventCreate",
     "NotableEventResponse",
+    "DayLogImportRow",
+    "DailySummaryImportRow",
+    "DreamImportRow",
+    "NotableEventImportRow",
+    "SearchResult",
+    "SearchResponse",
+    "SyncChange",
+    "SyncFeedResponse",
+    "SyncPush",
+    "SyncOpResult",
+    "SyncPushResponse",
     "WeeklyDashboardDay",
     "WeeklyDashboardResponse",
     "CategoryTotal",
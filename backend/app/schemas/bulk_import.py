@@ -0,0 +1,44 @@
+"""Bulk import row schemas (one per record `type` of the export format)."""
+
+from __future__ import annotations
+
+from datetime import date, datetime
+from typing import Optional
+from uuid import UUID
+
+from app.schemas.daily_summary import DailySummaryCreate
+from app.schemas.day_log import DayLogBase
+from app.schemas.dream import DreamUpsert
+from app.schemas.notable_event import NotableEventCreate
+
+
+class DayLogImportRow(DayLogBase):
+    """A `day_log` record; hours are validated exactly like `PUT /day-log/{date}`."""
+
+    id: Optional[UUID] = None
+    date: date
+    is_reconstructed: Optional[bool] = None
+
+
+class DailySummaryImportRow(DailySummaryCreate):
+    """A `daily_summary` record."""
+
+    id: Optional[UUID] = None
+    date: date
+
+
+class DreamImportRow(DreamUpsert):
+    """A `dream` record."""
+
+    id: Optional[UUID] = None
+
+
+class NotableEventImportRow(NotableEventCreate):
+    """
+    A `notable_event` record (matched on `id`; events are not unique per date).
+    `created_at` keeps the event's place in the day's order; new events without
+    one get the import time.
+    """
+
+    id: Optional[UUID] = None
+    created_at: Optional[datetime] = None
@@ -0,0 +1,27 @@
+"""Day bundle schemas (everything stored for a date, in one response)."""
+
+from __future__ import annotations
+
+from datetime import date
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+from app.schemas.daily_summary import DailySummaryResponse
+from app.schemas.day_log import DayLogResponse
+from app.schemas.dream import DreamResponse
+from app.schemas.notable_event import NotableEventResponse
+
+
+class DayBundleResponse(BaseModel):
+    """
+    Schema for `GET /day/{date}`: the day log, daily summary, dream and notable
+    events of one date. Missing entities are null (events: empty list), exactly
+    as the per-entity endpoints report them.
+    """
+
+    date: date
+    day_log: Optional[DayLogResponse] = None
+    summary: Optional[DailySummaryResponse] = None
+    dream: Optional[DreamResponse] = None
+    events: list[NotableEventResponse] = Field(default_factory=list)
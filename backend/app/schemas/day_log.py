@@ -5,13 +5,28 @@ from __future__ import annotations
 from typing import Optional
 from datetime import date
 
-from pydantic import BaseModel, ConfigDict, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
 # Valid category codes (0-11) + explicit "unassigned" sentinel (-1)
 UNASSIGNED_CATEGORY = -1
 MIN_CATEGORY = 0
 MAX_CATEGORY = 11
 HOURS_IN_DAY = 24
+# Upper bound on dates per batch upsert (one year of backfill)
+MAX_BATCH_SIZE = 366
+
+
+def _normalize_category(value: Optional[int], label: str) -> int:
+    """A valid category code, or -1 for unassigned (null is normalized to -1)."""
+
+    if value is None:
+        return UNASSIGNED_CATEGORY
+    if value != UNASSIGNED_CATEGORY and not (MIN_CATEGORY <= value <= MAX_CATEGORY):
+        raise ValueError(
+            f"{label} value {value} must be {UNASSIGNED_CATEGORY}, null, "
+            f"or between {MIN_CATEGORY} and {MAX_CATEGORY}"
+        )
+    return value
 
 
 class DayLogBase(BaseModel):
@@ -32,38 +47,106 @@ class DayLogBase(BaseModel):
         if len(v) != HOURS_IN_DAY:
             raise ValueError(f"hours must have exactly {HOURS_IN_DAY} elements")
 
-        normalized: list[int] = []
-        for i, hour_val in enumerate(v):
-            if hour_val is None:
-                normalized.append(UNASSIGNED_CATEGORY)
-                continue
+        return [_normalize_category(hour_val, f"hour[{i}]") for i, hour_val in enumerate(v)]
+
 
-            if hour_val == UNASSIGNED_CATEGORY:
-                normalized.append(hour_val)
-                continue
+class DayLogCreate(DayLogBase):
+    """Schema for creating/updating a day log (request body)."""
 
-            if not (MIN_CATEGORY <= hour_val <= MAX_CATEGORY):
-                raise ValueError(
-                    f"hour[{i}] value {hour_val} must be {UNASSIGNED_CATEGORY}, null, "
-                    f"or between {MIN_CATEGORY} and {MAX_CATEGORY}"
-                )
 
-            normalized.append(hour_val)
+class DayLogHourRange(BaseModel):
+    """Contiguous hours `start..end` (inclusive, 0-23) set to one category."""
 
-        return normalized
+    start: int = Field(ge=0, lt=HOURS_IN_DAY)
+    end: int = Field(ge=0, lt=HOURS_IN_DAY)
+    category: Optional[int]
 
+    @model_validator(mode="after")
+    def validate_range(self) -> "DayLogHourRange":
+        if self.start > self.end:
+            raise ValueError("start must be <= end")
+        self.category = _normalize_category(self.category, f"range {self.start}-{self.end}")
+        return self
 
-class DayLogCreate(DayLogBase):
-    """Schema for creating/updating a day log (request body)."""
 
+class DayLogPatch(BaseModel):
+    """
+    Sparse edit of a day log (request body): `hours` maps hour index (0-23) to
+    category, `ranges` paints contiguous hours. Ranges apply first, then `hours`.
+    """
+
+    hours: dict[int, Optional[int]] = Field(default_factory=dict)
+    ranges: list[DayLogHourRange] = Field(default_factory=list, max_length=HOURS_IN_DAY)
+
+    @field_validator("hours")
+    @classmethod
+    def validate_hours(cls, v: dict[int, Optional[int]]) -> dict[int, int]:
+        for index in v:
+            if not 0 <= index < HOURS_IN_DAY:
+                raise ValueError(f"hour index {index} must be between 0 and {HOURS_IN_DAY - 1}")
+        return {index: _normalize_category(value, f"hour[{index}]") for index, value in v.items()}
+
+    @model_validator(mode="after")
+    def validate_not_empty(self) -> "DayLogPatch":
+        if not self.hours and not self.ranges:
+            raise ValueError("at least one hour or range is required")
+        return self
+
+    def edits(self) -> dict[int, int]:
+        """Hour index -> category after applying every range, then every single hour."""
+
+        edits: dict[int, int] = {}
+        for hour_range in self.ranges:
+            for index in range(hour_range.start, hour_range.end + 1):
+                edits[index] = hour_range.category
+        edits.update(self.hours)
+        return edits
 
-class DayLogResponse(DayLogBase):
-    """Schema for day log API responses."""
+
+class DayLogResponse(BaseModel):
+    """
+    Schema for day log API responses.
+
+    Not a DayLogBase: stored hours were validated on write, so responses never
+    re-run `validate_hours`.
+    """
 
     model_config = ConfigDict(from_attributes=True)
 
     id: str
     date: date
+    hours: list[int]
     is_reconstructed: bool
 
 
+class DayLogRangeResponse(BaseModel):
+    """
+    Schema for a page of day logs within a date range.
+
+    `next_after` is the keyset cursor for the following page (pass it back as
+    `after`); it is null once the range has been fully returned.
+    """
+
+    items: list[DayLogResponse]
+    next_after: Optional[date] = None
+
+
+class DayLogBatchUpsert(BaseModel):
+    """Schema for creating/updating many day logs at once, keyed by date (request body)."""
+
+    logs: dict[date, DayLogCreate] = Field(min_length=1, max_length=MAX_BATCH_SIZE)
+
+
+class DayLogBatchResult(BaseModel):
+    """Per-date outcome of a batch upsert."""
+
+    date: date
+    status: str  # "upserted" | "rejected"
+    detail: Optional[str] = None
+    log: Optional[DayLogResponse] = None
+
+
+class DayLogBatchResponse(BaseModel):
+    """Schema for batch upsert responses (results ordered by date)."""
+
+    results: list[DayLogBatchResult]
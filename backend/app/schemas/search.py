@@ -0,0 +1,29 @@
+"""Full-text search schemas."""
+
+from __future__ import annotations
+
+from datetime import date
+from typing import Literal, Optional
+
+from pydantic import BaseModel
+
+
+class SearchResult(BaseModel):
+    """
+    One matching entity. `snippet` is a short excerpt with the matched terms
+    wrapped in `<b>...</b>`; `title` is set for notable events only.
+    """
+
+    type: Literal["daily_summary", "dream", "notable_event"]
+    id: str
+    date: date
+    title: Optional[str] = None
+    snippet: str
+    rank: float
+
+
+class SearchResponse(BaseModel):
+    """Search results, best match first."""
+
+    query: str
+    results: list[SearchResult]
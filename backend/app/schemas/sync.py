@@ -0,0 +1,129 @@
+"""Delta sync schemas."""
+
+from __future__ import annotations
+
+from datetime import date
+from typing import Annotated, Any, Literal, Optional, Union
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from app.schemas.daily_summary import DailySummaryBase
+from app.schemas.day_log import DayLogBase, DayLogPatch
+from app.schemas.dream import DreamUpsert
+from app.schemas.notable_event import NotableEventCreate
+
+MAX_SYNC_OPS = 500
+
+
+class SyncChange(BaseModel):
+    """One feed entry: the row as stored, or a tombstone (`{id, date}`) if deleted."""
+
+    seq: int
+    type: str
+    deleted: bool
+    data: dict[str, Any]
+
+
+class SyncFeedResponse(BaseModel):
+    """
+    A page of the change feed.
+
+    `next` is the `since` token for the following request; keep fetching while
+    `has_more` is true.
+    """
+
+    changes: list[SyncChange]
+    next: int
+    has_more: bool
+
+
+class SyncRowVersion(BaseModel):
+    """
+    Optimistic concurrency for date-keyed rows.
+
+    `base_seq` is the row's `seq` as the client last saw it (null: the client
+    has never seen the row).
+    """
+
+    base_seq: Optional[int] = Field(default=None, ge=1)
+
+
+class SyncPutDayLog(DayLogBase, SyncRowVersion):
+    """Replace a day log; conflicts unless the row is still at `base_seq`."""
+
+    op: Literal["put_day_log"]
+    date: date
+
+
+class SyncPatchDayLog(DayLogPatch, SyncRowVersion):
+    """Edit individual hours; without `base_seq` the edits merge into any version."""
+
+    op: Literal["patch_day_log"]
+    date: date
+
+
+class SyncPutDailySummary(DailySummaryBase, SyncRowVersion):
+    """Replace a daily summary; conflicts unless the row is still at `base_seq`."""
+
+    op: Literal["put_daily_summary"]
+    date: date
+
+
+class SyncPutDream(DreamUpsert, SyncRowVersion):
+    """Replace a dream entry; conflicts unless the row is still at `base_seq`."""
+
+    op: Literal["put_dream"]
+
+
+class SyncCreateEvent(NotableEventCreate):
+    """Create an event under a client-generated id (idempotent on retry)."""
+
+    op: Literal["create_event"]
+    id: UUID
+
+
+class SyncDeleteEvent(BaseModel):
+    """Delete an event (idempotent: an already deleted event is not an error)."""
+
+    op: Literal["delete_event"]
+    id: UUID
+
+
+SyncOp = Annotated[
+    Union[
+        SyncPutDayLog,
+        SyncPatchDayLog,
+        SyncPutDailySummary,
+        SyncPutDream,
+        SyncCreateEvent,
+        SyncDeleteEvent,
+    ],
+    Field(discriminator="op"),
+]
+
+
+class SyncPush(BaseModel):
+    """Offline writes, applied in order in a single transaction."""
+
+    ops: list[SyncOp] = Field(min_length=1, max_length=MAX_SYNC_OPS)
+
+
+class SyncOpResult(BaseModel):
+    """
+    Outcome of one op.
+
+    - applied: `seq` is the row's new version
+    - conflict: nothing was written; `seq` / `current` are the server's row (null if absent)
+    - rejected: nothing was written; `detail` says why
+    """
+
+    index: int
+    status: Literal["applied", "conflict", "rejected"]
+    detail: Optional[str] = None
+    seq: Optional[int] = None
+    current: Optional[dict[str, Any]] = None
+
+
+class SyncPushResponse(BaseModel):
+    results: list[SyncOpResult]
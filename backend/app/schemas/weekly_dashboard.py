@@ -29,7 +29,7 @@ class WeeklyInsights(BaseModel):
 
 
 class DreamMetrics(BaseModel):
-    """Counts for dream logging in the last 7 days."""
+    """Counts for dream logging in the dashboard window (last 7 days for /weekly)."""
 
     dream_days: int
     remembered_count: int
@@ -37,6 +37,8 @@ class DreamMetrics(BaseModel):
 
 
 class WeeklyDashboardResponse(BaseModel):
+    """Dashboard payload for `/dashboard/weekly` and `/dashboard/range`."""
+
     start_date: date
     end_date: date
     days: list[WeeklyDashboardDay]
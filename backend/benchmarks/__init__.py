@@ -0,0 +1,4 @@
+"""
+Benchmarks: synthetic history generator (`generate`) and load/latency
+harness (`harness`). Run from `backend/`, e.g. `python -m benchmarks.generate`.
+"""
@@ -0,0 +1,151 @@
+"""
+Seeded synthetic history generator.
+
+Creates N years of realistic day logs, daily summaries, dreams and notable
+events ending today in the configured (local) Postgres, loaded through the
+COPY-based bulk importer. The same `--seed` always produces the same data.
+
+  python -m benchmarks.generate --years 10 --seed 42 --reset
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from datetime import date, timedelta
+from typing import Any, Iterator
+
+import numpy as np
+from sqlalchemy import text
+
+from app.db.bulk_import import BulkImporter
+from app.db.migrate import upgrade
+from app.db.session import new_session
+from app.schemas.day_log import HOURS_IN_DAY, UNASSIGNED_CATEGORY
+
+# Category codes (see app/api/endpoints/categories.py).
+SLEEP, WORK, LEARNING, THINKING, EXERCISE, SOCIAL, LEISURE = 0, 1, 2, 3, 4, 5, 6
+PARTNER, FAMILY, ADMIN, TRAVEL, MISC = 7, 8, 9, 10, 11
+
+_WORDS = (
+    "walk coffee lake code review dinner friends rain sunset book gym train "
+    "meeting idea garden market music call family movie bike river project "
+    "deadline trip beach mountain kitchen letter museum concert quiet"
+).split()
+
+_TABLES = ("notable_events", "dreams", "daily_summaries", "day_log_stats", "day_logs")
+
+
+def _sentence(rng: np.random.Generator, words: int) -> str:
+    return " ".join(rng.choice(_WORDS, size=words)).capitalize() + "."
+
+
+def _day_hours(rng: np.random.Generator, day: date) -> list[int]:
+    """One plausible day: a sleep block, work on weekdays, filler elsewhere."""
+
+    hours = np.full(HOURS_IN_DAY, LEISURE, dtype=np.int64)
+    wake = int(rng.integers(6, 9))
+    bedtime = int(rng.integers(22, 25))
+    hours[:wake] = SLEEP
+    hours[bedtime:] = SLEEP
+    hours[wake] = MISC
+
+    if day.weekday() < 5:
+        hours[wake + 1] = TRAVEL
+        hours[9:17] = WORK
+        hours[12] = rng.choice([SOCIAL, MISC, WORK])
+        hours[17] = TRAVEL
+        evening = [EXERCISE, LEARNING, FAMILY, ADMIN, PARTNER, LEISURE]
+    else:
+        evening = [SOCIAL, FAMILY, EXERCISE, LEISURE, PARTNER, THINKING, ADMIN]
+
+    free = [h for h in range(wake + 1, bedtime) if hours[h] == LEISURE]
+    picks = rng.choice(evening, size=len(free))
+    hours[free] = picks
+
+    # Some hours are left unassigned, like real (imperfect) logging.
+    gaps = rng.random(HOURS_IN_DAY) < 0.04
+    hours[gaps] = UNASSIGNED_CATEGORY
+    return hours.tolist()
+
+
+def generate_records(years: int, seed: int, end: date) -> Iterator[dict[str, Any]]:
+    """Export-format records for `years` years ending at `end` (deterministic per seed)."""
+
+    rng = np.random.default_rng(seed)
+    start = end - timedelta(days=round(years * 365.25) - 1)
+    day = start
+    while day <= end:
+        if rng.random() < 0.92:
+            yield {"type": "day_log", "date": day, "hours": _day_hours(rng, day)}
+        if rng.random() < 0.6:
+            yield {
+                "type": "daily_summary",
+                "date": day,
+                "highlight": _sentence(rng, int(rng.integers(3, 9))),
+                "reflection": _sentence(rng, int(rng.integers(10, 40))),
+            }
+        if rng.random() < 0.5:
+            dream_state = int(rng.choice([0, 1, 2], p=[0.3, 0.4, 0.3]))
+            yield {
+                "type": "dream",
+                "date": day,
+                "dream_state": dream_state,
+                "description": _sentence(rng, 15) if dream_state == 2 else None,
+            }
+        for _ in range(int(rng.poisson(0.4))):
+            yield {
+                "type": "notable_event",
+                "date": day,
+                "title": _sentence(rng, int(rng.integers(2, 5))),
+                "description": _sentence(rng, 12) if rng.random() < 0.5 else None,
+                "category": int(rng.integers(0, 12)) if rng.random() < 0.8 else None,
+            }
+        day += timedelta(days=1)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Generate synthetic LifeGrid history.")
+    parser.add_argument("--years", type=float, default=10, help="years of history (default 10)")
+    parser.add_argument("--seed", type=int, default=42, help="random seed (default 42)")
+    parser.add_argument(
+        "--end", type=date.fromisoformat, default=None, help="last day (default today)"
+    )
+    parser.add_argument("--reset", action="store_true", help="truncate all LifeGrid tables first")
+    args = parser.parse_args(argv)
+
+    end = args.end or date.today()
+    upgrade()
+
+    started = time.perf_counter()
+    with new_session() as db:
+        if args.reset:
+            db.execute(text(f"TRUNCATE {', '.join(_TABLES)}"))
+
+        importer = BulkImporter(db, today=end)
+        for line_no, record in enumerate(generate_records(args.years, args.seed, end), start=1):
+            error = importer.add(line_no, record)
+            if error is not None:
+                raise RuntimeError(f"generated an invalid record: {error}")
+        imported, rejected = importer.merge()
+        if rejected:
+            raise RuntimeError(f"generated records were rejected: {rejected[:5]}")
+        db.commit()
+
+    print(
+        json.dumps(
+            {
+                "years": args.years,
+                "seed": args.seed,
+                "end": end.isoformat(),
+                "imported": imported,
+                "seconds": round(time.perf_counter() - started, 3),
+            }
+        )
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
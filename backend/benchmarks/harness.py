@@ -0,0 +1,323 @@
+"""
+Load / latency harness.
+
+Drives every API endpoint at a configurable concurrency and prints one JSON
+report: per scenario p50/p95/p99 latency, throughput, error count and DB
+queries per request, so runs can be diffed.
+
+By default the app is driven in-process (httpx ASGI transport) and statements
+are counted with a SQLAlchemy engine listener. With `--base-url` a running
+server is measured over HTTP instead (query counts are then reported as null).
+
+  python -m benchmarks.harness --requests 200 --concurrency 10 --output run.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import platform
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Any, Callable
+
+import httpx
+import numpy as np
+
+# (method, path, body) for one request, built per request from the RNG; the body
+# is sent as JSON, or as is when it is already bytes (imports), or omitted if None.
+RequestSpec = tuple[str, str, Any]
+
+# Words the synthetic generator writes into summaries, dreams and events.
+SEARCH_TERMS = ("lake", "coffee", "project", "friends", "rain")
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    build: Callable[[np.random.Generator], RequestSpec]
+
+
+def _scenarios(start: date, end: date) -> list[Scenario]:
+    span = (end - start).days
+
+    def day(rng: np.random.Generator) -> date:
+        return start + timedelta(days=int(rng.integers(0, span + 1)))
+
+    def hours(rng: np.random.Generator) -> list[int]:
+        return rng.integers(-1, 12, size=24).tolist()
+
+    def month(rng: np.random.Generator) -> tuple[date, date]:
+        first = day(rng)
+        return first, min(first + timedelta(days=30), end)
+
+    def week(rng: np.random.Generator) -> list[date]:
+        first = day(rng)
+        return [d for d in (first + timedelta(days=i) for i in range(7)) if d <= end]
+
+    def batch(rng: np.random.Generator) -> dict:
+        return {"logs": {d.isoformat(): {"hours": hours(rng)} for d in week(rng)}}
+
+    def hour_edits(rng: np.random.Generator) -> dict[str, int]:
+        indices = rng.choice(24, size=int(rng.integers(1, 5)), replace=False)
+        return {str(i): int(rng.integers(-1, 12)) for i in indices}
+
+    def sync_ops(rng: np.random.Generator) -> dict:
+        # One offline session's worth of writes: hour edits plus a new event.
+        ops: list[dict[str, Any]] = [
+            {"op": "patch_day_log", "date": d.isoformat(), "hours": hour_edits(rng)}
+            for d in week(rng)[:3]
+        ]
+        ops.append(
+            {
+                "op": "create_event",
+                "id": str(uuid.UUID(bytes=rng.bytes(16), version=4)),
+                "date": day(rng).isoformat(),
+                "title": "Benchmark event",
+                "category": 1,
+            }
+        )
+        return {"ops": ops}
+
+    def import_week(rng: np.random.Generator) -> bytes:
+        lines = (
+            json.dumps({"type": "day_log", "date": d.isoformat(), "hours": hours(rng)})
+            for d in week(rng)
+        )
+        return ("\n".join(lines) + "\n").encode()
+
+    def year(rng: np.random.Generator) -> int:
+        return int(rng.integers(start.year, end.year + 1))
+
+    def year_range(rng: np.random.Generator) -> tuple[date, date]:
+        first = date(year(rng), 1, 1)
+        return first, date(first.year, 12, 31)
+
+    return [
+        Scenario("health", lambda rng: ("GET", "/", None)),
+        Scenario("categories", lambda rng: ("GET", "/categories", None)),
+        Scenario("get_day_log", lambda rng: ("GET", f"/day-log/{day(rng)}", None)),
+        Scenario(
+            "put_day_log",
+            lambda rng: ("PUT", f"/day-log/{day(rng)}", {"hours": hours(rng)}),
+        ),
+        Scenario(
+            "list_day_logs_month",
+            lambda rng: ("GET", "/day-log?start={}&end={}".format(*month(rng)), None),
+        ),
+        Scenario(
+            "patch_day_log",
+            lambda rng: ("PATCH", f"/day-log/{day(rng)}", {"hours": hour_edits(rng)}),
+        ),
+        Scenario("put_day_log_batch_week", lambda rng: ("PUT", "/day-log/batch", batch(rng))),
+        Scenario("year_grid", lambda rng: ("GET", f"/day-log/grid?year={year(rng)}", None)),
+        Scenario("get_daily_summary", lambda rng: ("GET", f"/daily-summary/{day(rng)}", None)),
+        Scenario(
+            "put_daily_summary",
+            lambda rng: (
+                "PUT",
+                f"/daily-summary/{day(rng)}",
+                {"highlight": "Benchmark highlight", "reflection": "Benchmark reflection"},
+            ),
+        ),
+        Scenario("get_dream", lambda rng: ("GET", f"/dreams/{day(rng)}", None)),
+        Scenario(
+            "upsert_dream",
+            lambda rng: (
+                "POST",
+                "/dreams",
+                {"date": day(rng).isoformat(), "dream_state": int(rng.integers(0, 3))},
+            ),
+        ),
+        Scenario(
+            "list_events_month",
+            lambda rng: ("GET", "/events?start_date={}&end_date={}".format(*month(rng)), None),
+        ),
+        Scenario(
+            "create_event",
+            lambda rng: (
+                "POST",
+                "/events",
+                {"date": day(rng).isoformat(), "title": "Benchmark event", "category": 1},
+            ),
+        ),
+        Scenario("day_bundle", lambda rng: ("GET", f"/day/{day(rng)}", None)),
+        Scenario(
+            "day_bundles_month",
+            lambda rng: ("GET", "/day?start={}&end={}".format(*month(rng)), None),
+        ),
+        Scenario("dashboard_weekly", lambda rng: ("GET", "/dashboard/weekly", None)),
+        Scenario(
+            "dashboard_range_year",
+            lambda rng: (
+                "GET",
+                "/dashboard/range?start={}&end={}".format(*year_range(rng)),
+                None,
+            ),
+        ),
+        Scenario(
+            "search",
+            lambda rng: ("GET", f"/search?q={rng.choice(SEARCH_TERMS)}", None),
+        ),
+        Scenario(
+            "export_month",
+            lambda rng: ("GET", "/export?start={}&end={}".format(*month(rng)), None),
+        ),
+        Scenario("import_week", lambda rng: ("POST", "/import", import_week(rng))),
+        Scenario("sync_pull_first_page", lambda rng: ("GET", "/sync?since=0", None)),
+        Scenario("sync_push", lambda rng: ("POST", "/sync", sync_ops(rng))),
+        # GET /live is not a request/response endpoint (the stream never ends,
+        # and the in-process transport buffers whole responses), so it has no
+        # scenario; its cost shows up as NOTIFY work in the write scenarios.
+    ]
+
+
+class QueryCounter:
+    """Counts statements executed by the app's engines (in-process mode only)."""
+
+    def __init__(self) -> None:
+        from sqlalchemy import event
+
+        from app.core.config import DB_ASYNC
+        from app.db.session import get_async_engine, get_engine
+
+        self._lock = threading.Lock()
+        self.total = 0
+        engines = [get_engine()] + ([get_async_engine().sync_engine] if DB_ASYNC else [])
+        for target in engines:
+            event.listen(target, "before_cursor_execute", self._on_execute)
+
+    def _on_execute(self, *_: Any) -> None:
+        # Sync endpoints run in worker threads.
+        with self._lock:
+            self.total += 1
+
+
+async def _run_scenario(
+    client: httpx.AsyncClient,
+    scenario: Scenario,
+    requests: int,
+    concurrency: int,
+    seed: int,
+    counter: QueryCounter | None,
+) -> dict[str, Any]:
+    rng = np.random.default_rng(seed)
+    specs = [scenario.build(rng) for _ in range(requests)]
+    latencies: list[float] = []
+    errors = 0
+    queue = iter(specs)
+
+    async def worker() -> None:
+        nonlocal errors
+        for method, path, body in queue:
+            started = time.perf_counter()
+            try:
+                if isinstance(body, bytes):
+                    response = await client.request(method, path, content=body)
+                else:
+                    response = await client.request(method, path, json=body)
+                await response.aread()
+                failed = response.status_code >= 400
+            except httpx.HTTPError:
+                failed = True
+            latencies.append(time.perf_counter() - started)
+            errors += failed
+
+    queries_before = counter.total if counter else 0
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    latency_ms = np.array(latencies) * 1000
+    p50, p95, p99 = np.percentile(latency_ms, [50, 95, 99])
+    return {
+        "requests": requests,
+        "errors": errors,
+        "concurrency": concurrency,
+        "duration_s": round(elapsed, 4),
+        "throughput_rps": round(requests / elapsed, 2),
+        "latency_ms": {
+            "p50": round(float(p50), 3),
+            "p95": round(float(p95), 3),
+            "p99": round(float(p99), 3),
+            "mean": round(float(latency_ms.mean()), 3),
+            "max": round(float(latency_ms.max()), 3),
+        },
+        "db_queries_per_request": (
+            round((counter.total - queries_before) / requests, 2) if counter else None
+        ),
+    }
+
+
+async def run(args: argparse.Namespace) -> dict[str, Any]:
+    end = args.end or date.today()
+    start = end - timedelta(days=round(args.years * 365.25) - 1)
+    scenarios = [
+        s for s in _scenarios(start, end) if not args.only or s.name in args.only
+    ]
+
+    counter = None
+    if args.base_url:
+        client = httpx.AsyncClient(base_url=args.base_url, timeout=args.timeout)
+    else:
+        from app.main import create_app
+
+        counter = QueryCounter()
+        transport = httpx.ASGITransport(app=create_app())
+        client = httpx.AsyncClient(
+            transport=transport, base_url="http://bench", timeout=args.timeout
+        )
+
+    results: dict[str, Any] = {}
+    async with client:
+        for index, scenario in enumerate(scenarios):
+            if args.warmup:
+                await _run_scenario(client, scenario, args.warmup, 1, args.seed + index, None)
+            results[scenario.name] = await _run_scenario(
+                client, scenario, args.requests, args.concurrency, args.seed + index, counter
+            )
+
+    return {
+        "meta": {
+            "target": args.base_url or "in-process",
+            "requests_per_scenario": args.requests,
+            "concurrency": args.concurrency,
+            "warmup": args.warmup,
+            "seed": args.seed,
+            "history": {"start": start.isoformat(), "end": end.isoformat()},
+            "python": platform.python_version(),
+            "started_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        },
+        "scenarios": results,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="LifeGrid load / latency benchmark.")
+    parser.add_argument("--base-url", help="benchmark a running server instead of in-process")
+    parser.add_argument("--requests", type=int, default=200, help="requests per scenario")
+    parser.add_argument("--concurrency", type=int, default=10, help="concurrent clients")
+    parser.add_argument("--warmup", type=int, default=10, help="warm-up requests per scenario")
+    parser.add_argument("--seed", type=int, default=42, help="random seed for request parameters")
+    parser.add_argument("--years", type=float, default=10, help="history span to sample dates from")
+    parser.add_argument("--end", type=date.fromisoformat, default=None, help="last day of history")
+    parser.add_argument("--timeout", type=float, default=60.0, help="per-request timeout (s)")
+    parser.add_argument("--only", nargs="*", help="scenario names to run (default: all)")
+    parser.add_argument("--output", help="write the JSON report here instead of stdout")
+    args = parser.parse_args(argv)
+
+    report = json.dumps(asyncio.run(run(args)), indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(report + "\n")
+    else:
+        print(report)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
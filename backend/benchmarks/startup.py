@@ -0,0 +1,83 @@
+"""
+Cold-start benchmark.
+
+Starts N fresh interpreters that each import the app, build it and run its
+lifespan startup (what a new worker does before accepting traffic), and
+checks the median time to ready against STARTUP_BUDGET_MS. Exits 1 when over budget, so it
+can gate CI or a deploy.
+
+  python -m benchmarks.startup --runs 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+from app.core.config import STARTUP_BUDGET_MS
+
+# Runs in the child: import + factory + lifespan startup, timed from the first
+# line (interpreter start-up itself is measured by the parent).
+_CHILD = """
+import asyncio, json, time
+started = time.perf_counter()
+from app.main import create_app
+imported = time.perf_counter()
+app = create_app()
+
+async def boot():
+    async with app.router.lifespan_context(app):
+        return time.perf_counter()
+
+ready = asyncio.run(boot())
+print(json.dumps({"import_ms": (imported - started) * 1000, "ready_ms": (ready - started) * 1000}))
+"""
+
+
+def _percentiles(values: list[float]) -> dict[str, float]:
+    data = np.array(values)
+    return {
+        "p50": round(float(np.percentile(data, 50)), 2),
+        "max": round(float(data.max()), 2),
+    }
+
+
+def measure(runs: int) -> dict:
+    imports, ready, process = [], [], []
+    for _ in range(runs):
+        started = time.perf_counter()
+        output = subprocess.run(
+            [sys.executable, "-c", _CHILD], check=True, capture_output=True, text=True
+        ).stdout
+        process.append((time.perf_counter() - started) * 1000)
+        timings = json.loads(output.strip().splitlines()[-1])
+        imports.append(timings["import_ms"])
+        ready.append(timings["ready_ms"])
+
+    return {
+        "runs": runs,
+        "budget_ms": STARTUP_BUDGET_MS,
+        "import_ms": _percentiles(imports),
+        "ready_ms": _percentiles(ready),
+        "process_ms": _percentiles(process),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="LifeGrid worker cold-start benchmark.")
+    parser.add_argument("--runs", type=int, default=10, help="fresh interpreters to start")
+    args = parser.parse_args(argv)
+
+    report = measure(args.runs)
+    report["within_budget"] = report["ready_ms"]["p50"] <= STARTUP_BUDGET_MS
+    print(json.dumps(report, indent=2))
+    return 0 if report["within_budget"] else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -3,11 +3,22 @@ Database configuration for LifeGrid MVP.
 
 Uses SQLAlchemy with PostgreSQL. Connection string is read from environment
 variable DATABASE_URL, with a sensible local default for development.
+
+`engine` and `SessionLocal` (the app's `sessionmaker`, so `SessionLocal()` and
+`SessionLocal.configure(...)` work as before) are resolved on first access: the
+engine is built lazily, see app.db.session.
 """
 
 from app.core.config import DATABASE_URL
 from app.db.base import Base
-from app.db.session import SessionLocal, engine, get_db
+from app.db.session import get_db, get_engine, get_session_factory
 
 __all__ = ["DATABASE_URL", "Base", "engine", "SessionLocal", "get_db"]
 
+
+def __getattr__(name: str):
+    if name == "engine":
+        return get_engine()
+    if name == "SessionLocal":
+        return get_session_factory()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,50 @@
+"""
+LifeGrid bulk import CLI.
+
+Loads a `GET /export` file (NDJSON or CSV, optionally gzip-compressed) straight
+into the database through Postgres COPY, without going through the HTTP API:
+
+  python import_data.py lifegrid-export.ndjson
+  python import_data.py lifegrid-export.csv.gz --format csv
+
+Rejected records are printed to stderr; the summary is printed to stdout.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import json
+import sys
+
+from app.db.bulk_import import run_import
+from app.db.session import new_session
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Bulk-import a LifeGrid export file.")
+    parser.add_argument("path", help="export file (.ndjson / .csv, optionally .gz)")
+    parser.add_argument(
+        "--format",
+        choices=("ndjson", "csv"),
+        help="file format (default: from the file extension, else ndjson)",
+    )
+    args = parser.parse_args(argv)
+
+    fmt = args.format or ("csv" if ".csv" in args.path else "ndjson")
+    opener = gzip.open if args.path.endswith(".gz") else open
+
+    rejected = 0
+    with opener(args.path, "rt", encoding="utf-8", newline="") as lines, new_session() as db:
+        for entry in run_import(db, lines, fmt):
+            if "summary" in entry:
+                print(json.dumps(entry["summary"]))
+            else:
+                rejected += 1
+                print(json.dumps(entry), file=sys.stderr)
+
+    return 1 if rejected else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,11 +1,13 @@
 """
 LifeGrid backend entrypoint.
 
-This file is intentionally tiny: it re-exports the FastAPI app from `app.main`
-so your existing command keeps working:
+This file is intentionally tiny: it builds the FastAPI app with the factory in
+`app.main` (which builds nothing at import) so your existing command keeps working:
 
   uvicorn main:app --reload
 """
 
-from app.main import app  # noqa: F401
+from app.main import create_app
+
+app = create_app()
 
@@ -0,0 +1,74 @@
+"""Baseline schema.
+
+The tables and indexes as the original per-boot `create_all` built them.
+Every statement is IF NOT EXISTS, so databases created that way are adopted
+as they are; later revisions add what the models gained since.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+_TABLES = (
+    """
+    CREATE TABLE IF NOT EXISTS day_logs (
+        id UUID PRIMARY KEY,
+        date DATE NOT NULL,
+        hours SMALLINT[] NOT NULL,
+        is_reconstructed BOOLEAN NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS daily_summaries (
+        id UUID PRIMARY KEY,
+        date DATE NOT NULL,
+        highlight TEXT,
+        reflection TEXT
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS dreams (
+        id UUID PRIMARY KEY,
+        date DATE NOT NULL,
+        dream_state SMALLINT NOT NULL,
+        description TEXT,
+        created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
+        updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now()
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS notable_events (
+        id UUID PRIMARY KEY,
+        date DATE NOT NULL,
+        title TEXT NOT NULL,
+        description TEXT,
+        category SMALLINT,
+        created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now()
+    )
+    """,
+)
+
+_INDEXES = (
+    "CREATE UNIQUE INDEX IF NOT EXISTS ix_day_logs_date ON day_logs (date)",
+    "CREATE UNIQUE INDEX IF NOT EXISTS ix_daily_summaries_date ON daily_summaries (date)",
+    "CREATE UNIQUE INDEX IF NOT EXISTS ix_dreams_date ON dreams (date)",
+    "CREATE INDEX IF NOT EXISTS ix_notable_events_date ON notable_events (date)",
+)
+
+
+def upgrade() -> None:
+    for statement in _TABLES + _INDEXES:
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE IF EXISTS notable_events, dreams, daily_summaries, day_logs")
@@ -0,0 +1,56 @@
+"""Per-day category rollups.
+
+- the day_log_stats table (12 category counts, unassigned hours, variance)
+- rollups for day logs written before the table existed
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+_CREATE_DAY_LOG_STATS = """
+    CREATE TABLE IF NOT EXISTS day_log_stats (
+        date DATE PRIMARY KEY,
+        counts SMALLINT[] NOT NULL,
+        unassigned SMALLINT NOT NULL,
+        variance DOUBLE PRECISION NOT NULL
+    )
+"""
+
+# Same rules as app.db.repository: first 24 hours only, codes outside 0..11
+# are unassigned.
+_BACKFILL_DAY_LOG_STATS = """
+    INSERT INTO day_log_stats (date, counts, unassigned, variance)
+    SELECT
+        l.date,
+        array_agg(c.hours::smallint ORDER BY c.category),
+        (cardinality(l.hours[1:24]) - sum(c.hours))::smallint,
+        var_pop(c.hours)
+    FROM day_logs AS l
+    CROSS JOIN LATERAL (
+        SELECT k.category, count(h.category) AS hours
+        FROM generate_series(0, 11) AS k(category)
+        LEFT JOIN unnest(l.hours[1:24]) AS h(category) ON h.category = k.category
+        GROUP BY k.category
+    ) AS c
+    WHERE NOT EXISTS (SELECT 1 FROM day_log_stats AS s WHERE s.date = l.date)
+    GROUP BY l.id
+"""
+
+
+def upgrade() -> None:
+    op.execute(_CREATE_DAY_LOG_STATS)
+    op.execute(_BACKFILL_DAY_LOG_STATS)
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE IF EXISTS day_log_stats")
@@ -0,0 +1,33 @@
+"""Row versions for conditional GETs.
+
+`updated_at` on day_logs and daily_summaries (dreams already have one); the
+ETags of their GET endpoints are derived from it.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+_TABLES = ("day_logs", "daily_summaries")
+
+
+def upgrade() -> None:
+    for table in _TABLES:
+        op.execute(
+            f"ALTER TABLE {table} ADD COLUMN IF NOT EXISTS "
+            "updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now()"
+        )
+
+
+def downgrade() -> None:
+    for table in _TABLES:
+        op.execute(f"ALTER TABLE {table} DROP COLUMN IF EXISTS updated_at")
@@ -0,0 +1,32 @@
+"""Events listing index.
+
+`(date, created_at, id)` matches the keyset order of GET /events, so pages are
+read without a sort; it also serves every date lookup, replacing
+ix_notable_events_date.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_notable_events_date_created_at_id "
+        "ON notable_events (date, created_at, id)"
+    )
+    op.execute("DROP INDEX IF EXISTS ix_notable_events_date")
+
+
+def downgrade() -> None:
+    op.execute("CREATE INDEX IF NOT EXISTS ix_notable_events_date ON notable_events (date)")
+    op.execute("DROP INDEX IF EXISTS ix_notable_events_date_created_at_id")
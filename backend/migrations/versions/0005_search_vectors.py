@@ -0,0 +1,49 @@
+"""Full-text search.
+
+Stored generated `search_vector` columns (title / highlight weighted A, the
+rest B) on daily_summaries, dreams and notable_events, each with a GIN index.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+# table -> generated tsvector expression (frozen copies of the model columns)
+_SEARCH_VECTORS = {
+    "daily_summaries": (
+        "setweight(to_tsvector('english', coalesce(highlight, '')), 'A') || "
+        "setweight(to_tsvector('english', coalesce(reflection, '')), 'B')"
+    ),
+    "dreams": "setweight(to_tsvector('english', coalesce(description, '')), 'B')",
+    "notable_events": (
+        "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+        "setweight(to_tsvector('english', coalesce(description, '')), 'B')"
+    ),
+}
+
+
+def upgrade() -> None:
+    for table, expression in _SEARCH_VECTORS.items():
+        op.execute(
+            f"ALTER TABLE {table} ADD COLUMN IF NOT EXISTS search_vector TSVECTOR "
+            f"GENERATED ALWAYS AS ({expression}) STORED"
+        )
+        op.execute(
+            f"CREATE INDEX IF NOT EXISTS ix_{table}_search_vector "
+            f"ON {table} USING gin (search_vector)"
+        )
+
+
+def downgrade() -> None:
+    for table in _SEARCH_VECTORS:
+        op.execute(f"DROP INDEX IF EXISTS ix_{table}_search_vector")
+        op.execute(f"ALTER TABLE {table} DROP COLUMN IF EXISTS search_vector")
@@ -0,0 +1,114 @@
+"""Delta sync change feed.
+
+- `sync_change_seq`: one global sequence for every change
+- `change_seq` on day_logs / daily_summaries / dreams / notable_events, assigned
+  by the `lifegrid_track_change` BEFORE INSERT OR UPDATE trigger
+- `updated_at` on notable_events
+- `sync_tombstones`, filled by the `lifegrid_record_tombstone` AFTER DELETE trigger
+
+day_log_stats is a rollup of day_logs and is not synced (clients derive it).
+Both triggers take a shared advisory lock for the feed horizon (dropped in 0008).
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+# Frozen copy of app.core.sync.SYNC_LOCK_KEY.
+_SYNC_LOCK_KEY = 0x4C475359
+
+# table -> sync entity type recorded in tombstones
+_TABLES = {
+    "day_logs": "day_log",
+    "daily_summaries": "daily_summary",
+    "dreams": "dream",
+    "notable_events": "notable_event",
+}
+
+_FUNCTIONS = (
+    f"""
+    CREATE OR REPLACE FUNCTION lifegrid_track_change() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        PERFORM pg_advisory_xact_lock_shared({_SYNC_LOCK_KEY});
+        NEW.change_seq := nextval('sync_change_seq');
+        RETURN NEW;
+    END
+    $$
+    """,
+    f"""
+    CREATE OR REPLACE FUNCTION lifegrid_record_tombstone() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        PERFORM pg_advisory_xact_lock_shared({_SYNC_LOCK_KEY});
+        INSERT INTO sync_tombstones (change_seq, entity, id, date)
+        VALUES (nextval('sync_change_seq'), TG_ARGV[0], OLD.id, OLD.date);
+        RETURN OLD;
+    END
+    $$
+    """,
+)
+
+
+def upgrade() -> None:
+    op.execute("CREATE SEQUENCE IF NOT EXISTS sync_change_seq")
+    op.execute(
+        "ALTER TABLE notable_events ADD COLUMN IF NOT EXISTS "
+        "updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now()"
+    )
+    op.execute(
+        """
+        CREATE TABLE IF NOT EXISTS sync_tombstones (
+            change_seq BIGINT PRIMARY KEY,
+            entity TEXT NOT NULL,
+            id UUID NOT NULL,
+            date DATE NOT NULL,
+            deleted_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now()
+        )
+        """
+    )
+    for statement in _FUNCTIONS:
+        op.execute(statement)
+
+    for table, entity in _TABLES.items():
+        # Existing rows enter the feed once, before the trigger exists.
+        op.execute(f"ALTER TABLE {table} ADD COLUMN IF NOT EXISTS change_seq BIGINT")
+        op.execute(
+            f"UPDATE {table} SET change_seq = nextval('sync_change_seq') "
+            "WHERE change_seq IS NULL"
+        )
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN change_seq SET NOT NULL")
+        op.execute(
+            f"CREATE INDEX IF NOT EXISTS ix_{table}_change_seq ON {table} (change_seq)"
+        )
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_track_change ON {table}")
+        op.execute(
+            f"CREATE TRIGGER {table}_track_change BEFORE INSERT OR UPDATE ON {table} "
+            "FOR EACH ROW EXECUTE FUNCTION lifegrid_track_change()"
+        )
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_record_tombstone ON {table}")
+        op.execute(
+            f"CREATE TRIGGER {table}_record_tombstone AFTER DELETE ON {table} "
+            f"FOR EACH ROW EXECUTE FUNCTION lifegrid_record_tombstone('{entity}')"
+        )
+
+
+def downgrade() -> None:
+    for table in _TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_record_tombstone ON {table}")
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_track_change ON {table}")
+        op.execute(f"ALTER TABLE {table} DROP COLUMN IF EXISTS change_seq")
+    op.execute("DROP FUNCTION IF EXISTS lifegrid_record_tombstone()")
+    op.execute("DROP FUNCTION IF EXISTS lifegrid_track_change()")
+    op.execute("DROP TABLE IF EXISTS sync_tombstones")
+    op.execute("ALTER TABLE notable_events DROP COLUMN IF EXISTS updated_at")
+    op.execute("DROP SEQUENCE IF EXISTS sync_change_seq")
@@ -0,0 +1,126 @@
+"""Packed day log hours.
+
+SQL helpers that work on either storage of `day_logs.hours` (SMALLINT[] or
+BYTEA with two 4-bit hour codes per byte, see app/core/grid.py):
+
+- lifegrid_pack_hours(smallint[]) -> bytea / lifegrid_unpack_hours(bytea) -> smallint[]
+- lifegrid_hours(hours) -> smallint[]: the hours of a row in either storage
+- lifegrid_set_hours(hours, indices, categories): the same storage with the
+  0-based `indices` set to `categories`
+
+The column itself is left alone, so this revision yields the same schema
+everywhere; the storage is switched outside the revision history with
+`python -m app.db.migrate --hours-storage ...`.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-18
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "0007"
+down_revision = "0006"
+branch_labels = None
+depends_on = None
+
+# Codes: 0..11 categories, 14 (0xE) unassigned, 15 (0xF) padding after an odd
+# trailing hour. Frozen copies of app.core.grid's packing rules.
+_FUNCTIONS = (
+    """
+    CREATE OR REPLACE FUNCTION lifegrid_pack_hours(hours smallint[]) RETURNS bytea
+    LANGUAGE sql IMMUTABLE STRICT PARALLEL SAFE AS $$
+        SELECT decode(coalesce(string_agg(
+            to_hex(CASE WHEN hours[2 * k + 1] BETWEEN 0 AND 11 THEN hours[2 * k + 1] ELSE 14 END)
+            || to_hex(CASE
+                WHEN 2 * k + 2 > cardinality(hours) THEN 15
+                WHEN hours[2 * k + 2] BETWEEN 0 AND 11 THEN hours[2 * k + 2]
+                ELSE 14
+            END),
+            '' ORDER BY k
+        ), ''), 'hex')
+        FROM generate_series(0, (cardinality(hours) + 1) / 2 - 1) AS k
+    $$
+    """,
+    """
+    CREATE OR REPLACE FUNCTION lifegrid_unpack_hours(packed bytea) RETURNS smallint[]
+    LANGUAGE sql IMMUTABLE STRICT PARALLEL SAFE AS $$
+        SELECT coalesce(
+            array_agg((CASE WHEN code = 14 THEN -1 ELSE code END)::smallint ORDER BY i),
+            '{}'
+        )
+        FROM (
+            SELECT i, CASE WHEN i % 2 = 0
+                THEN get_byte(packed, i / 2) >> 4
+                ELSE get_byte(packed, i / 2) & 15
+            END AS code
+            FROM generate_series(0, 2 * length(packed) - 1) AS i
+        ) AS c
+        WHERE code <> 15
+    $$
+    """,
+    """
+    CREATE OR REPLACE FUNCTION lifegrid_hours(hours smallint[]) RETURNS smallint[]
+    LANGUAGE sql IMMUTABLE STRICT PARALLEL SAFE AS $$ SELECT hours $$
+    """,
+    """
+    CREATE OR REPLACE FUNCTION lifegrid_hours(hours bytea) RETURNS smallint[]
+    LANGUAGE sql IMMUTABLE STRICT PARALLEL SAFE AS $$ SELECT lifegrid_unpack_hours(hours) $$
+    """,
+    """
+    CREATE OR REPLACE FUNCTION lifegrid_set_hours(
+        hours smallint[], indices integer[], categories smallint[]
+    ) RETURNS smallint[]
+    LANGUAGE sql IMMUTABLE STRICT PARALLEL SAFE AS $$
+        SELECT array_agg(coalesce(e.category, hours[i], -1::smallint) ORDER BY i)
+        FROM generate_series(
+            1, greatest(cardinality(hours), (SELECT max(x) + 1 FROM unnest(indices) AS x))
+        ) AS i
+        LEFT JOIN unnest(indices, categories) AS e(idx, category) ON e.idx + 1 = i
+    $$
+    """,
+    """
+    CREATE OR REPLACE FUNCTION lifegrid_set_hours(
+        hours bytea, indices integer[], categories smallint[]
+    ) RETURNS bytea
+    LANGUAGE sql IMMUTABLE STRICT PARALLEL SAFE AS $$
+        SELECT lifegrid_pack_hours(
+            lifegrid_set_hours(lifegrid_unpack_hours(hours), indices, categories)
+        )
+    $$
+    """,
+)
+
+# Before the helpers go, a column switched to packed storage is unpacked back
+# to the SMALLINT[] that revision 0006 defines.
+_UNPACK_COLUMN = """
+DO $$
+BEGIN
+    IF (
+        SELECT data_type FROM information_schema.columns
+        WHERE table_schema = current_schema()
+            AND table_name = 'day_logs' AND column_name = 'hours'
+    ) = 'bytea' THEN
+        ALTER TABLE day_logs ALTER COLUMN hours TYPE SMALLINT[]
+            USING lifegrid_unpack_hours(hours);
+    END IF;
+END
+$$
+"""
+
+
+def upgrade() -> None:
+    for statement in _FUNCTIONS:
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    op.execute(_UNPACK_COLUMN)
+    op.execute("DROP FUNCTION IF EXISTS lifegrid_set_hours(bytea, integer[], smallint[])")
+    op.execute("DROP FUNCTION IF EXISTS lifegrid_set_hours(smallint[], integer[], smallint[])")
+    op.execute("DROP FUNCTION IF EXISTS lifegrid_hours(bytea)")
+    op.execute("DROP FUNCTION IF EXISTS lifegrid_hours(smallint[])")
+    op.execute("DROP FUNCTION IF EXISTS lifegrid_unpack_hours(bytea)")
+    op.execute("DROP FUNCTION IF EXISTS lifegrid_pack_hours(smallint[])")
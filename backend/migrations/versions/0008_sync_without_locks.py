@@ -0,0 +1,62 @@
+"""Delta sync triggers without the advisory lock.
+
+The change feed no longer waits for in-flight writers behind an exclusive
+advisory lock (see app/core/sync.py), so the triggers stop taking it shared.
+`lifegrid_track_change` instead makes sure the transaction has its id before
+drawing a sequence number, which is what the lock-free horizon relies on.
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-18
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "0008"
+down_revision = "0007"
+branch_labels = None
+depends_on = None
+
+# Frozen copy of the lock key 0006 used (for the downgrade).
+_SYNC_LOCK_KEY = 0x4C475359
+
+
+def _track_change(before_seq: str) -> str:
+    return f"""
+    CREATE OR REPLACE FUNCTION lifegrid_track_change() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        PERFORM {before_seq};
+        NEW.change_seq := nextval('sync_change_seq');
+        RETURN NEW;
+    END
+    $$
+    """
+
+
+def _record_tombstone(before_seq: str) -> str:
+    return f"""
+    CREATE OR REPLACE FUNCTION lifegrid_record_tombstone() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        PERFORM {before_seq};
+        INSERT INTO sync_tombstones (change_seq, entity, id, date)
+        VALUES (nextval('sync_change_seq'), TG_ARGV[0], OLD.id, OLD.date);
+        RETURN OLD;
+    END
+    $$
+    """
+
+
+def upgrade() -> None:
+    # BEFORE triggers run ahead of the row write that would assign the id.
+    op.execute(_track_change("pg_current_xact_id()"))
+    op.execute(_record_tombstone("pg_current_xact_id()"))
+
+
+def downgrade() -> None:
+    lock = f"pg_advisory_xact_lock_shared({_SYNC_LOCK_KEY})"
+    op.execute(_track_change(lock))
+    op.execute(_record_tombstone(lock))
@@ -0,0 +1,55 @@
+"""Shared fixtures."""
+
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import ArgumentError, OperationalError
+
+from app.core import config
+
+
+@pytest.fixture(scope="session")
+def database():
+    """The configured database (migrated); tests using it are skipped when it is not set up."""
+
+    missing = [
+        name
+        for name, value in (
+            ("user", config.USER),
+            ("host", config.HOST),
+            ("port", config.PORT),
+            ("dbname", config.DBNAME),
+        )
+        if not value
+    ]
+    if missing:
+        pytest.skip(f"database not configured: {', '.join(missing)} unset")
+
+    from app.db.session import get_engine
+
+    try:
+        with get_engine().connect() as connection:
+            connection.execute(text("SELECT 1 FROM day_logs LIMIT 1"))
+    except OperationalError as exc:
+        pytest.skip(f"database unavailable: {exc.orig}")
+    except (ArgumentError, ValueError) as exc:
+        pytest.skip(f"database misconfigured: {exc}")
+    return get_engine()
+
+
+@pytest.fixture
+def db(database):
+    """A session on the configured database; everything it writes (commits too) is rolled back."""
+
+    from app.db.session import get_session_factory
+
+    connection = database.connect()
+    transaction = connection.begin()
+    session = get_session_factory()(bind=connection, join_transaction_mode="create_savepoint")
+    try:
+        yield session
+    finally:
+        session.close()
+        transaction.rollback()
+        connection.close()
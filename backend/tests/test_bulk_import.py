@@ -0,0 +1,67 @@
+import json
+import uuid
+from datetime import date, datetime, timezone
+
+from sqlalchemy import select
+
+from app.db.bulk_import import run_import
+from app.models import DailySummary, DayLog, NotableEvent
+
+TODAY = date(2026, 1, 1)
+
+
+def _import(db, *records):
+    lines = [json.dumps(record) + "\n" for record in records]
+    return list(run_import(db, lines, "ndjson", today=TODAY))
+
+
+def test_import_merges_the_last_record_per_date(db):
+    report = _import(
+        db,
+        {"type": "day_log", "date": "1901-01-01", "hours": [0] * 24},
+        {"type": "day_log", "date": "1901-01-01", "hours": [1] * 24},
+        {"type": "day_log", "date": "1901-01-02", "hours": [0] * 23},
+        {
+            "type": "notable_event",
+            "date": "1901-01-01",
+            "title": " Trip ",
+            "created_at": "1901-01-01T09:30:00+00:00",
+        },
+    )
+
+    assert [(entry["line"], entry["type"]) for entry in report[:-1]] == [(3, "day_log")]
+    assert report[-1] == {
+        "summary": {
+            "imported": {"day_log": 1, "daily_summary": 0, "dream": 0, "notable_event": 1},
+            "rejected": 1,
+        }
+    }
+    hours = db.execute(select(DayLog.hours).where(DayLog.date == date(1901, 1, 1))).scalar_one()
+    assert hours == [1] * 24
+    event = db.execute(
+        select(NotableEvent.title, NotableEvent.created_at).where(
+            NotableEvent.date == date(1901, 1, 1)
+        )
+    ).one()
+    assert event.title == "Trip"
+    assert event.created_at == datetime(1901, 1, 1, 9, 30, tzinfo=timezone.utc)
+
+
+def test_import_rejects_an_id_of_another_date(db):
+    summary_id = uuid.uuid4()
+    db.add(DailySummary(id=summary_id, date=date(1901, 1, 1)))
+    db.flush()
+
+    report = _import(
+        db,
+        {"type": "daily_summary", "id": str(summary_id), "date": "1901-01-02", "highlight": "b"},
+    )
+
+    assert report[0] == {
+        "line": 1,
+        "type": "daily_summary",
+        "error": "id already belongs to another date",
+    }
+    assert report[-1]["summary"]["rejected"] == 1
+    dates = db.execute(select(DailySummary.date).where(DailySummary.id == summary_id)).scalars()
+    assert list(dates) == [date(1901, 1, 1)]
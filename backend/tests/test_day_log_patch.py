@@ -0,0 +1,38 @@
+from datetime import date
+
+from sqlalchemy import select
+
+from app.db.repository import patch_day_log
+from app.models import DayLogStats
+
+DAY = date(1901, 1, 1)
+
+
+def _stats(db):
+    return db.execute(
+        select(DayLogStats.counts, DayLogStats.unassigned).where(DayLogStats.date == DAY)
+    ).one()
+
+
+def test_patch_creates_a_missing_day_unassigned(db):
+    row = patch_day_log(db, DAY, {9: 1, 10: 1}, is_reconstructed=True)
+
+    assert row.hours == [-1] * 9 + [1, 1] + [-1] * 13
+    assert row.is_reconstructed is True
+    counts, unassigned = _stats(db)
+    assert counts == [0, 2] + [0] * 10
+    assert unassigned == 22
+
+
+def test_patch_only_assigns_the_edited_hours(db):
+    first = patch_day_log(db, DAY, {hour: 0 for hour in range(8)}, is_reconstructed=True)
+    second = patch_day_log(db, DAY, {7: 3, 8: 3}, is_reconstructed=False)
+
+    assert second.id == first.id
+    assert second.hours == [0] * 7 + [3, 3] + [-1] * 15
+    assert second.is_reconstructed is False
+    assert second.change_seq > first.change_seq
+    assert second.updated_at >= first.updated_at
+    counts, unassigned = _stats(db)
+    assert counts == [7, 0, 0, 2] + [0] * 8
+    assert unassigned == 15
@@ -0,0 +1,31 @@
+from datetime import date, datetime, timezone
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.dialects import postgresql
+
+from app.api.endpoints.events import _encode_cursor, _keyset_after
+
+
+def test_cursor_round_trip():
+    event = SimpleNamespace(
+        date=date(2026, 1, 4),
+        created_at=datetime(2026, 1, 4, 9, 30, tzinfo=timezone.utc),
+        id=uuid4(),
+    )
+    cursor = _encode_cursor(event)
+    assert "=" not in cursor
+
+    params = _keyset_after(cursor).compile(dialect=postgresql.dialect()).params
+    assert sorted(map(str, params.values())) == sorted(
+        map(str, (event.date, event.created_at, event.id))
+    )
+
+
+@pytest.mark.parametrize("cursor", ["not base64!", "bm9waXBlcw", "YXxifGM"])
+def test_invalid_cursor(cursor):
+    with pytest.raises(HTTPException) as exc:
+        _keyset_after(cursor)
+    assert exc.value.status_code == 400
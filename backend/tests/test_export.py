@@ -0,0 +1,27 @@
+import pytest
+from starlette.requests import Request
+
+from app.api.endpoints.export import _accepts_gzip
+
+
+def _request(accept_encoding):
+    headers = [] if accept_encoding is None else [(b"accept-encoding", accept_encoding.encode())]
+    return Request({"type": "http", "headers": headers})
+
+
+@pytest.mark.parametrize(
+    "accept_encoding, expected",
+    [
+        ("gzip, deflate, br", True),
+        ("br;q=1.0, GZIP;q=0.5", True),
+        ("*", True),
+        ("gzip;q=0", False),
+        ("gzip; q=0.000, *", False),
+        ("*;q=0", False),
+        ("deflate", False),
+        ("", False),
+        (None, False),
+    ],
+)
+def test_accepts_gzip(accept_encoding, expected):
+    assert _accepts_gzip(_request(accept_encoding)) is expected
@@ -0,0 +1,56 @@
+from datetime import date
+
+import numpy as np
+
+from app.core.grid import (
+    GRID_HEADER,
+    dense_hours_matrix,
+    hours_rollup,
+    pack_hours,
+    pack_hours_grid,
+    unpack_hours,
+    unpack_hours_grid,
+)
+
+
+def test_pack_hours_round_trip():
+    hours = [(i % 13) - 1 for i in range(24)]
+    packed = pack_hours(hours)
+    assert len(packed) == 12
+    assert unpack_hours(packed) == hours
+
+
+def test_pack_hours_odd_length_and_unknown_codes():
+    packed = pack_hours([3, 42, -7])
+    assert packed == bytes([0x3E, 0xEF])
+    assert unpack_hours(packed) == [3, -1, -1]
+    assert unpack_hours(pack_hours([])) == []
+
+
+class _Row:
+    def __init__(self, day, hours):
+        self.date = day
+        self.hours = hours
+
+
+def test_hours_grid_round_trip():
+    start = date(2026, 1, 1)
+    rows = [_Row(date(2026, 1, 1), [0] * 12 + [-1] * 12), _Row(date(2026, 1, 3), [11] * 24)]
+    matrix, has_log = dense_hours_matrix(start, 3, rows)
+
+    data = pack_hours_grid(start, matrix, has_log)
+    assert len(data) == GRID_HEADER.size + 3 * 12
+
+    decoded_start, decoded, decoded_has_log = unpack_hours_grid(data)
+    assert decoded_start == start
+    assert decoded_has_log.tolist() == [True, False, True]
+    assert np.array_equal(decoded, matrix)
+
+
+def test_hours_rollup():
+    counts, unassigned, variance = hours_rollup([[0] * 6 + [1] * 6 + [-1] * 12, [-1] * 24])
+
+    assert counts[0] == [6, 6] + [0] * 10
+    assert unassigned == [12, 24]
+    assert variance[0] == np.var([6, 6] + [0] * 10)
+    assert variance[1] == 0.0
@@ -0,0 +1,31 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+
+from app.db.query_stats import instrument_engine, query_budget
+
+
+def test_query_budget_counts_and_fails():
+    engine = create_engine("sqlite://")
+    instrument_engine(engine)
+
+    with engine.connect() as connection:
+        with query_budget(2) as stats:
+            connection.execute(text("SELECT 1"))
+            connection.execute(text("SELECT 1"))
+        assert stats.count == 2
+        assert stats.statements["SELECT 1"] == 2
+
+        with pytest.raises(AssertionError, match="budget 1"):
+            with query_budget(1):
+                connection.execute(text("SELECT 1"))
+                connection.execute(text("SELECT 2"))
+
+
+def test_day_log_range_is_one_query(database):
+    from app.main import create_app
+
+    client = TestClient(create_app())
+    with query_budget(1):
+        response = client.get("/day-log", params={"start": "2026-01-01", "end": "2026-01-31"})
+    assert response.status_code == 200
@@ -0,0 +1,146 @@
+import uuid
+from datetime import date
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+from app.api.endpoints import sync
+from app.db.sync import HorizonTracker, change_feed, last_change_seq, sync_horizon
+from app.schemas import SyncPush
+
+TODAY = date(2026, 1, 1)
+DAY = date(1901, 1, 1)
+
+
+@pytest.fixture
+def stored_row(monkeypatch):
+    """Make `lock_sync_row` return the given row (None: no stored row)."""
+
+    def use(row):
+        monkeypatch.setattr(sync, "lock_sync_row", lambda db, entity, key, value: row)
+
+    return use
+
+
+def test_conflict_same_version_applies(stored_row):
+    stored_row(SimpleNamespace(change_seq=7, data={}))
+    assert sync._conflict(None, "day_log", "date", None, 7, merge=False) is None
+
+
+def test_conflict_new_row_applies(stored_row):
+    stored_row(None)
+    assert sync._conflict(None, "day_log", "date", None, None, merge=False) is None
+
+
+def test_conflict_moved_row(stored_row):
+    stored_row(SimpleNamespace(change_seq=9, data={"hours": []}))
+    result = sync._conflict(None, "day_log", "date", None, 7, merge=False)
+    assert result["status"] == "conflict"
+    assert result["seq"] == 9
+    assert result["current"] == {"hours": []}
+
+
+def test_conflict_unseen_existing_row(stored_row):
+    stored_row(SimpleNamespace(change_seq=9, data={}))
+    assert sync._conflict(None, "day_log", "date", None, None, merge=False)["seq"] == 9
+    # Merging edits apply on top of any version.
+    assert sync._conflict(None, "day_log", "date", None, None, merge=True) is None
+
+
+def test_conflict_deleted_row(stored_row):
+    stored_row(None)
+    result = sync._conflict(None, "day_log", "date", None, 7, merge=False)
+    assert result["seq"] is None
+    assert result["current"] is None
+
+
+def test_feed_page():
+    rows = [SimpleNamespace(seq=s, type="dream", deleted=False, data={}) for s in (3, 5, 8)]
+
+    page = sync._feed_page(rows, horizon=10, limit=2)
+    assert [c["seq"] for c in page["changes"]] == [3, 5]
+    assert page["next"] == 5
+    assert page["has_more"]
+
+    page = sync._feed_page(rows, horizon=10, limit=3)
+    assert page["next"] == 10
+    assert not page["has_more"]
+
+
+def test_horizon_ahead_of_server():
+    sync._check_horizon(10, 10)
+    with pytest.raises(HTTPException) as exc:
+        sync._check_horizon(11, 10)
+    assert exc.value.status_code == 410
+
+
+def test_horizon_is_head_when_nothing_is_running():
+    tracker = HorizonTracker()
+    assert tracker.advance(head=10, xmin=100, xmax=100) == 10
+
+
+def test_horizon_waits_for_transactions_in_flight():
+    tracker = HorizonTracker()
+    # Transactions 95..99 may still hold numbers up to 10.
+    assert tracker.advance(head=10, xmin=95, xmax=100) == 0
+    assert tracker.advance(head=12, xmin=97, xmax=101) == 0
+    # Everything below 100 has finished: 10 is safe, 12 still waits for 100.
+    assert tracker.advance(head=15, xmin=100, xmax=103) == 10
+    assert tracker.advance(head=15, xmin=103, xmax=104) == 15
+
+
+def test_horizon_starts_over_when_the_sequence_goes_back():
+    tracker = HorizonTracker()
+    assert tracker.advance(head=50, xmin=10, xmax=10) == 50
+    assert tracker.advance(head=20, xmin=12, xmax=14) == 0
+
+
+def _push(db, *ops):
+    return sync._apply_ops(db, SyncPush.model_validate({"ops": list(ops)}).ops, TODAY)
+
+
+def test_feed_returns_writes_and_tombstones_in_order(db):
+    _, since = sync_horizon(db)
+    event_id = uuid.uuid4()
+    put, created, deleted = _push(
+        db,
+        {"op": "put_day_log", "date": DAY.isoformat(), "hours": [2] * 24},
+        {"op": "create_event", "id": str(event_id), "date": DAY.isoformat(), "title": "Trip"},
+        {"op": "delete_event", "id": str(event_id)},
+    )
+
+    rows = change_feed(db, since, last_change_seq(db), 10)
+
+    # The event row is gone; only its tombstone is left in the feed.
+    assert [(row.seq, row.type, row.deleted) for row in rows] == [
+        (put["seq"], "day_log", False),
+        (deleted["seq"], "notable_event", True),
+    ]
+    assert created["seq"] < deleted["seq"]
+    assert rows[0].data["hours"] == [2] * 24
+    assert "change_seq" not in rows[0].data
+    assert rows[1].data == {"id": str(event_id), "date": DAY.isoformat()}
+
+
+def test_push_conflicts_on_a_stale_base_seq(db):
+    (created,) = _push(db, {"op": "put_day_log", "date": DAY.isoformat(), "hours": [0] * 24})
+    assert created["status"] == "applied"
+
+    put = {"op": "put_day_log", "date": DAY.isoformat(), "base_seq": created["seq"]}
+    applied, conflict, merged = _push(
+        db,
+        {**put, "hours": [1] * 24},
+        {**put, "hours": [2] * 24},
+        {"op": "patch_day_log", "date": DAY.isoformat(), "hours": {"0": 3}},
+    )
+
+    assert applied["status"] == "applied"
+    assert conflict["status"] == "conflict"
+    assert conflict["seq"] == applied["seq"]
+    assert conflict["current"]["hours"] == [1] * 24
+    assert merged["status"] == "applied"
+    assert merged["seq"] > applied["seq"]
+    rows = change_feed(db, created["seq"], merged["seq"], 10)
+    assert [row.seq for row in rows] == [merged["seq"]]
+    assert rows[0].data["hours"] == [3] + [1] * 23
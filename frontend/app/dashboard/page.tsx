@@ -1,13 +1,13 @@
 "use client";
 
 import Link from "next/link";
-import { useEffect, useMemo, useState } from "react";
+import { useEffect, useMemo, useRef, useState } from "react";
 
 import CategoryDonut from "../../components/CategoryDonut";
 import Header from "../../components/Header";
 import InsightCards from "../../components/InsightCards";
 import WeeklyGrid from "../../components/WeeklyGrid";
-import { fetchWeeklyDashboard } from "../../lib/api";
+import { fetchWeeklyDashboard, subscribeToChanges } from "../../lib/api";
 import { CATEGORIES } from "../../lib/categories";
 import type { WeeklyDashboardResponse } from "../../types/dashboard";
 
@@ -44,6 +44,35 @@ export default function DashboardPage() {
     load();
   }, []);
 
+  // Live updates: refresh (without the loading state) when another device
+  // writes a log or dream inside the displayed week.
+  const shownRef = useRef<{ start: string; end: string } | null>(null);
+  useEffect(() => {
+    shownRef.current = data ? { start: data.start_date, end: data.end_date } : null;
+  }, [data]);
+
+  useEffect(() => {
+    const refresh = () => {
+      fetchWeeklyDashboard()
+        .then(setData)
+        .catch((e) => console.error(e));
+    };
+    return subscribeToChanges({
+      onChanges: (changes) => {
+        const shown = shownRef.current;
+        if (!shown) return;
+        const affected = changes.some(
+          (c) =>
+            (c.type === "day_log" || c.type === "dream") &&
+            c.date >= shown.start &&
+            c.date <= shown.end
+        );
+        if (affected) refresh();
+      },
+      onResync: refresh,
+    });
+  }, []);
+
   const avgSleepLabel = useMemo(() => {
     if (!data) return "";
     const n = data.logged_days;
@@ -8,10 +8,8 @@ import HourGrid from "../components/HourGrid";
 import MobileTimeline from "../components/MobileTimeline";
 import DailySummary from "../components/DailySummary";
 import {
-  fetchDayLog,
-  fetchDailySummary,
-  fetchDream,
-  saveDayLog,
+  fetchDayBundle,
+  patchDayLogHours,
   saveDailySummary,
   saveDream,
 } from "../lib/api";
@@ -33,7 +31,9 @@ export default function Home() {
   const [loading, setLoading] = useState(false);
   const [saving, setSaving] = useState(false);
   const [error, setError] = useState<string | null>(null);
-  const [hasUnsavedChanges, setHasUnsavedChanges] = useState(false);
+  // Hour indices edited since the last load/save (saved with a sparse PATCH)
+  const [dirtyHours, setDirtyHours] = useState<ReadonlySet<number>>(new Set());
+  const hasUnsavedChanges = dirtyHours.size > 0;
   const [isReconstructedFlag, setIsReconstructedFlag] = useState(false);
   const [highlight, setHighlight] = useState<string>("");
   const [reflection, setReflection] = useState<string>("");
@@ -70,7 +70,7 @@ export default function Home() {
       setError("Please pick a valid date.");
       setHours(DEFAULT_HOURS());
       setIsReconstructedFlag(false);
-      setHasUnsavedChanges(false);
+      setDirtyHours(new Set());
       return;
     }
 
@@ -78,11 +78,7 @@ export default function Home() {
     setError(null);
 
     try {
-      const [data, summary, dream] = await Promise.all([
-        fetchDayLog(dateString),
-        fetchDailySummary(dateString),
-        fetchDream(dateString),
-      ]);
+      const { day_log: data, summary, dream } = await fetchDayBundle(dateString);
 
       if (data === null) {
         // No log exists for this date - use defaults
@@ -110,7 +106,7 @@ export default function Home() {
         setDreamDescription(dream.description ?? "");
       }
 
-      setHasUnsavedChanges(false);
+      setDirtyHours(new Set());
       setHasUnsavedSummaryChanges(false);
       setHasUnsavedDreamChanges(false);
     } catch (err) {
@@ -148,7 +144,10 @@ export default function Home() {
 
     try {
       const ops: Promise<void>[] = [];
-      if (hasUnsavedChanges) ops.push(saveDayLog(selectedDateString, hours));
+      if (hasUnsavedChanges) {
+        const changed = Object.fromEntries([...dirtyHours].map((i) => [i, hours[i]]));
+        ops.push(patchDayLogHours(selectedDateString, changed));
+      }
       if (hasUnsavedSummaryChanges) {
         ops.push(saveDailySummary(selectedDateString, { highlight, reflection }));
       }
@@ -163,7 +162,7 @@ export default function Home() {
       }
       await Promise.all(ops);
 
-      setHasUnsavedChanges(false);
+      setDirtyHours(new Set());
       setHasUnsavedSummaryChanges(false);
       setHasUnsavedDreamChanges(false);
     } catch (err) {
@@ -190,7 +189,7 @@ export default function Home() {
       newHours[hourIndex] = current === UNASSIGNED ? 0 : (current + 1) % CATEGORY_COUNT;
       return newHours;
     });
-    setHasUnsavedChanges(true);
+    setDirtyHours((prev) => new Set(prev).add(hourIndex));
   };
 
   // Fetch data when date changes
@@ -6,6 +6,11 @@ import type {
 import type { DreamApiResponse, DreamUpsertPayload } from "../types/dream";
 import type { CreateNotableEventPayload, NotableEvent } from "../types/events";
 import type { WeeklyDashboardResponse } from "../types/dashboard";
+import type { DayBundleApiResponse } from "../types/dayBundle";
+import type { LiveChange } from "../types/live";
+import type { SearchResponse } from "../types/search";
+import type { SyncFeedResponse, SyncOp, SyncPushResponse } from "../types/sync";
+import { decodeYearGrid, type DecodedYearGrid } from "./grid";
 import { signalApiFailure, signalApiSuccess } from "./pwaClient";
 
 const API_BASE = process.env.NEXT_PUBLIC_API_BASE;
@@ -38,6 +43,28 @@ export async function fetchDayLog(dateString: string): Promise<DayLogApiResponse
   return response.json();
 }
 
+export async function fetchDayBundle(dateString: string): Promise<DayBundleApiResponse> {
+  const response = await request(
+    `${API_BASE}/day/${dateString}`,
+    undefined,
+    "Failed to fetch day"
+  );
+  return response.json();
+}
+
+export async function fetchDayBundles(
+  startDate: string,
+  endDate: string
+): Promise<DayBundleApiResponse[]> {
+  const qs = new URLSearchParams({ start: startDate, end: endDate });
+  const response = await request(
+    `${API_BASE}/day?${qs.toString()}`,
+    undefined,
+    "Failed to fetch days"
+  );
+  return response.json();
+}
+
 export async function saveDayLog(dateString: string, hours: number[]): Promise<void> {
   await request(
     `${API_BASE}/day-log/${dateString}`,
@@ -50,6 +77,34 @@ export async function saveDayLog(dateString: string, hours: number[]): Promise<v
   );
 }
 
+/**
+ * Send only the changed hours (`{hourIndex: category}`); the server applies
+ * them in place and creates an all-unassigned log first if none exists.
+ */
+export async function patchDayLogHours(
+  dateString: string,
+  hours: Record<number, number>
+): Promise<void> {
+  await request(
+    `${API_BASE}/day-log/${dateString}`,
+    {
+      method: "PATCH",
+      headers: { "Content-Type": "application/json" },
+      body: JSON.stringify({ hours }),
+    },
+    "Failed to save"
+  );
+}
+
+export async function fetchYearGrid(year: number): Promise<DecodedYearGrid> {
+  const response = await request(
+    `${API_BASE}/day-log/grid?year=${year}`,
+    undefined,
+    "Failed to fetch year grid"
+  );
+  return decodeYearGrid(await response.arrayBuffer());
+}
+
 export async function fetchDailySummary(
   dateString: string
 ): Promise<DailySummaryApiResponse> {
@@ -118,6 +173,28 @@ export async function fetchEvents(params?: {
   return response.json();
 }
 
+export async function fetchEventsPage(params: {
+  startDate?: string;
+  endDate?: string;
+  limit: number;
+  after?: string | null;
+}): Promise<{ events: NotableEvent[]; nextCursor: string | null }> {
+  const qs = new URLSearchParams({ limit: String(params.limit) });
+  if (params.startDate) qs.set("start_date", params.startDate);
+  if (params.endDate) qs.set("end_date", params.endDate);
+  if (params.after) qs.set("after", params.after);
+
+  const response = await request(
+    `${API_BASE}/events?${qs.toString()}`,
+    undefined,
+    "Failed to fetch events"
+  );
+  return {
+    events: await response.json(),
+    nextCursor: response.headers.get("X-Next-Cursor"),
+  };
+}
+
 export async function createEvent(payload: CreateNotableEventPayload): Promise<NotableEvent> {
   const response = await request(
     `${API_BASE}/events`,
@@ -154,3 +231,71 @@ export async function fetchWeeklyDashboard(): Promise<WeeklyDashboardResponse> {
   return response.json();
 }
 
+
+export async function searchEntries(params: {
+  q: string;
+  startDate?: string;
+  endDate?: string;
+  category?: number;
+  limit?: number;
+}): Promise<SearchResponse> {
+  const qs = new URLSearchParams({ q: params.q });
+  if (params.startDate) qs.set("start", params.startDate);
+  if (params.endDate) qs.set("end", params.endDate);
+  if (params.category !== undefined) qs.set("category", String(params.category));
+  if (params.limit !== undefined) qs.set("limit", String(params.limit));
+
+  const response = await request(
+    `${API_BASE}/search?${qs.toString()}`,
+    undefined,
+    "Failed to search"
+  );
+  return response.json();
+}
+
+/** One page of changes after the `since` token (start at 0, then pass `next`). */
+export async function fetchChanges(since: number, limit?: number): Promise<SyncFeedResponse> {
+  const qs = new URLSearchParams({ since: String(since) });
+  if (limit !== undefined) qs.set("limit", String(limit));
+
+  const response = await request(
+    `${API_BASE}/sync?${qs.toString()}`,
+    undefined,
+    "Failed to fetch changes"
+  );
+  return response.json();
+}
+
+/** Replay queued offline writes; every op gets an applied / conflict / rejected result. */
+export async function pushSyncOps(ops: SyncOp[]): Promise<SyncPushResponse> {
+  const response = await request(
+    `${API_BASE}/sync`,
+    {
+      method: "POST",
+      headers: { "Content-Type": "application/json" },
+      body: JSON.stringify({ ops }),
+    },
+    "Failed to push changes"
+  );
+  return response.json();
+}
+
+/**
+ * Listen for changes committed by any client (server-sent events). `onResync`
+ * fires when notifications may have been missed (refetch everything shown).
+ * Returns a function that closes the stream.
+ */
+export function subscribeToChanges(handlers: {
+  onChanges: (changes: LiveChange[]) => void;
+  onResync?: () => void;
+}): () => void {
+  const source = new EventSource(`${API_BASE}/live`);
+  source.addEventListener("change", (event) => {
+    const { changes } = JSON.parse((event as MessageEvent<string>).data) as {
+      changes: LiveChange[];
+    };
+    handlers.onChanges(changes);
+  });
+  source.addEventListener("resync", () => handlers.onResync?.());
+  return () => source.close();
+}
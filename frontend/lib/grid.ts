@@ -0,0 +1,61 @@
+import { UNASSIGNED } from "./categories";
+
+/**
+ * Decoder for the packed year grid served by `GET /day-log/grid?year=`.
+ *
+ * Layout (little endian): "LGRD", version u8, start year u16, month u8, day u8,
+ * day count u16, then 12 bytes per day — one 4-bit code per hour, the even
+ * hour in the high nibble. Codes 0-11 are categories, 0xE is an unassigned
+ * hour and 0xF marks every hour of a day without a log.
+ */
+const GRID_MAGIC = "LGRD";
+const GRID_VERSION = 1;
+const GRID_HEADER_SIZE = 11;
+const GRID_UNASSIGNED = 0xe;
+const GRID_MISSING = 0xf;
+const BYTES_PER_DAY = 12;
+
+export type DecodedYearGrid = {
+  startDate: string; // YYYY-MM-DD
+  /** One entry per day: 24 category codes (-1 = unassigned), or null if no log. */
+  days: (number[] | null)[];
+};
+
+export function decodeYearGrid(buffer: ArrayBuffer): DecodedYearGrid {
+  const view = new DataView(buffer);
+  const magic = String.fromCharCode(
+    view.getUint8(0),
+    view.getUint8(1),
+    view.getUint8(2),
+    view.getUint8(3)
+  );
+  if (magic !== GRID_MAGIC || view.getUint8(4) !== GRID_VERSION) {
+    throw new Error("Unsupported grid format");
+  }
+
+  const year = view.getUint16(5, true);
+  const month = view.getUint8(7);
+  const day = view.getUint8(8);
+  const dayCount = view.getUint16(9, true);
+  const startDate = `${String(year).padStart(4, "0")}-${String(month).padStart(2, "0")}-${String(day).padStart(2, "0")}`;
+
+  const bytes = new Uint8Array(buffer, GRID_HEADER_SIZE);
+  const days: (number[] | null)[] = [];
+  for (let d = 0; d < dayCount; d++) {
+    const offset = d * BYTES_PER_DAY;
+    if (bytes[offset] >> 4 === GRID_MISSING) {
+      days.push(null);
+      continue;
+    }
+    const hours: number[] = [];
+    for (let i = 0; i < BYTES_PER_DAY; i++) {
+      const byte = bytes[offset + i];
+      for (const code of [byte >> 4, byte & 0xf]) {
+        hours.push(code === GRID_UNASSIGNED ? UNASSIGNED : code);
+      }
+    }
+    days.push(hours);
+  }
+
+  return { startDate, days };
+}
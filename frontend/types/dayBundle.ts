@@ -0,0 +1,12 @@
+import type { DailySummaryApiResponse } from "./dailySummary";
+import type { DayLogApiResponse } from "./dayLog";
+import type { DreamApiResponse } from "./dream";
+import type { NotableEvent } from "./events";
+
+export type DayBundleApiResponse = {
+  date: string; // YYYY-MM-DD
+  day_log: DayLogApiResponse;
+  summary: DailySummaryApiResponse;
+  dream: DreamApiResponse;
+  events: NotableEvent[];
+};
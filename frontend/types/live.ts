@@ -0,0 +1,6 @@
+import type { SyncEntityType } from "./sync";
+
+export type LiveChange = {
+  type: SyncEntityType;
+  date: string; // YYYY-MM-DD
+};
@@ -0,0 +1,15 @@
+export type SearchResultType = "daily_summary" | "dream" | "notable_event";
+
+export type SearchResult = {
+  type: SearchResultType;
+  id: string;
+  date: string; // YYYY-MM-DD
+  title: string | null;
+  snippet: string; // matched terms wrapped in <b>...</b>
+  rank: number;
+};
+
+export type SearchResponse = {
+  query: string;
+  results: SearchResult[];
+};
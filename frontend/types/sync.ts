@@ -0,0 +1,61 @@
+export type SyncEntityType = "day_log" | "daily_summary" | "dream" | "notable_event";
+
+export type SyncChange = {
+  seq: number;
+  type: SyncEntityType;
+  deleted: boolean;
+  // Row as stored (all columns), or `{ id, date }` for a deletion.
+  data: Record<string, unknown>;
+};
+
+export type SyncFeedResponse = {
+  changes: SyncChange[];
+  next: number; // `since` token for the next request
+  has_more: boolean;
+};
+
+// `base_seq`: the row's `seq` as last synced (omit/null if never seen).
+export type SyncOp =
+  | { op: "put_day_log"; date: string; hours: number[]; base_seq?: number | null }
+  | {
+      op: "patch_day_log";
+      date: string;
+      hours?: Record<number, number>;
+      ranges?: { start: number; end: number; category: number }[];
+      base_seq?: number | null;
+    }
+  | {
+      op: "put_daily_summary";
+      date: string;
+      highlight?: string | null;
+      reflection?: string | null;
+      base_seq?: number | null;
+    }
+  | {
+      op: "put_dream";
+      date: string;
+      dream_state: number;
+      description?: string | null;
+      base_seq?: number | null;
+    }
+  | {
+      op: "create_event";
+      id: string; // client-generated UUID
+      date: string;
+      title: string;
+      description?: string | null;
+      category?: number | null;
+    }
+  | { op: "delete_event"; id: string };
+
+export type SyncOpResult = {
+  index: number;
+  status: "applied" | "conflict" | "rejected";
+  detail: string | null;
+  seq: number | null;
+  current: Record<string, unknown> | null;
+};
+
+export type SyncPushResponse = {
+  results: SyncOpResult[];
+};